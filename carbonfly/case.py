@@ -14,17 +14,31 @@ from __future__ import annotations
 # carbonfly/case.py
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+import json
 import math
+import os
+import shutil
+import time
 from typing import Iterable, Dict, List, Tuple, Optional
 
-from .mesh import brep_to_mesh, write_multi_solid_ascii_stl
+from .mesh import (
+    brep_to_mesh,
+    write_multi_solid_ascii_stl,
+    write_multi_solid_binary_stl,
+    binary_stl_region_name,
+)
+from .mesh_cache import MeshCache
 from .field_writer import write_0_field
 from .snappy_writer import write_snappy_geometry, write_surface_features_dict
 from .blockmesh_writer import write_blockmesh_dict
 from .constant_writer import write_constant_files, write_residuals_file
 from .fv_writer import copy_fv_templates_to_case
 from .boundary import Boundary
-from .utils import unit_scale_to_m
+from .control_dict import merge_control_dict, write_control_dict
+from .polymesh import read_boundary
+from .utils import unit_scale_to_m, file_digest
 
 # import CFGeo for type hints only (avoids circular imports at runtime)
 try:
@@ -123,6 +137,150 @@ def _write_paraview_marker(case_root: Path, filename: str = None) -> Path:
     return p
 
 
+# Meshing inputs: a change here requires blockMesh/surfaceFeatures/snappyHexMesh to be re-run
+_GEOMETRY_OUTPUTS = (
+    Path("system") / "blockMeshDict",
+    Path("system") / "surfaceFeaturesDict",
+    Path("system") / "snappyHexMeshDict",
+)
+
+# Case files owned by build_case: in incremental mode, the ones an earlier build
+# wrote (recorded in the build record) but this build no longer produces are removed
+_MANAGED_GLOBS = ("0/*", "constant/triSurface/*.stl")
+
+
+def _build_record_path(case_root: Path) -> Path:
+    return case_root / ".carbonfly" / "build_files.json"
+
+
+def _load_build_record(case_root: Path) -> set:
+    """Return the case files written by the previous incremental build (relative paths)."""
+    try:
+        data = json.loads(_build_record_path(case_root).read_text(encoding="utf-8"))
+        return {Path(f) for f in data.get("files", [])}
+    except (OSError, ValueError, AttributeError, TypeError):
+        return set()
+
+
+def _save_build_record(case_root: Path, files: Iterable[Path]) -> None:
+    p = _build_record_path(case_root)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps({"files": sorted(f.as_posix() for f in files)}, indent=2), encoding="utf-8"
+    )
+    tmp.replace(p)
+
+
+@dataclass
+class BuildManifest:
+    """
+    Files written by an incremental `build_case` run.
+
+    Attributes:
+        changed (List[Path]): Files that were created or whose content changed
+            (relative to the case root).
+        unchanged (List[Path]): Files whose rendered content was identical to the
+            existing file; these were not touched (mtime preserved).
+        removed (List[Path]): Stale outputs of earlier incremental builds that this build
+            no longer produces (e.g. the field of a removed boundary or a renamed STL); these
+            were deleted.
+    """
+
+    changed: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+
+    @property
+    def geometry_changed(self) -> bool:
+        """True if any meshing input (STL, blockMesh/surfaceFeatures/snappy dicts) changed."""
+        return any(
+            p in _GEOMETRY_OUTPUTS or p.parts[:2] == ("constant", "triSurface")
+            for p in self.changed + self.removed
+        )
+
+    @property
+    def fields_changed(self) -> bool:
+        """True if any `0/` field file changed or was removed."""
+        return any(p.parts[:1] == ("0",) for p in self.changed + self.removed)
+
+
+def _sync_staged_files(staging: Path, case_root: Path) -> BuildManifest:
+    """
+    Move staged files into the case, skipping files whose content is unchanged.
+
+    The staged files are recorded in `<case_root>/.carbonfly/build_files.json`.
+    Files matching `_MANAGED_GLOBS` that the previous record lists but that are not
+    in the staging tree are stale outputs of an earlier build and are deleted. Files
+    the build never wrote (e.g. a field added by hand) are kept. Removal is only done
+    in folders the staging tree writes to, so e.g. `0/` is left alone if no field was
+    staged.
+
+    Args:
+        staging (Path): Staging root mirroring the case layout.
+        case_root (Path): Case root directory.
+
+    Returns:
+        BuildManifest: Changed / unchanged / removed files relative to the case root.
+    """
+    manifest = BuildManifest()
+    staged = sorted(p.relative_to(staging) for p in staging.rglob("*") if p.is_file())
+    for rel in staged:
+        src = staging / rel
+        dst = case_root / rel
+        if (
+            dst.is_file()
+            and dst.stat().st_size == src.stat().st_size
+            and file_digest(dst) == file_digest(src)
+        ):
+            manifest.unchanged.append(rel)
+            continue
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(src, dst)
+        manifest.changed.append(rel)
+    shutil.rmtree(staging, ignore_errors=True)
+
+    staged_set = set(staged)
+    written = _load_build_record(case_root)
+    staged_folders = {rel.parent for rel in staged}
+    for rel in sorted(written - staged_set):
+        if rel.parent not in staged_folders or not any(
+            rel.match(pattern) for pattern in _MANAGED_GLOBS
+        ):
+            continue
+        written.discard(rel)
+        p = case_root / rel
+        if p.is_file():
+            p.unlink()
+            manifest.removed.append(rel)
+    # keep earlier entries not removed this time (e.g. the STL of a `write_stl=False` build)
+    kept = {rel for rel in written if (case_root / rel).is_file()}
+    _save_build_record(case_root, kept | staged_set)
+    return manifest
+
+
+def _mesh_region(g, mesh_cache: Optional[MeshCache]):
+    """
+    Mesh one CFGeo Brep and time it.
+
+    Args:
+        g (CFGeo): Region to mesh.
+        mesh_cache (MeshCache | None): Optional meshing cache.
+
+    Returns:
+        Tuple[Rhino.Geometry.Mesh | None, float]: (mesh, seconds).
+    """
+    t0 = time.perf_counter()
+    # Mesh the Brep (or reuse the cached mesh of identical geometry)
+    m = mesh_cache.mesh_brep(g.brep) if mesh_cache is not None else brep_to_mesh(g.brep)
+    return m, time.perf_counter() - t0
+
+
+def _list_files(folder: Path) -> set:
+    """Return the set of files directly inside `folder` (empty if missing)."""
+    return {p for p in folder.iterdir() if p.is_file()} if folder.is_dir() else set()
+
+
 # orchestrator
 def build_case(
     case_root: Path,
@@ -151,12 +309,19 @@ def build_case(
     fvSchemes_path: Optional[Path] = None,
     fvSolution_path: Optional[Path] = None,
     write_residuals: bool = True,
+    *,
+    stl_format: str = "ascii",
+    vectorized: bool = False,
+    mesh_cache: Optional[MeshCache] = None,
+    mesh_workers: Optional[int] = None,
+    write_stl: bool = True,
+    incremental: bool = False,
 ):
     """
     Build an OpenFOAM case folder structure and write key dictionaries/fields.
 
     Steps:
-        1) Mesh each CFGeo.brep and export a multi-solid ASCII STL.
+        1) Mesh each CFGeo.brep and export a multi-solid ASCII (or binary) STL.
         2) Optionally write `system/blockMeshDict`.
         3) Optionally write `system/surfaceFeaturesDict` and `system/snappyHexMeshDict`.
         4) Optionally write `constant/` dictionaries and FV templates.
@@ -191,6 +356,23 @@ def build_case(
         fvSchemes_path (Path, optional): Optional fvSchemes template path.
         fvSolution_path (Path, optional): Optional fvSolution template path.
         write_residuals (bool): If True, write `system/residuals`.
+        stl_format (str): STL encoding, "ascii" (default) or "binary". Binary STL is much
+            smaller and faster to write; regions are stored in the facet attribute.
+        vectorized (bool): If True, extract STL triangles with NumPy array math
+            (see `carbonfly.mesh.mesh_triangle_arrays`). Requires NumPy.
+        mesh_cache (MeshCache, optional): Meshing cache reused across calls. Breps whose
+            geometry hash is already cached are not re-meshed (see `carbonfly.mesh_cache`).
+        mesh_workers (int, optional): Number of threads used to mesh regions concurrently.
+            None or 1 meshes serially. STL solid order always follows `cfgeos`, and per-region
+            meshing times are returned in `paths["mesh_timings"]` as (name, seconds) pairs.
+        write_stl (bool): If True, mesh all CFGeo breps and write the STL. If False, no meshing
+            is done (e.g. when the STL is shared with another case) and `paths["stl"]` is None.
+        incremental (bool): If True, render all outputs into a staging folder first and only
+            replace case files whose content changed. Unchanged files keep their mtime, and
+            stale `0/` fields and triSurface STL files written by an earlier incremental
+            build are removed (files added by hand are kept).
+            `paths["manifest"]` holds a `BuildManifest` telling whether meshing inputs
+            (`geometry_changed`) or only `0/` fields (`fields_changed`) changed.
 
     Returns:
         Tuple[List[str], Dict[str, Optional[Path]]]:
@@ -201,34 +383,77 @@ def build_case(
     cfgeos = list(cfgeos or [])
     if not cfgeos:
         raise ValueError("build_case: empty CFGeo list.")
+    stl_format = (stl_format or "ascii").strip().lower()
+    if stl_format not in ("ascii", "binary"):
+        raise ValueError("stl_format must be 'ascii'|'binary'")
 
     # 0) Ensure case folder structure exists only when we actually write
+    case_root = Path(case_root)
     ensure_case_dirs(case_root)
 
+    # In incremental mode, writers render into a staging folder that is synced at the end
+    out_root = case_root
+    if incremental:
+        out_root = case_root / ".carbonfly" / "staging"
+        shutil.rmtree(out_root, ignore_errors=True)
+        ensure_case_dirs(out_root)
+
     # 1) Mesh all geometries and collect region names + refine levels
     named_meshes: List[Tuple[str, "Rhino.Geometry.Mesh"]] = []
     regions: List[str] = []
     region_levels: Dict[str, Tuple[int, int]] = {}
 
-    for g in cfgeos:
-        # Mesh the Brep
-        m = brep_to_mesh(g.brep)
-        if m is None or m.Vertices.Count == 0 or m.Faces.Count == 0:
-            raise RuntimeError(f"Meshing failed for region '{getattr(g, 'name', '?')}'")
+    cache_hits = mesh_cache.hits if mesh_cache is not None else 0
+    t_mesh = time.perf_counter()
+    if not write_stl:
+        meshed = [(None, 0.0)] * len(cfgeos)
+    elif mesh_workers is not None and mesh_workers > 1:
+        with ThreadPoolExecutor(max_workers=int(mesh_workers)) as pool:
+            # map() keeps results in input order -> deterministic STL solid order
+            meshed = list(pool.map(lambda g: _mesh_region(g, mesh_cache), cfgeos))
+    else:
+        meshed = [_mesh_region(g, mesh_cache) for g in cfgeos]
+    t_mesh = time.perf_counter() - t_mesh
 
-        named_meshes.append((g.name, m))
+    mesh_timings: List[Tuple[str, float]] = []
+    for g, (m, dt) in zip(cfgeos, meshed):
+        if write_stl:
+            mesh_timings.append((g.name, dt))
+            if m is None or m.Vertices.Count == 0 or m.Faces.Count == 0:
+                raise RuntimeError(
+                    f"Meshing failed for region '{getattr(g, 'name', '?')}'"
+                )
+            named_meshes.append((g.name, m))
 
         # Collect region names (unique) and per-region refine levels
         if g.name not in regions:
             regions.append(g.name)
         region_levels[g.name] = (int(g.refine.min_level), int(g.refine.max_level))
 
+    logs: List[str] = []
+    paths = {"stl": None, "snappy": None, "mesh_timings": mesh_timings}
+
     # Export STL
-    stl_path = case_root / "constant" / "triSurface" / stl_file_name
-    write_multi_solid_ascii_stl(stl_path, named_meshes, unit)
+    if write_stl:
+        stl_path = out_root / "constant" / "triSurface" / stl_file_name
+        if stl_format == "binary":
+            write_multi_solid_binary_stl(stl_path, named_meshes, unit, vectorized=vectorized)
+        else:
+            write_multi_solid_ascii_stl(stl_path, named_meshes, unit, vectorized=vectorized)
 
-    logs = [f"carbonfly - STL written: {stl_path} (unit={unit} -> meters)"]
-    paths = {"stl": stl_path, "snappy": None}
+        logs.append(
+            f"carbonfly - STL written: {stl_path} ({stl_format}, unit={unit} -> meters)"
+        )
+        if mesh_cache is not None:
+            n_hit = mesh_cache.hits - cache_hits
+            logs.append(
+                f"carbonfly - mesh cache: {n_hit} of {len(cfgeos)} region(s) reused"
+            )
+        logs.append(
+            f"carbonfly - meshed {len(cfgeos)} region(s) in {t_mesh:.2f} s "
+            f"({int(mesh_workers or 1)} worker(s))"
+        )
+        paths["stl"] = stl_path
 
     # 2) OpenFOAM settings
     # 2a) blockMeshDict
@@ -243,7 +468,7 @@ def build_case(
         ymax += padding_m
         zmax += padding_m
         blockmesh_path = write_blockmesh_dict(
-            case_root,
+            out_root,
             min_xyz=(xmin, ymin, zmin),
             max_xyz=(xmax, ymax, zmax),
             cells=None,  # compute from cell_size
@@ -259,7 +484,7 @@ def build_case(
     if write_snappy:
         # i) Write system/surfaceFeaturesDict (for the `surfaceFeatures` utility)
         sfx_path = write_surface_features_dict(
-            case_root=case_root,
+            case_root=out_root,
             stl_file_name=stl_file_name,
             included_angle_deg=150.0,  # expose later if needed
         )
@@ -267,7 +492,7 @@ def build_case(
         paths["surfaceFeaturesDict"] = sfx_path
 
         # Tell the caller where the eMesh will appear after running `surfaceFeatures`
-        emesh_path = case_root / "constant" / "triSurface" / f"{stl_file_name}.eMesh"
+        emesh_path = out_root / "constant" / "triSurface" / f"{stl_file_name}.eMesh"
         paths["eMesh"] = emesh_path  # created by OpenFOAM, not by us
 
         # ii) Write system/snappyHexMeshDict (includes features -> <stl>.eMesh)
@@ -278,7 +503,7 @@ def build_case(
         feat_lvl = max(1, min(3, feat_lvl))
 
         snappy_path = write_snappy_geometry(
-            case_root,
+            out_root,
             stl_file_name,
             regions,
             region_levels,
@@ -287,19 +512,27 @@ def build_case(
             add_layers=False,
             feature_level=feat_lvl,
             inside_point=inside_point,
+            stl_region_names=(
+                [binary_stl_region_name(i) for i in range(len(regions))]
+                if stl_format == "binary"
+                else None
+            ),
         )
         paths["snappy"] = snappy_path
         logs.append(f"carbonfly - snappyHexMeshDict written: {snappy_path}")
 
-    # 2c) constant/ dicts
+    # 2c) constant/ dicts (never overwritten, so written to the case directly)
+    created: List[Path] = []
     if write_constant:
+        before = _list_files(case_root / "constant")
         write_constant_files(case_root)
+        created += sorted(_list_files(case_root / "constant") - before)
         logs.append(f"carbonfly - constant/ dicts written")
 
     # 2d) system/fvSolution & fvSchemes
     if write_fv:
         fv_written = copy_fv_templates_to_case(
-            case_root,
+            out_root,
             fvSchemes_src=fvSchemes_path,
             fvSolution_src=fvSolution_path,
             overwrite=True,
@@ -310,7 +543,10 @@ def build_case(
 
     # 2e) system/residuals
     if write_residuals:
+        residuals_existed = (case_root / "system" / "residuals").exists()
         write_residuals_file(case_root)
+        if not residuals_existed:
+            created.append(case_root / "system" / "residuals")
         logs.append(f"carbonfly - system/residuals written")
 
     # 3) Aggregate patch field specs (U/T/CO2/p) and write 0/ files
@@ -403,7 +639,7 @@ def build_case(
     # Write 0/ fields (optionally infer internal when None to help stability)
     if need_U:
         paths["U"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="U",
             internal_value=internal_U,
             patch_specs={p: v["U"] for p, v in patch_specs.items()},
@@ -418,7 +654,7 @@ def build_case(
             else None
         )
         paths["T"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="T",
             internal_value=tval,
             patch_specs={p: v["T"] for p, v in patch_specs.items()},
@@ -434,7 +670,7 @@ def build_case(
             else None
         )
         paths["CO2"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="CO2",
             internal_value=cval,
             patch_specs={p: v["CO2"] for p, v in patch_specs.items()},
@@ -445,7 +681,7 @@ def build_case(
         # Air, based on CO2: Air + CO2 = 1
         airval = 1 - cval if cval is not None else None
         paths["air"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="air",
             internal_value=airval,
             patch_specs={p: v["air"] for p, v in patch_specs.items()},
@@ -460,7 +696,7 @@ def build_case(
             else None
         )
         paths["p"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="p",
             internal_value=pval,
             patch_specs={p: v["p"] for p, v in patch_specs.items()},
@@ -475,7 +711,7 @@ def build_case(
             else None
         )
         paths["p_rgh"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="p_rgh",
             internal_value=prghval,
             patch_specs={p: v["p_rgh"] for p, v in patch_specs.items()},
@@ -490,7 +726,7 @@ def build_case(
             else None
         )
         paths["alphat"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="alphat",
             internal_value=alphatval,
             patch_specs={p: v["alphat"] for p, v in patch_specs.items()},
@@ -505,7 +741,7 @@ def build_case(
             else None
         )
         paths["epsilon"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="epsilon",
             internal_value=epsilonval,
             patch_specs={p: v["epsilon"] for p, v in patch_specs.items()},
@@ -520,7 +756,7 @@ def build_case(
             else None
         )
         paths["k"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="k",
             internal_value=kval,
             patch_specs={p: v["k"] for p, v in patch_specs.items()},
@@ -535,7 +771,7 @@ def build_case(
             else None
         )
         paths["nut"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="nut",
             internal_value=nutval,
             patch_specs={p: v["nut"] for p, v in patch_specs.items()},
@@ -550,7 +786,7 @@ def build_case(
             else None
         )
         paths["G"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="G",
             internal_value=gval,
             patch_specs={p: v["G"] for p, v in patch_specs.items()},
@@ -565,7 +801,7 @@ def build_case(
             else None
         )
         paths["Ydefault"] = write_0_field(
-            case_root=case_root,
+            case_root=out_root,
             field_name="Ydefault",
             internal_value=ydval,
             patch_specs={p: v["Ydefault"] for p, v in patch_specs.items()},
@@ -573,6 +809,21 @@ def build_case(
         )
         logs.append(f"carbonfly - 0/Ydefault written: {paths['Ydefault']}")
 
+    # Incremental: replace only changed files and point paths back into the case
+    if incremental:
+        manifest = _sync_staged_files(out_root, case_root)
+        manifest.changed += [p.relative_to(case_root) for p in created]
+        for k, v in list(paths.items()):
+            if isinstance(v, Path) and out_root in v.parents:
+                paths[k] = case_root / v.relative_to(out_root)
+        paths["manifest"] = manifest
+        logs = [ln.replace(str(out_root), str(case_root)) for ln in logs]
+        logs.append(
+            f"carbonfly - incremental: {len(manifest.changed)} file(s) changed, "
+            f"{len(manifest.unchanged)} unchanged, {len(manifest.removed)} removed"
+            + (" (geometry changed)" if manifest.geometry_changed else "")
+        )
+
     # 4) Add <caseName>.foam
     foam_marker = _write_paraview_marker(case_root)
     paths["foam"] = foam_marker
@@ -581,3 +832,320 @@ def build_case(
     # Append any conflict warnings at the end
     logs += conflict_notes
     return logs, paths
+
+
+# build_case keyword arguments a sweep variant may override
+_INTERNAL_FIELD_KWARGS = (
+    "internal_U",
+    "internal_T",
+    "internal_CO2",
+    "internal_P",
+    "internal_P_rgh",
+    "internal_alphat",
+    "internal_epsilon",
+    "internal_k",
+    "internal_nut",
+    "internal_G",
+    "internal_Ydefault",
+)
+
+
+# Geometry outputs shared by all variants of a sweep (relative to the case root)
+def _shared_geometry_files(stl_file_name: str) -> List[Path]:
+    return [
+        Path("constant") / "triSurface" / stl_file_name,
+        Path("system") / "blockMeshDict",
+        Path("system") / "surfaceFeaturesDict",
+        Path("system") / "snappyHexMeshDict",
+    ]
+
+
+def _link_or_copy(src: Path, dst: Path, link: str = "hardlink") -> str:
+    """
+    Place `src` at `dst` as a hard link, falling back to a plain copy.
+
+    Args:
+        src (Path): Existing source file.
+        dst (Path): Destination path (replaced if it exists).
+        link (str): "hardlink" or "copy".
+
+    Returns:
+        str: The method actually used ("hardlink" or "copy").
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    if link == "hardlink":
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass  # e.g. different drive or file system without hard links
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def _apply_boundaries(cfgeos: List["CFGeo"], boundaries: Dict[str, Boundary]) -> List["CFGeo"]:
+    """
+    Return CFGeo copies with boundaries replaced by region name.
+
+    Args:
+        cfgeos (List[CFGeo]): Base CFGeo objects (not modified).
+        boundaries (Dict[str, Boundary]): Region name -> replacement Boundary.
+
+    Returns:
+        List[CFGeo]: CFGeo list for the variant.
+
+    Raises:
+        ValueError: If a region name does not exist in `cfgeos`.
+    """
+    names = {g.name for g in cfgeos}
+    unknown = sorted(set(boundaries or {}) - names)
+    if unknown:
+        raise ValueError(f"Unknown region name(s) in variant boundaries: {unknown}")
+    out = []
+    for g in cfgeos:
+        b = (boundaries or {}).get(g.name)
+        if b is not None:
+            # bind region name like make_cfgeo, so patch names match the STL regions
+            g = replace(g, boundary=replace(b, region_name=g.name))
+        out.append(g)
+    return out
+
+
+def build_case_variants(
+    case_dir: Path,
+    cfgeos: Iterable["CFGeo"],
+    variants: Iterable[Dict],
+    control_dict: Optional[Dict] = None,
+    link: str = "hardlink",
+    stl_file_name: str = "model.stl",
+    **build_kwargs,
+):
+    """
+    Generate a batch of cases that share one geometry but differ in boundary
+    conditions, initial fields or controlDict settings.
+
+    The first variant is built with `build_case` (meshing + STL + meshing
+    dictionaries). All other variants skip meshing and get the shared geometry
+    files (STL, blockMeshDict, surfaceFeaturesDict, snappyHexMeshDict) as hard
+    links to the first case (copied if hard links are not supported), so only
+    their `0/` fields and `system/controlDict` are rendered.
+
+    Each variant is a dict with the keys:
+        - "name" (str, required): Case folder name under `case_dir`.
+        - "boundaries" (Dict[str, Boundary], optional): Region name -> Boundary that
+          replaces the CFGeo boundary of that region.
+        - "internal" (Dict[str, Any], optional): `build_case` internal field overrides,
+          e.g. {"internal_T": 296.15, "internal_U": (0, 0, 0)}.
+        - "control_dict" (Dict[str, Any], optional): controlDict entries merged over
+          `control_dict`.
+
+    Args:
+        case_dir (Path): Parent folder of all variant cases.
+        cfgeos (Iterable[CFGeo]): Base CFGeo objects shared by all variants.
+        variants (Iterable[Dict]): Variant specifications (see above).
+        control_dict (Dict, optional): Base controlDict config (e.g. from
+            `carbonfly.control_dict.make_default`). If neither this nor a variant
+            provides controlDict entries, no controlDict is written.
+        link (str): "hardlink" (default) or "copy" for the shared geometry files.
+        stl_file_name (str): Output STL file name under `constant/triSurface/`.
+        **build_kwargs: Further `build_case` keyword arguments shared by all variants
+            (e.g. unit, cell_size_m, inside_point, mesh_cache).
+
+    Returns:
+        Dict[str, Tuple[List[str], Dict[str, Optional[Path]]]]:
+            Variant name -> (logs, paths) as returned by `build_case`, in input order.
+
+    Raises:
+        ValueError: If variants are empty, names are missing/duplicated, or a variant
+            uses unknown keys, region names or internal field names.
+    """
+    link = (link or "hardlink").strip().lower()
+    if link not in ("hardlink", "copy"):
+        raise ValueError("link must be 'hardlink'|'copy'")
+    cfgeos = list(cfgeos or [])
+    variants = list(variants or [])
+    if not variants:
+        raise ValueError("build_case_variants: empty variant list.")
+
+    names = [str(v.get("name") or "").strip() for v in variants]
+    if not all(names):
+        raise ValueError("Every variant needs a non-empty 'name'.")
+    if len(set(names)) != len(names):
+        raise ValueError("Variant names must be unique.")
+    for v in variants:
+        extra = set(v) - {"name", "boundaries", "internal", "control_dict"}
+        if extra:
+            raise ValueError(f"Unknown variant key(s): {sorted(extra)}")
+        bad = set(v.get("internal") or {}) - set(_INTERNAL_FIELD_KWARGS)
+        if bad:
+            raise ValueError(f"Unknown internal field(s): {sorted(bad)}")
+
+    case_dir = Path(case_dir)
+    shared = _shared_geometry_files(stl_file_name)
+    results = {}
+    base_root: Optional[Path] = None
+
+    for name, v in zip(names, variants):
+        case_root = case_dir / name
+        var_geos = _apply_boundaries(cfgeos, v.get("boundaries") or {})
+        kwargs = dict(build_kwargs)
+        kwargs.update(v.get("internal") or {})
+
+        if base_root is None:
+            # first variant: full build, its geometry is shared with the others
+            logs, paths = build_case(case_root, var_geos, stl_file_name=stl_file_name, **kwargs)
+            base_root = case_root
+        else:
+            kwargs.update(write_stl=False, write_blockmesh=False, write_snappy=False)
+            logs, paths = build_case(case_root, var_geos, stl_file_name=stl_file_name, **kwargs)
+            used = set()
+            for rel in shared:
+                src = base_root / rel
+                if src.is_file():
+                    used.add(_link_or_copy(src, case_root / rel, link))
+            paths["stl"] = case_root / shared[0]
+            paths["blockMesh"] = case_root / shared[1]
+            paths["surfaceFeaturesDict"] = case_root / shared[2]
+            paths["snappy"] = case_root / shared[3]
+            logs.append(
+                f"carbonfly - shared geometry from {base_root.name} ({'/'.join(sorted(used))})"
+            )
+
+        if control_dict or v.get("control_dict"):
+            cfg = merge_control_dict(control_dict or {}, v.get("control_dict") or {})
+            paths["controlDict"] = write_control_dict(case_root, cfg)
+            logs.append(f"carbonfly - controlDict written: {paths['controlDict']}")
+
+        results[name] = (logs, paths)
+    return results
+
+
+def _link_polymesh(src: Path, dst: Path, link: str) -> str:
+    """
+    Make `dst` a symlink, hard-linked copy or plain copy of the polyMesh folder `src`.
+
+    Args:
+        src (Path): Source `constant/polyMesh` folder.
+        dst (Path): Destination `constant/polyMesh` folder (replaced if it exists).
+        link (str): "symlink", "hardlink" or "copy".
+
+    Returns:
+        str: The method actually used.
+    """
+    if dst.is_symlink() or dst.is_file():
+        dst.unlink()
+    elif dst.exists():
+        shutil.rmtree(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+
+    if link == "symlink":
+        try:
+            os.symlink(src.resolve(), dst, target_is_directory=True)
+            return "symlink"
+        except OSError:
+            link = "hardlink"  # e.g. Windows without symlink privilege
+    used = set()
+    for f in sorted(p for p in src.rglob("*") if p.is_file()):
+        used.add(_link_or_copy(f, dst / f.relative_to(src), link))
+    return "/".join(sorted(used)) or link
+
+
+def clone_meshed_case(
+    src_case: Path,
+    dst_case: Path,
+    cfgeos: Iterable["CFGeo"],
+    link: str = "symlink",
+    control_dict: Optional[Dict] = None,
+    **build_kwargs,
+):
+    """
+    Create a field-only variant of an already meshed case.
+
+    The `constant/polyMesh` of `src_case` (after blockMesh + snappyHexMesh) is
+    symlinked, hard-linked or copied into `dst_case`, so the new case can be run
+    without meshing again. `system/` is copied from the source case, then `0/`,
+    fvSchemes/fvSolution, residuals and (optionally) controlDict are regenerated
+    from `cfgeos` via `build_case`.
+
+    The patch names of `cfgeos` (Boundary.patch_name, else region name) must match
+    the non-empty patches listed in the mesh's `constant/polyMesh/boundary` file.
+
+    Notes:
+        With `link="symlink"` or `"hardlink"` the mesh is shared, so do not run
+        mesh-modifying utilities (e.g. refineMesh, moveMesh) in the clone.
+
+    Args:
+        src_case (Path): Meshed source case root.
+        dst_case (Path): New case root.
+        cfgeos (Iterable[CFGeo]): CFGeo objects with the new boundaries. Geometry is not meshed.
+        link (str): "symlink" (default), "hardlink" or "copy". Falls back to the next
+            option if the file system does not support it.
+        control_dict (Dict, optional): controlDict config to write. If None, the
+            source controlDict is kept.
+        **build_kwargs: Further `build_case` keyword arguments (e.g. internal_T, fvSchemes_path).
+
+    Returns:
+        Tuple[List[str], Dict[str, Optional[Path]]]: (logs, paths) as returned by
+            `build_case`, plus `paths["polyMesh"]`.
+
+    Raises:
+        FileNotFoundError: If the source case has no `constant/polyMesh/boundary`.
+        ValueError: If the case roots are identical, `link` is invalid, or patch names
+            do not match the mesh.
+    """
+    link = (link or "symlink").strip().lower()
+    if link not in ("symlink", "hardlink", "copy"):
+        raise ValueError("link must be 'symlink'|'hardlink'|'copy'")
+    src_case, dst_case = Path(src_case), Path(dst_case)
+    if src_case.resolve() == dst_case.resolve():
+        raise ValueError("dst_case must differ from src_case")
+    cfgeos = list(cfgeos or [])
+    if not cfgeos:
+        raise ValueError("clone_meshed_case: empty CFGeo list.")
+
+    src_mesh = src_case / "constant" / "polyMesh"
+    boundary_file = src_mesh / "boundary"
+    if not boundary_file.is_file():
+        raise FileNotFoundError(f"{boundary_file} not found. Please mesh the source case first.")
+
+    # Check patch names against the mesh before touching dst_case
+    mesh_patches = {
+        name
+        for name, e in read_boundary(boundary_file).items()
+        if int(e.get("nFaces", "0")) > 0
+    }
+    patches = {
+        getattr(g.boundary, "patch_name", None)
+        or getattr(g.boundary, "region_name", None)
+        or g.name
+        for g in cfgeos
+    }
+    missing = sorted(mesh_patches - patches)
+    unknown = sorted(patches - mesh_patches)
+    if missing or unknown:
+        raise ValueError(
+            "Patch names do not match the mesh boundary file: "
+            f"no Boundary for mesh patch(es) {missing}, not in mesh: {unknown}"
+        )
+
+    # system/ from the source case (meshing dicts, decomposeParDict, controlDict, ...)
+    ensure_case_dirs(dst_case)
+    if (src_case / "system").is_dir():
+        for f in (src_case / "system").iterdir():
+            if f.is_file():
+                # unlink first: never write through hard links shared with other cases
+                _link_or_copy(f, dst_case / "system" / f.name, "copy")
+
+    used = _link_polymesh(src_mesh, dst_case / "constant" / "polyMesh", link)
+
+    build_kwargs.update(write_stl=False, write_blockmesh=False, write_snappy=False)
+    logs, paths = build_case(dst_case, cfgeos, **build_kwargs)
+    paths["polyMesh"] = dst_case / "constant" / "polyMesh"
+    logs.append(f"carbonfly - polyMesh from {src_case} ({used})")
+
+    if control_dict:
+        paths["controlDict"] = write_control_dict(dst_case, control_dict)
+        logs.append(f"carbonfly - controlDict written: {paths['controlDict']}")
+    return logs, paths
@@ -67,7 +67,7 @@ TRANSIENT_DEFAULT: Dict[str, Any] = {
 
 
 # Helpers
-def _merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+def merge_control_dict(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     """Shallow-merge dict `b` into `a` (returns a new dict).
 
     Special-case:
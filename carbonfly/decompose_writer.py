@@ -0,0 +1,203 @@
+"""
+Writers for OpenFOAM domain decomposition settings.
+
+This module generates `system/decomposeParDict` for running meshing and
+solvers in parallel (`decomposePar` + `mpirun ... -parallel`). The number
+of subdomains can be given explicitly or derived from the machine's core
+count and an estimate of the cell count.
+"""
+
+from __future__ import annotations
+
+# carbonfly/decompose_writer.py
+import os
+import re
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .utils import foam_header
+
+_METHODS = ("scotch", "simple", "hierarchical")
+
+
+def _divisor_triples(n: int):
+    """Yield all (a, b, c) with a * b * c == n."""
+    for a in range(1, n + 1):
+        if n % a:
+            continue
+        m = n // a
+        for b in range(1, m + 1):
+            if m % b == 0:
+                yield a, b, m // b
+
+
+def split_subdomains(
+    n: int, extents: Optional[Tuple[float, float, float]] = None
+) -> Tuple[int, int, int]:
+    """
+    Split `n` subdomains into (nx, ny, nz) for the simple/hierarchical methods.
+
+    The split minimizes the total area of the internal cuts, so subdomains are
+    as close to cubes as possible.
+
+    Args:
+        n (int): Number of subdomains, must be >= 1.
+        extents (Tuple[float, float, float] | None): Domain size (or cell counts)
+            in x, y, z. If None, a unit cube is assumed.
+
+    Returns:
+        Tuple[int, int, int]: (nx, ny, nz) with nx * ny * nz == n.
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    Lx, Ly, Lz = extents or (1.0, 1.0, 1.0)
+
+    def cut_area(t):
+        nx, ny, nz = t
+        return (nx - 1) * Ly * Lz + (ny - 1) * Lx * Lz + (nz - 1) * Lx * Ly
+
+    return min(_divisor_triples(int(n)), key=cut_area)
+
+
+def _read_blockmesh_cells(case_root: Path) -> Optional[Tuple[int, int, int]]:
+    """Return (nx, ny, nz) of the first hex block in `system/blockMeshDict`, if any."""
+    p = Path(case_root) / "system" / "blockMeshDict"
+    if not p.is_file():
+        return None
+    m = re.search(r"hex\s*\([\d\s]+\)\s*\(\s*(\d+)\s+(\d+)\s+(\d+)\s*\)", p.read_text())
+    return tuple(int(v) for v in m.groups()) if m else None
+
+
+def estimate_cell_count(case_root: str | Path) -> Optional[int]:
+    """
+    Estimate the number of cells of a case.
+
+    Uses the `nCells` note of `constant/polyMesh/owner` if the case is meshed,
+    otherwise the background mesh size from `system/blockMeshDict` (a lower bound,
+    snappyHexMesh refinement adds cells).
+
+    Args:
+        case_root (str | Path): Case root directory.
+
+    Returns:
+        int | None: Estimated cell count, or None if nothing can be read.
+    """
+    owner = Path(case_root) / "constant" / "polyMesh" / "owner"
+    if owner.is_file():
+        with open(owner, "rb") as f:
+            head = f.read(4096).decode("ascii", errors="replace")
+        m = re.search(r"nCells:\s*(\d+)", head)
+        if m:
+            return int(m.group(1))
+    cells = _read_blockmesh_cells(case_root)
+    if cells:
+        nx, ny, nz = cells
+        return nx * ny * nz
+    return None
+
+
+def choose_n_subdomains(
+    n_cells: Optional[int] = None,
+    cells_per_subdomain: int = 50000,
+    max_subdomains: Optional[int] = None,
+) -> int:
+    """
+    Choose the number of subdomains from the core count and the cell count.
+
+    Args:
+        n_cells (int | None): Estimated cell count. If None, all cores are used.
+        cells_per_subdomain (int): Minimum cells per subdomain worth a core
+            (parallel efficiency drops for smaller subdomains).
+        max_subdomains (int | None): Upper limit, default is `os.cpu_count()`.
+
+    Returns:
+        int: Number of subdomains (>= 1).
+    """
+    n = max_subdomains or os.cpu_count() or 1
+    if n_cells is not None:
+        n = min(n, int(n_cells) // max(1, int(cells_per_subdomain)))
+    return max(1, int(n))
+
+
+def read_number_of_subdomains(case_root: str | Path) -> Optional[int]:
+    """
+    Read `numberOfSubdomains` from `system/decomposeParDict`.
+
+    Args:
+        case_root (str | Path): Case root directory.
+
+    Returns:
+        int | None: Number of subdomains, or None if the file/entry is missing.
+    """
+    p = Path(case_root) / "system" / "decomposeParDict"
+    if not p.is_file():
+        return None
+    m = re.search(r"^\s*numberOfSubdomains\s+(\d+)\s*;", p.read_text(), flags=re.M)
+    return int(m.group(1)) if m else None
+
+
+def write_decompose_par_dict(
+    case_root: Path,
+    n_subdomains: Optional[int] = None,
+    method: str = "scotch",
+    *,
+    n_cells: Optional[int] = None,
+    cells_per_subdomain: int = 50000,
+    split: Optional[Tuple[int, int, int]] = None,
+) -> Path:
+    """
+    Write `system/decomposeParDict`.
+
+    Args:
+        case_root (Path): Case root directory.
+        n_subdomains (int | None): Number of subdomains. If None, it is chosen with
+            `choose_n_subdomains` from the core count and `n_cells`.
+        method (str): "scotch" (default, no geometric input needed), "simple" or
+            "hierarchical".
+        n_cells (int | None): Estimated cell count. If None, `estimate_cell_count`
+            is used (only when `n_subdomains` is None).
+        cells_per_subdomain (int): See `choose_n_subdomains`.
+        split (Tuple[int, int, int] | None): Explicit (nx, ny, nz) for simple/hierarchical.
+            If None, derived with `split_subdomains` from the blockMesh cell counts.
+
+    Returns:
+        Path: Written `system/decomposeParDict` path.
+
+    Raises:
+        ValueError: If `method` is unknown or `split` does not match `n_subdomains`.
+    """
+    method = (method or "scotch").strip().lower()
+    if method not in _METHODS:
+        raise ValueError("method must be 'scotch'|'simple'|'hierarchical'")
+    case_root = Path(case_root)
+
+    if n_subdomains is None:
+        if n_cells is None:
+            n_cells = estimate_cell_count(case_root)
+        n_subdomains = choose_n_subdomains(n_cells, cells_per_subdomain)
+    n_subdomains = int(n_subdomains)
+    if n_subdomains < 1:
+        raise ValueError("n_subdomains must be >= 1")
+
+    lines = [foam_header("decomposeParDict", location="system")]
+    lines.append(f"numberOfSubdomains {n_subdomains};\n")
+    lines.append(f"method          {method};\n")
+
+    if method in ("simple", "hierarchical"):
+        if split is None:
+            split = split_subdomains(n_subdomains, _read_blockmesh_cells(case_root))
+        nx, ny, nz = map(int, split)
+        if nx * ny * nz != n_subdomains:
+            raise ValueError("split must multiply to n_subdomains")
+        lines.append(f"{method}Coeffs")
+        lines.append("{")
+        lines.append(f"    n           ({nx} {ny} {nz});")
+        if method == "hierarchical":
+            lines.append("    order       xyz;")
+        lines.append("}\n")
+
+    out = case_root / "system" / "decomposeParDict"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text("\n".join(lines), encoding="utf-8")
+
+    return out
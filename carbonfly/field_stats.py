@@ -0,0 +1,213 @@
+"""
+Volume-weighted field statistics over all time directories of a case.
+
+Statistics are computed in Python from the field files and the cell volumes
+of the mesh (`carbonfly.polymesh`), so no `volFieldValue` function objects
+have to be configured and no `postProcess` run is needed. The evaluation can
+be restricted to a zone: an axis-aligned box and/or a height band (e.g. the
+breathing zone). Time directories are processed on a thread pool.
+
+Examples:
+    # room-average CO2 (ppm) and share of the breathing zone above 1000 ppm
+    stats = field_statistics(case_root, "CO2", scale=1e6, threshold=1000,
+                             z_range=(0.6, 1.8), workers=4)
+    stats["mean"], stats["fraction_above"]
+"""
+
+from __future__ import annotations
+
+# carbonfly/field_stats.py
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .polymesh import load_cell_geometry
+from .postproc import list_time_dirs, read_foam_field
+
+Point = Tuple[float, float, float]
+
+
+def _require_numpy() -> None:
+    """Raise a clear error if NumPy is not available."""
+    if np is None:
+        raise RuntimeError("NumPy is required for field statistics.")
+
+
+def zone_mask(
+    centres: "np.ndarray",
+    box: Optional[Tuple[Point, Point]] = None,
+    z_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+) -> "np.ndarray":
+    """
+    Select the cells whose centre lies in a box and/or height band.
+
+    Args:
+        centres (numpy.ndarray): Cell centres, shape (nCells, 3).
+        box (Tuple[Point, Point] | None): ((xmin, ymin, zmin), (xmax, ymax, zmax)), inclusive.
+        z_range (Tuple[float | None, float | None] | None): Inclusive (z_min, z_max) band.
+            None (or a None bound) means unbounded.
+
+    Returns:
+        numpy.ndarray: Boolean mask, shape (nCells,).
+    """
+    _require_numpy()
+    mask = np.ones(len(centres), dtype=bool)
+    if box is not None:
+        lo, hi = np.asarray(box[0], dtype=float), np.asarray(box[1], dtype=float)
+        mask &= np.all((centres >= lo) & (centres <= hi), axis=1)
+    if z_range is not None:
+        z_min, z_max = z_range
+        if z_min is not None:
+            mask &= centres[:, 2] >= z_min
+        if z_max is not None:
+            mask &= centres[:, 2] <= z_max
+    return mask
+
+
+def weighted_percentiles(
+    values: "np.ndarray", weights: "np.ndarray", q: Sequence[float]
+) -> "np.ndarray":
+    """
+    Percentiles of `values` weighted by `weights` (e.g. cell volumes).
+
+    The p-th percentile is the smallest value below or at which p % of the
+    total weight lies.
+
+    Args:
+        values (numpy.ndarray): Values, shape (n,).
+        weights (numpy.ndarray): Non-negative weights, shape (n,).
+        q (Sequence[float]): Percentiles in [0, 100].
+
+    Returns:
+        numpy.ndarray: One value per percentile (NaN if `values` is empty).
+    """
+    _require_numpy()
+    q = np.asarray(q, dtype=float)
+    if len(values) == 0:
+        return np.full(q.shape, np.nan)
+    order = np.argsort(values, kind="stable")
+    cw = np.cumsum(weights[order])
+    idx = np.searchsorted(cw, q / 100.0 * cw[-1], side="left")
+    return values[order][np.minimum(idx, len(values) - 1)]
+
+
+def _field_values(path: Path, n_cells: int, component: Optional[int]) -> "np.ndarray":
+    values = read_foam_field(path).expand(n_cells)
+    if values.ndim == 2:
+        values = values[:, component] if component is not None else np.linalg.norm(values, axis=1)
+    return values
+
+
+def field_statistics(
+    case_root: str | Path,
+    field: str = "CO2",
+    *,
+    percentiles: Iterable[float] = (5, 50, 95),
+    threshold: Optional[float] = None,
+    scale: float = 1.0,
+    box: Optional[Tuple[Point, Point]] = None,
+    z_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+    time_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+    stride: int = 1,
+    component: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Compute volume-weighted statistics of a field for every time directory.
+
+    Args:
+        case_root (str | Path): OpenFOAM case root directory.
+        field (str): Field name, e.g. "CO2", "T" or "U".
+        percentiles (Iterable[float]): Volume-weighted percentiles to compute.
+        threshold (float | None): If given, also compute the volume fraction of the zone
+            with a (scaled) value above it.
+        scale (float): Factor applied to the field values before evaluation
+            (e.g. 1e6 to evaluate the CO2 field in ppm).
+        box (Tuple[Point, Point] | None): Restrict to cells with centre in this box.
+        z_range (Tuple[float | None, float | None] | None): Restrict to a height band.
+        time_range (Tuple[float | None, float | None] | None): Inclusive (t_min, t_max)
+            filter on the time directories.
+        stride (int): Use only every `stride`-th time directory (after filtering).
+        component (int | None): For vector fields: component index (0, 1, 2).
+            None evaluates the magnitude.
+        workers (int | None): Number of threads for reading/reducing time directories.
+            None or 1 processes them serially.
+
+    Returns:
+        Dict[str, Any]: {
+            "times": numpy.ndarray (T,),
+            "time_dirs": [time directory names],
+            "mean": numpy.ndarray (T,),
+            "min": numpy.ndarray (T,),
+            "max": numpy.ndarray (T,),
+            "percentiles": {p: numpy.ndarray (T,)},
+            "fraction_above": numpy.ndarray (T,) (only if `threshold` is given),
+            "volume": zone volume in m^3,
+            "n_cells": number of cells in the zone,
+        }
+
+    Raises:
+        FileNotFoundError: If no time directory contains the field.
+        ValueError: If the zone contains no cells or `stride` < 1.
+    """
+    _require_numpy()
+    if stride < 1:
+        raise ValueError("stride must be >= 1")
+    case_root = Path(case_root)
+
+    t_min, t_max = time_range or (None, None)
+    dirs = [
+        d
+        for d in list_time_dirs(case_root)
+        if (t_min is None or float(d.name) >= t_min)
+        and (t_max is None or float(d.name) <= t_max)
+        and ((d / field).is_file() or (d / f"{field}.gz").is_file())
+    ][::stride]
+    if not dirs:
+        raise FileNotFoundError(f"No time directory under {case_root} contains '{field}'")
+
+    geo = load_cell_geometry(case_root)
+    n_cells = len(geo["volumes"])
+    mask = zone_mask(geo["centres"], box, z_range)
+    if not mask.any():
+        raise ValueError("The selected zone contains no cell centres.")
+    vol = geo["volumes"][mask]
+    total = float(vol.sum())
+    q = list(percentiles)
+
+    def reduce(d: Path):
+        v = _field_values(d / field, n_cells, component)[mask] * scale
+        above = float(vol[v > threshold].sum()) / total if threshold is not None else None
+        return (
+            float(np.dot(vol, v)) / total,
+            float(v.min()),
+            float(v.max()),
+            weighted_percentiles(v, vol, q),
+            above,
+        )
+
+    if workers is not None and workers > 1:
+        with ThreadPoolExecutor(max_workers=int(workers)) as pool:
+            rows = list(pool.map(reduce, dirs))
+    else:
+        rows = [reduce(d) for d in dirs]
+
+    pct = np.array([r[3] for r in rows]).reshape(len(rows), len(q))
+    out: Dict[str, Any] = {
+        "times": np.array([float(d.name) for d in dirs]),
+        "time_dirs": [d.name for d in dirs],
+        "mean": np.array([r[0] for r in rows]),
+        "min": np.array([r[1] for r in rows]),
+        "max": np.array([r[2] for r in rows]),
+        "percentiles": {p: pct[:, i] for i, p in enumerate(q)},
+        "volume": total,
+        "n_cells": int(mask.sum()),
+    }
+    if threshold is not None:
+        out["fraction_above"] = np.array([r[4] for r in rows])
+    return out
@@ -13,7 +13,78 @@ from __future__ import annotations
 Indoor Air Quality (IAQ) evaluation based on international standards.
 """
 
-from typing import Union, List, Tuple, Dict, Any
+import csv
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Union, List, Tuple, Dict, Any, Optional, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _require_numpy() -> None:
+    """Raise a clear error if NumPy is not available."""
+    if np is None:
+        raise RuntimeError("NumPy is required for array-based IAQ evaluation.")
+
+
+@dataclass(frozen=True)
+class _CO2Standard:
+    """
+    Threshold table of a CO2-based IAQ standard.
+
+    Attributes:
+        source (str): Full name of the standard.
+        delta (bool): If True, thresholds apply to indoor - outdoor CO2, else to indoor CO2.
+        thresholds (Tuple[float, ...]): Upper limits of the categories 1..n-1 in ppm (ascending).
+        inclusive (Tuple[bool, ...]): Per threshold, whether the limit belongs to the
+            better category (`<=`) or not (`<`).
+        averaging (float | None): Averaging time of the standard in seconds
+            (None: instantaneous values).
+    """
+
+    source: str
+    delta: bool
+    thresholds: Tuple[float, ...]
+    inclusive: Tuple[bool, ...]
+    averaging: Optional[float] = None
+
+
+# same categories as the scalar helpers below
+_CO2_STANDARDS: Dict[str, _CO2Standard] = {
+    "EN": _CO2Standard(
+        "European standard CEN/EN 16798-1, based on german version DIN EN 16798-1:2019",
+        True,
+        (550, 800, 1350),
+        (True, True, True),
+    ),
+    "LEHB": _CO2Standard(
+        "Japanese law for environmental health in buildings (LEHB)", False, (1000,), (True,)
+    ),
+    "SS": _CO2Standard("Singapore standard SS 554:2016", True, (700,), (True,)),
+    "HK": _CO2Standard(
+        "Hong Kong Environmental Protection Department",
+        False,
+        (800, 1000),
+        (True, True),
+        averaging=8 * 3600.0,
+    ),
+    "UBA": _CO2Standard(
+        "German environmental protection agency", False, (1000, 2000), (False, True)
+    ),
+    "DOSH": _CO2Standard(
+        "Department of Occupational Safety and Health (DOSH) Malaysia", False, (1000,), (True,)
+    ),
+    "NBR": _CO2Standard(
+        "Brazilian standard ABNT NBR 16401-3:2008 and ABNT NBR 17037:2023",
+        True,
+        (700,),
+        (True,),
+    ),
+}
 
 
 def iaq_co2(
@@ -106,8 +177,13 @@ def iaq_co2(
             Evaluation based on CO2 concentration differences between indoors and outdoors.
                 - [Index = 1] Acceptable: delta(CO2) <= 700 ppm
                 - [Index = 2] Unacceptable: delta(CO2) > 700 ppm
+
+        For NumPy arrays and long sensor series use `iaq_co2_array`, which gives
+        identical indices without per-sample Python work. For timestamped series
+        evaluated on the standard's averaging time (HK: 8 hours) use
+        `iaq_co2_timeseries`.
     """
-    standards = ["EN", "LEHB", "SS", "HK", "UBA", "DOSH", "NBR"]
+    standards = list(_CO2_STANDARDS)
     if standard not in standards:
         raise ValueError(
             f"Error: Unknow standard for iaq_co2(). Supported standards are {standards}."
@@ -184,6 +260,756 @@ def iaq_co2(
     return report, indices
 
 
+def _co2_threshold_table(standard: str) -> "np.ndarray":
+    """
+    Return the thresholds of `standard` as an array for `numpy.searchsorted`.
+
+    A value v gets category `searchsorted(table, v, side="left") + 1`, i.e. the
+    first category whose limit satisfies v <= limit. Strict limits (`<`) are
+    moved to the next smaller float, so that v <= limit' is equivalent to v < limit.
+    """
+    std = _CO2_STANDARDS[standard]
+    th = np.asarray(std.thresholds, dtype=np.float64)
+    strict = ~np.asarray(std.inclusive, dtype=bool)
+    th[strict] = np.nextafter(th[strict], -np.inf)
+    return th
+
+
+def iaq_co2_array(
+    co2_indoor,
+    co2_outdoor=400,
+    standard: str = "EN",
+) -> "np.ndarray":
+    """
+    Array version of `iaq_co2` for NumPy arrays and long sensor series.
+
+    All samples are classified at once with `numpy.searchsorted` on the
+    threshold table of the standard. The indices are identical to those of
+    `iaq_co2` (including NaN samples, which fall into the worst category).
+
+    Args:
+        co2_indoor (array-like): Indoor CO2 concentration(s) in ppm. Any array-like or
+            buffer (NumPy array, list, `array.array`, scalar).
+        co2_outdoor (array-like): Outdoor CO2 concentration(s) in ppm, a scalar or an
+            array broadcastable to `co2_indoor`. Only used by delta-based standards.
+            Default is 400.
+        standard (str): Standard code, see `iaq_co2`.
+
+    Returns:
+        numpy.ndarray: IAQ indices (int8), same shape as `co2_indoor`.
+
+    Raises:
+        ValueError: If the standard is unknown or the outdoor values cannot be broadcast.
+    """
+    _require_numpy()
+    if standard not in _CO2_STANDARDS:
+        raise ValueError(
+            f"Error: Unknow standard for iaq_co2_array(). Supported standards are {list(_CO2_STANDARDS)}."
+        )
+    values = np.asarray(co2_indoor, dtype=np.float64)
+    if _CO2_STANDARDS[standard].delta:
+        outdoor = np.asarray(co2_outdoor, dtype=np.float64)
+        try:
+            values = values - outdoor
+        except ValueError:
+            raise ValueError(
+                "Error: co2_indoor and co2_outdoor have different length. "
+                "They have to be aligned if using dynamic outdoor CO2 concentration!"
+            )
+    idx = np.searchsorted(_co2_threshold_table(standard), values, side="left")
+    return (idx + 1).astype(np.int8)
+
+
+def _as_seconds(times) -> "np.ndarray":
+    """Convert timestamps (seconds, numpy.datetime64 or datetime objects) to float seconds."""
+    t = np.asarray(times)
+    if t.dtype == object:
+        t = t.astype("datetime64[ns]")
+    if np.issubdtype(t.dtype, np.datetime64):
+        # seconds since the epoch, so separately converted chunks line up
+        return (t - np.datetime64(0, "s")) / np.timedelta64(1, "s")
+    return t.astype(np.float64)
+
+
+def _sample_durations(
+    t: "np.ndarray", max_gap: Optional[float]
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Interval (t_{i-1}, t_i] represented by each sample, in seconds.
+
+    The first sample and samples after a gap longer than `max_gap` represent no
+    time. Returns (durations, gap mask).
+    """
+    d = np.diff(t, prepend=t[:1])
+    gap = d > max_gap if max_gap is not None else np.zeros(len(d), dtype=bool)
+    d[gap] = 0.0
+    return d, gap
+
+
+def rolling_time_mean(
+    times,
+    values,
+    window: float,
+    max_gap: Optional[float] = None,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Trailing time-weighted rolling mean of an irregularly sampled series.
+
+    Each sample is taken as the value of the interval since the previous sample
+    (a sensor reading represents the period before its timestamp). The mean at
+    sample i is the integral over [t_i - window, t_i] divided by the covered time
+    in that window. Intervals longer than `max_gap` and NaN samples count as
+    missing data. The computation is O(n): cumulative integrals plus one
+    `numpy.searchsorted` for the window starts.
+
+    Args:
+        times (array-like): Timestamps in seconds, or numpy.datetime64 / datetime values.
+            Must be non-decreasing.
+        values (array-like): Sample values, same length as `times`.
+        window (float): Window length in seconds.
+        max_gap (float | None): Longest interval between samples still treated as
+            measured, in seconds. None means no limit.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: (mean, coverage). `coverage` is the
+            measured fraction of each window (0..1); `mean` is NaN where nothing
+            was measured.
+
+    Raises:
+        ValueError: If the lengths differ, times decrease or `window` is not positive.
+    """
+    _require_numpy()
+    t = _as_seconds(times).reshape(-1)
+    v = np.asarray(values, dtype=np.float64).reshape(-1)
+    if len(t) != len(v):
+        raise ValueError("times and values must have the same length.")
+    if window <= 0:
+        raise ValueError("window must be > 0")
+    if len(t) and np.any(np.diff(t) < 0):
+        raise ValueError("times must be non-decreasing.")
+
+    d, _ = _sample_durations(t, max_gap)
+    missing = np.isnan(v)
+    d[missing] = 0.0
+    v = np.where(missing, 0.0, v)
+
+    # cumulative integral and covered time up to t_i
+    integral = np.cumsum(v * d)
+    covered = np.cumsum(d)
+
+    # value at the window start s = t_i - window: interval j holding s is the
+    # first with t_j >= s; remove the part of it after s
+    s = t - window
+    j = np.searchsorted(t, s, side="left")
+    after = np.minimum(d[j], t[j] - s)
+    integral_s = integral[j] - v[j] * after
+    covered_s = covered[j] - after
+
+    span = covered - covered_s
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(span > 0, (integral - integral_s) / span, np.nan)
+    return mean, np.clip(span / window, 0.0, 1.0)
+
+
+def iaq_co2_timeseries(
+    times,
+    co2_indoor,
+    co2_outdoor=400,
+    standard: str = "HK",
+    window: Optional[float] = None,
+    max_gap: Optional[float] = None,
+    min_coverage: float = 0.75,
+) -> Dict[str, Any]:
+    """
+    Time-averaged CO2-based IAQ evaluation of a timestamped series.
+
+    The (indoor or indoor - outdoor) CO2 series is averaged with a trailing
+    rolling window (`rolling_time_mean`) and each mean is classified like
+    `iaq_co2`. By default the averaging time of the standard is used, i.e.
+    8 hours for HK; standards without one are evaluated instantaneously
+    unless `window` is given (e.g. a 1-hour moving average for EN or UBA).
+
+    Args:
+        times (array-like): Timestamps in seconds, or numpy.datetime64 / datetime values.
+        co2_indoor (array-like): Indoor CO2 concentrations in ppm.
+        co2_outdoor (array-like): Outdoor CO2 in ppm, scalar or aligned with `co2_indoor`.
+            Default is 400.
+        standard (str): Standard code, see `iaq_co2`.
+        window (float | None): Averaging window in seconds. None uses the standard's
+            averaging time; 0 evaluates instantaneous values.
+        max_gap (float | None): Longest sampling interval still treated as measured,
+            in seconds. None means no limit.
+        min_coverage (float): Minimum measured fraction of a window (0..1). Samples
+            whose window is covered less get index 0.
+
+    Returns:
+        Dict[str, Any]: {
+            "indices": numpy.ndarray int8 (0 = insufficient coverage),
+            "mean": numpy.ndarray, averaged value that was classified (ppm),
+            "coverage": numpy.ndarray, measured fraction of each window,
+            "window": window length in seconds (0 for instantaneous),
+            "standard": full name of the standard,
+        }
+
+    Raises:
+        ValueError: If the standard is unknown or the inputs are inconsistent.
+    """
+    _require_numpy()
+    if standard not in _CO2_STANDARDS:
+        raise ValueError(
+            f"Error: Unknow standard for iaq_co2_timeseries(). Supported standards are {list(_CO2_STANDARDS)}."
+        )
+    std = _CO2_STANDARDS[standard]
+    window = std.averaging if window is None else window
+    values = np.asarray(co2_indoor, dtype=np.float64).reshape(-1)
+    if std.delta:
+        try:
+            values = values - np.asarray(co2_outdoor, dtype=np.float64)
+        except ValueError:
+            raise ValueError(
+                "Error: co2_indoor and co2_outdoor have different length. "
+                "They have to be aligned if using dynamic outdoor CO2 concentration!"
+            )
+
+    table = _co2_threshold_table(standard)
+    if not window:
+        mean = values
+        coverage = np.ones(len(values))
+        indices = (np.searchsorted(table, mean, side="left") + 1).astype(np.int8)
+    else:
+        mean, coverage = rolling_time_mean(times, values, window, max_gap)
+        indices = (np.searchsorted(table, mean, side="left") + 1).astype(np.int8)
+        indices[(coverage < min_coverage) | np.isnan(mean)] = 0
+
+    return {
+        "indices": indices,
+        "mean": mean,
+        "coverage": coverage,
+        "window": float(window or 0.0),
+        "standard": std.source,
+    }
+
+
+def _check_standards(standards: Optional[List[str]], func: str) -> List[str]:
+    """Return the standard codes to evaluate (all if None)."""
+    codes = list(_CO2_STANDARDS) if standards is None else list(standards)
+    unknown = [c for c in codes if c not in _CO2_STANDARDS]
+    if unknown:
+        raise ValueError(
+            f"Error: Unknow standard(s) {unknown} for {func}(). Supported standards are {list(_CO2_STANDARDS)}."
+        )
+    return codes
+
+
+def _merged_thresholds(codes: List[str]) -> Dict[str, "np.ndarray"]:
+    """Merged threshold tables per basis ("indoor"/"delta") of the given standards."""
+    merged = {}
+    for basis in ("indoor", "delta"):
+        group = [c for c in codes if _CO2_STANDARDS[c].delta == (basis == "delta")]
+        if group:
+            merged[basis] = np.unique(np.concatenate([_co2_threshold_table(c) for c in group]))
+    return merged
+
+
+def _run_durations(
+    mask: "np.ndarray", breaks: "np.ndarray", elapsed: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Find runs of consecutive True samples.
+
+    Runs also end before samples flagged in `breaks`. `elapsed` is the cumulative
+    sum of the sample durations (shared between calls).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: (start index, end index,
+            duration in seconds) of each run.
+    """
+    prev = np.concatenate([[False], mask[:-1]])
+    nxt = np.concatenate([mask[1:], [False]])
+    nxt_break = np.concatenate([breaks[1:], [False]])
+    starts = np.flatnonzero(mask & (~prev | breaks))
+    ends = np.flatnonzero(mask & (~nxt | nxt_break))
+    # elapsed[end] - elapsed[start - 1]: durations of the run's samples
+    before = np.where(starts > 0, elapsed[starts - 1], 0.0)
+    return starts, ends, elapsed[ends] - before
+
+
+def _standard_summary(
+    code: str,
+    merged: "np.ndarray",
+    bin_counts: "np.ndarray",
+    bin_seconds: "np.ndarray",
+    longest: "np.ndarray",
+) -> Dict[str, Any]:
+    """Aggregate the merged-bin totals of one basis into the report entry of one standard."""
+    std = _CO2_STANDARDS[code]
+    table = _co2_threshold_table(code)
+    # category of each merged bin: bin b holds values in (merged[b-1], merged[b]]
+    upper = np.concatenate([merged, [np.inf]])
+    category = np.searchsorted(table, upper, side="left")
+    counts = np.bincount(category, weights=bin_counts, minlength=len(table) + 1)
+    seconds = np.bincount(category, weights=bin_seconds, minlength=len(table) + 1)
+    total = seconds.sum()
+    positions = np.searchsorted(merged, table)
+    return {
+        "standard": std.source,
+        "basis": "delta" if std.delta else "indoor",
+        "counts": np.rint(counts).astype(np.int64),
+        "hours": seconds / 3600.0,
+        "fractions": seconds / total if total > 0 else np.zeros_like(seconds),
+        "hours_above": {
+            th: float(seconds[i + 1 :].sum()) / 3600.0 for i, th in enumerate(std.thresholds)
+        },
+        "longest_exceedance_hours": {
+            th: float(longest[k]) / 3600.0 for th, k in zip(std.thresholds, positions)
+        },
+    }
+
+
+def iaq_co2_report(
+    co2_indoor,
+    co2_outdoor=400,
+    times=None,
+    sample_interval: float = 3600.0,
+    max_gap: Optional[float] = None,
+    standards: Optional[List[str]] = None,
+    percentiles: Tuple[float, ...] = (50, 95, 99),
+) -> Dict[str, Any]:
+    """
+    Evaluate a CO2 series against all supported standards at once.
+
+    The thresholds of all standards are merged into one sorted table per basis
+    (indoor CO2 and indoor - outdoor CO2), so every sample is binned only once.
+    Category counts and hours per standard are then aggregated from the bin
+    totals. Exceedance statistics are computed once per distinct threshold.
+    Values are evaluated instantaneously; for the 8-hour HK average see
+    `iaq_co2_timeseries`.
+
+    Args:
+        co2_indoor (array-like): Indoor CO2 concentrations in ppm.
+        co2_outdoor (array-like): Outdoor CO2 in ppm, scalar or aligned with `co2_indoor`.
+            Default is 400.
+        times (array-like | None): Timestamps (seconds, numpy.datetime64 or datetime).
+            Each sample represents the interval since the previous one. If None, every
+            sample represents `sample_interval` seconds.
+        sample_interval (float): Seconds per sample if `times` is None. Default is
+            3600 (hourly values, e.g. from a building simulation).
+        max_gap (float | None): With `times`: longest interval still treated as measured,
+            in seconds. Longer gaps count as missing and end exceedance runs.
+        standards (List[str] | None): Standard codes to evaluate. Default is all.
+        percentiles (Tuple[float, ...]): Percentiles of indoor and delta CO2 (per sample).
+
+    Returns:
+        Dict[str, Any]: {
+            "n_samples": int, "n_missing": int (NaN samples, not counted below),
+            "hours": total evaluated hours,
+            "percentiles": {"co2_indoor": {p: ppm}, "delta_co2": {p: ppm}},
+            "standards": {
+                code: {
+                    "standard": full name,
+                    "basis": "indoor" or "delta",
+                    "counts": numpy.ndarray, samples per category (index 0 = category 1),
+                    "hours": numpy.ndarray, hours per category,
+                    "fractions": numpy.ndarray, time fraction per category,
+                    "hours_above": {threshold: hours in a worse category},
+                    "longest_exceedance_hours": {threshold: hours},
+                }
+            },
+        }
+
+    Raises:
+        ValueError: If a standard is unknown or the inputs are inconsistent.
+    """
+    _require_numpy()
+    codes = _check_standards(standards, "iaq_co2_report")
+
+    indoor = np.asarray(co2_indoor, dtype=np.float64).reshape(-1)
+    try:
+        delta = indoor - np.asarray(co2_outdoor, dtype=np.float64).reshape(-1)
+    except ValueError:
+        raise ValueError(
+            "Error: co2_indoor and co2_outdoor have different length. "
+            "They have to be aligned if using dynamic outdoor CO2 concentration!"
+        )
+    delta = np.broadcast_to(delta, indoor.shape)
+
+    if times is None:
+        durations = np.full(len(indoor), float(sample_interval))
+        breaks = np.zeros(len(indoor), dtype=bool)
+    else:
+        t = _as_seconds(times).reshape(-1)
+        if len(t) != len(indoor):
+            raise ValueError("times and co2_indoor must have the same length.")
+        durations, breaks = _sample_durations(t, max_gap)
+
+    out: Dict[str, Any] = {
+        "n_samples": int(len(indoor)),
+        "n_missing": 0,
+        "hours": 0.0,
+        "percentiles": {},
+        "standards": {},
+    }
+    missing = np.isnan(indoor) | np.isnan(delta)
+    out["n_missing"] = int(missing.sum())
+    ok = ~missing
+    out["hours"] = float(durations[ok].sum()) / 3600.0
+    elapsed = np.cumsum(np.where(ok, durations, 0.0))
+    for key, series in (("co2_indoor", indoor), ("delta_co2", delta)):
+        vals = series[ok]
+        pct = np.percentile(vals, percentiles) if len(vals) else np.full(len(percentiles), np.nan)
+        out["percentiles"][key] = {p: float(v) for p, v in zip(percentiles, pct)}
+
+    series = {"indoor": indoor, "delta": delta}
+    for basis, merged in _merged_thresholds(codes).items():
+        # one binning of the series against the merged thresholds of the basis
+        bins = np.searchsorted(merged, series[basis], side="left")
+        n_bins = len(merged) + 1
+        bin_counts = np.bincount(bins[ok], minlength=n_bins)
+        bin_seconds = np.bincount(bins[ok], weights=durations[ok], minlength=n_bins)
+
+        # exceedance runs once per merged threshold: value in a bin above it
+        longest = np.zeros(len(merged))
+        for k in range(len(merged)):
+            runs = _run_durations(ok & (bins > k), breaks, elapsed)[2]
+            longest[k] = runs.max() if len(runs) else 0.0
+
+        for c in codes:
+            if (basis == "delta") == _CO2_STANDARDS[c].delta:
+                out["standards"][c] = _standard_summary(
+                    c, merged, bin_counts, bin_seconds, longest
+                )
+    out["standards"] = {c: out["standards"][c] for c in codes}
+    return out
+
+
+class IAQStreamEvaluator:
+    """
+    Incremental version of `iaq_co2_report` for data that does not fit in memory.
+
+    Feed chunks of samples with `update` (or a chunk iterator with `consume`,
+    e.g. `iter_csv_chunks`); `result` returns the same aggregates as
+    `iaq_co2_report` over all samples seen so far. Only O(1) state is kept
+    between chunks: per merged-threshold bin totals, the open exceedance runs,
+    the last timestamp, a CO2 histogram for the percentiles and, for
+    time-averaged evaluation, the samples within the longest averaging window.
+
+    Percentiles are taken from the histogram and are exact to `resolution`.
+
+    Examples:
+        ev = IAQStreamEvaluator(max_gap=600)
+        ev.consume(iter_csv_chunks("sensors.csv", co2_column="CO2", time_column="time"))
+        report = ev.result()
+    """
+
+    def __init__(
+        self,
+        standards: Optional[List[str]] = None,
+        sample_interval: float = 3600.0,
+        max_gap: Optional[float] = None,
+        window: Optional[float] = None,
+        min_coverage: float = 0.75,
+        percentiles: Tuple[float, ...] = (50, 95, 99),
+        resolution: float = 1.0,
+        hist_range: Tuple[float, float] = (-5000.0, 50000.0),
+    ):
+        """
+        Args:
+            standards (List[str] | None): Standard codes to evaluate. Default is all.
+            sample_interval (float): Seconds per sample for chunks without timestamps.
+            max_gap (float | None): Longest interval between timestamps still treated
+                as measured, in seconds (see `iaq_co2_report`).
+            window (float | None): Averaging window in seconds for the time-averaged
+                evaluation (see `iaq_co2_timeseries`). None uses each standard's own
+                averaging time (HK: 8 hours) and skips standards without one.
+            min_coverage (float): Minimum measured fraction of an averaging window.
+            percentiles (Tuple[float, ...]): Percentiles of indoor and delta CO2.
+            resolution (float): Histogram bin width in ppm for the percentiles.
+            hist_range (Tuple[float, float]): Histogram range in ppm; values outside
+                are counted in the first/last bin.
+        """
+        _require_numpy()
+        self.codes = _check_standards(standards, "IAQStreamEvaluator")
+        self.sample_interval = float(sample_interval)
+        self.max_gap = max_gap
+        self.min_coverage = float(min_coverage)
+        self.percentiles = tuple(percentiles)
+        self.resolution = float(resolution)
+        self._hist_lo = float(hist_range[0])
+        n_hist = int(np.ceil((hist_range[1] - hist_range[0]) / self.resolution))
+        self._hist = {k: np.zeros(n_hist, dtype=np.int64) for k in ("co2_indoor", "delta_co2")}
+
+        self._merged = _merged_thresholds(self.codes)
+        self._bin_counts = {b: np.zeros(len(m) + 1) for b, m in self._merged.items()}
+        self._bin_seconds = {b: np.zeros(len(m) + 1) for b, m in self._merged.items()}
+        self._longest = {b: np.zeros(len(m)) for b, m in self._merged.items()}
+        self._open_run = {b: np.zeros(len(m)) for b, m in self._merged.items()}
+        self._in_run = {b: np.zeros(len(m), dtype=bool) for b, m in self._merged.items()}
+
+        self._n = 0
+        self._n_missing = 0
+        self._seconds = 0.0
+        self._last_time: Optional[float] = None
+
+        # time-averaged evaluation: window per standard and carried-over samples
+        self._windows = {
+            c: float(window) if window is not None else _CO2_STANDARDS[c].averaging
+            for c in self.codes
+        }
+        self._windows = {c: w for c, w in self._windows.items() if w}
+        self._avg_counts = {
+            c: np.zeros(len(_CO2_STANDARDS[c].thresholds) + 2, dtype=np.int64)
+            for c in self._windows
+        }
+        self._tail = (np.empty(0), np.empty(0), np.empty(0))
+
+    def update(self, co2_indoor, co2_outdoor=400, times=None) -> None:
+        """
+        Add a chunk of samples (in time order, after all previous chunks).
+
+        Args:
+            co2_indoor (array-like): Indoor CO2 in ppm.
+            co2_outdoor (array-like): Outdoor CO2 in ppm, scalar or aligned with `co2_indoor`.
+            times (array-like | None): Timestamps of the samples (seconds,
+                numpy.datetime64 or datetime). Use timestamps for all chunks or for none.
+
+        Raises:
+            ValueError: If the inputs are inconsistent or the chunk starts before the
+                end of the previous one.
+        """
+        indoor = np.asarray(co2_indoor, dtype=np.float64).reshape(-1)
+        n = len(indoor)
+        if n == 0:
+            return
+        try:
+            delta = np.broadcast_to(
+                indoor - np.asarray(co2_outdoor, dtype=np.float64).reshape(-1), indoor.shape
+            )
+        except ValueError:
+            raise ValueError(
+                "Error: co2_indoor and co2_outdoor have different length. "
+                "They have to be aligned if using dynamic outdoor CO2 concentration!"
+            )
+
+        if times is None:
+            t = (self._n + np.arange(n)) * self.sample_interval
+            durations = np.full(n, self.sample_interval)
+            breaks = np.zeros(n, dtype=bool)
+        else:
+            t = _as_seconds(times).reshape(-1)
+            if len(t) != n:
+                raise ValueError("times and co2_indoor must have the same length.")
+            prev = t[:1] if self._last_time is None else np.array([self._last_time])
+            if t[0] < prev[0] or np.any(np.diff(t) < 0):
+                raise ValueError("times must be non-decreasing across chunks.")
+            durations, breaks = _sample_durations(np.concatenate([prev, t]), self.max_gap)
+            durations, breaks = durations[1:], breaks[1:]
+
+        missing = np.isnan(indoor) | np.isnan(delta)
+        ok = ~missing
+        self._n += n
+        self._n_missing += int(missing.sum())
+        self._seconds += float(durations[ok].sum())
+        self._last_time = float(t[-1])
+        for key, values in (("co2_indoor", indoor), ("delta_co2", delta)):
+            b = np.floor((values[ok] - self._hist_lo) / self.resolution).astype(np.int64)
+            n_hist = len(self._hist[key])
+            self._hist[key] += np.bincount(np.clip(b, 0, n_hist - 1), minlength=n_hist)
+
+        series = {"indoor": indoor, "delta": delta}
+        elapsed = np.cumsum(np.where(ok, durations, 0.0))
+        for basis, merged in self._merged.items():
+            bins = np.searchsorted(merged, series[basis], side="left")
+            self._bin_counts[basis] += np.bincount(bins[ok], minlength=len(merged) + 1)
+            self._bin_seconds[basis] += np.bincount(
+                bins[ok], weights=durations[ok], minlength=len(merged) + 1
+            )
+            for k in range(len(merged)):
+                mask = ok & (bins > k)
+                starts, _, runs = _run_durations(mask, breaks, elapsed)
+                if len(runs) and starts[0] == 0 and self._in_run[basis][k] and not breaks[0]:
+                    runs[0] += self._open_run[basis][k]  # run continues from the last chunk
+                if len(runs):
+                    self._longest[basis][k] = max(self._longest[basis][k], runs.max())
+                self._in_run[basis][k] = bool(mask[-1])
+                self._open_run[basis][k] = runs[-1] if mask[-1] else 0.0
+
+        if self._windows:
+            self._update_averages(t, indoor, delta)
+
+    def _update_averages(self, t, indoor, delta) -> None:
+        tail_t, tail_in, tail_delta = self._tail
+        all_t = np.concatenate([tail_t, t])
+        values = {
+            False: np.concatenate([tail_in, indoor]),
+            True: np.concatenate([tail_delta, delta]),
+        }
+        n_tail = len(tail_t)
+        means = {}
+        for c, w in self._windows.items():
+            std = _CO2_STANDARDS[c]
+            if (std.delta, w) not in means:
+                means[(std.delta, w)] = rolling_time_mean(all_t, values[std.delta], w, self.max_gap)
+            mean, coverage = (a[n_tail:] for a in means[(std.delta, w)])
+            idx = np.searchsorted(_co2_threshold_table(c), mean, side="left") + 1
+            idx[(coverage < self.min_coverage) | np.isnan(mean)] = 0
+            self._avg_counts[c] += np.bincount(idx, minlength=len(self._avg_counts[c]))
+
+        # keep the samples still inside the longest window, plus the one before
+        # (it marks where the first kept sample's interval starts)
+        first = np.searchsorted(all_t, all_t[-1] - max(self._windows.values()), side="left")
+        first = max(int(first) - 1, 0)
+        self._tail = (all_t[first:], values[False][first:], values[True][first:])
+
+    def consume(self, chunks: Iterable[Any]) -> "IAQStreamEvaluator":
+        """
+        Feed all chunks of an iterator.
+
+        Args:
+            chunks (Iterable): Dicts with the keyword arguments of `update`
+                (as yielded by `iter_csv_chunks`) or arrays of indoor CO2.
+
+        Returns:
+            IAQStreamEvaluator: self.
+        """
+        for chunk in chunks:
+            if isinstance(chunk, dict):
+                self.update(**chunk)
+            else:
+                self.update(chunk)
+        return self
+
+    def _hist_percentiles(self, key: str) -> Dict[float, float]:
+        counts = self._hist[key]
+        total = int(counts.sum())
+        if total == 0:
+            return {p: float("nan") for p in self.percentiles}
+        cum = np.cumsum(counts)
+        ranks = np.asarray(self.percentiles, dtype=float) / 100.0 * (total - 1)
+        # linear interpolation between the neighbouring ranks, like numpy.percentile
+        lower = np.searchsorted(cum, np.floor(ranks), side="right")
+        upper = np.searchsorted(cum, np.ceil(ranks), side="right")
+        bins = lower + (upper - lower) * (ranks - np.floor(ranks))
+        values = self._hist_lo + (bins + 0.5) * self.resolution
+        return {p: float(v) for p, v in zip(self.percentiles, values)}
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Aggregates over all samples seen so far.
+
+        Returns:
+            Dict[str, Any]: Same structure as `iaq_co2_report`, plus
+                "averaged": {code: {"window": seconds, "counts": numpy.ndarray}} with the
+                category counts of the time-averaged evaluation (index 0 = insufficient
+                coverage, index i = category i), as `iaq_co2_timeseries` would give.
+        """
+        out: Dict[str, Any] = {
+            "n_samples": self._n,
+            "n_missing": self._n_missing,
+            "hours": self._seconds / 3600.0,
+            "percentiles": {k: self._hist_percentiles(k) for k in self._hist},
+            "standards": {},
+        }
+        for basis, merged in self._merged.items():
+            for c in self.codes:
+                if (basis == "delta") == _CO2_STANDARDS[c].delta:
+                    out["standards"][c] = _standard_summary(
+                        c,
+                        merged,
+                        self._bin_counts[basis],
+                        self._bin_seconds[basis],
+                        self._longest[basis],
+                    )
+        out["standards"] = {c: out["standards"][c] for c in self.codes}
+        out["averaged"] = {
+            c: {"window": self._windows[c], "counts": self._avg_counts[c].copy()}
+            for c in self._windows
+        }
+        return out
+
+
+def iter_csv_chunks(
+    path: Union[str, Path],
+    co2_column: Union[str, int],
+    time_column: Union[str, int, None] = None,
+    outdoor_column: Union[str, int, None] = None,
+    chunk_size: int = 100000,
+    delimiter: str = ",",
+    time_format: Optional[str] = None,
+    encoding: str = "utf-8",
+) -> Iterator[Dict[str, Any]]:
+    """
+    Read a (large) CSV file of CO2 measurements in chunks.
+
+    Args:
+        path (str | Path): CSV file with a header row.
+        co2_column (str | int): Column name or index of the indoor CO2 (ppm).
+        time_column (str | int | None): Column of the timestamps: numbers (seconds) or
+            date/time strings (ISO 8601, or `time_format` for `datetime.strptime`).
+        outdoor_column (str | int | None): Column of the outdoor CO2 (ppm). If None,
+            the chunks have no outdoor values (400 ppm is used by `update`).
+        chunk_size (int): Rows per chunk.
+        delimiter (str): Field delimiter.
+        time_format (str | None): `strptime` format for non-ISO timestamps.
+        encoding (str): File encoding.
+
+    Yields:
+        Dict[str, Any]: {"co2_indoor": numpy.ndarray, "co2_outdoor": numpy.ndarray
+            (if `outdoor_column`), "times": numpy.ndarray (if `time_column`)}.
+            Empty or non-numeric CO2 cells are NaN.
+
+    Raises:
+        ValueError: If a column is not found in the header.
+    """
+    _require_numpy()
+
+    def to_float(x: str) -> float:
+        try:
+            return float(x)
+        except ValueError:
+            return float("nan")
+
+    def to_times(col: List[str]) -> "np.ndarray":
+        if time_format is not None:
+            parsed = [datetime.strptime(x, time_format) for x in col]
+            return np.array(parsed, dtype="datetime64[ns]")
+        try:
+            return np.array(col, dtype=np.float64)
+        except ValueError:
+            return np.array(col, dtype="datetime64[ns]")
+
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = [h.strip() for h in next(reader)]
+
+        def col_index(c):
+            if c is None or isinstance(c, int):
+                return c
+            if c not in header:
+                raise ValueError(f"Column {c!r} not found in {path}. Columns: {header}")
+            return header.index(c)
+
+        i_co2, i_time, i_out = (col_index(c) for c in (co2_column, time_column, outdoor_column))
+        rows: List[List[str]] = []
+        for row in reader:
+            if not row:
+                continue
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                yield _csv_chunk(rows, i_co2, i_time, i_out, to_float, to_times)
+                rows = []
+        if rows:
+            yield _csv_chunk(rows, i_co2, i_time, i_out, to_float, to_times)
+
+
+def _csv_chunk(rows, i_co2, i_time, i_out, to_float, to_times) -> Dict[str, Any]:
+    chunk = {"co2_indoor": np.array([to_float(r[i_co2]) for r in rows])}
+    if i_out is not None:
+        chunk["co2_outdoor"] = np.array([to_float(r[i_out]) for r in rows])
+    if i_time is not None:
+        chunk["times"] = to_times([r[i_time].strip() for r in rows])
+    return chunk
+
+
 def _iaq_co2_en(co2_indoor: Union[float, int], co2_outdoor: Union[float, int]) -> int:
     """
     Helper function to calculate IAQ index for a single measurement based on CEN/EN 16798-1.
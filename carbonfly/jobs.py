@@ -0,0 +1,339 @@
+"""
+Asynchronous OpenFOAM jobs with live progress.
+
+`FoamJob` starts an OpenFOAM utility or solver as a background process
+through a `carbonfly.runner` backend, writes its output to a log file in the
+case folder, and streams the log lines through an async iterator while
+parsing the progress (solver time, Courant number, snappyHexMesh phase and
+iteration). Jobs can be cancelled.
+
+Grasshopper has no running asyncio event loop, so `start_job` runs a job on
+a background thread and returns a `BackgroundJob` whose status/progress can
+be polled from a component without blocking the UI.
+
+Examples:
+    async def main():
+        job = FoamJob("buoyantReactingFoam", case_root, log_rel="buoyantReactingFoam.run.log")
+        await job.start()
+        async for line in job.lines():
+            print(job.progress.time, job.progress.courant_max)
+        rc = await job.wait()
+"""
+
+from __future__ import annotations
+
+# carbonfly/jobs.py
+import asyncio
+import os
+import re
+import signal
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import AsyncIterator, List, Optional
+
+from .runner import FoamRunner, get_runner
+
+# log line patterns
+_RE_TIME = re.compile(r"^Time = ([-+0-9.eE]+)")
+_RE_COURANT = re.compile(r"^Courant Number mean: ([-+0-9.eE]+) max: ([-+0-9.eE]+)")
+_RE_ITERATION = re.compile(r"^(Feature|Surface|Shell|Gap|Morph) (?:refinement )?iteration (\d+)")
+_SNAPPY_PHASES = (
+    ("Refinement phase", "castellate"),
+    ("Morphing phase", "snap"),
+    ("layer addition phase", "layers"),
+)
+
+
+@dataclass
+class JobProgress:
+    """
+    Progress parsed from an OpenFOAM log.
+
+    Attributes:
+        time (float | None): Latest solver time (`Time = ...`).
+        courant_mean (float | None): Latest mean Courant number.
+        courant_max (float | None): Latest max Courant number.
+        snappy_phase (str | None): snappyHexMesh phase ("castellate", "snap" or "layers").
+        iteration_kind (str | None): Kind of the latest snappyHexMesh iteration
+            ("Feature", "Surface", "Shell", "Gap" or "Morph").
+        iteration (int | None): Latest snappyHexMesh refinement/morph iteration.
+        n_lines (int): Number of log lines seen.
+    """
+
+    time: Optional[float] = None
+    courant_mean: Optional[float] = None
+    courant_max: Optional[float] = None
+    snappy_phase: Optional[str] = None
+    iteration_kind: Optional[str] = None
+    iteration: Optional[int] = None
+    n_lines: int = 0
+
+    def update(self, line: str) -> None:
+        """Update the progress from one log line."""
+        self.n_lines += 1
+        line = line.strip()
+        m = _RE_TIME.match(line)
+        if m:
+            self.time = float(m.group(1))
+            return
+        m = _RE_COURANT.match(line)
+        if m:
+            self.courant_mean = float(m.group(1))
+            self.courant_max = float(m.group(2))
+            return
+        m = _RE_ITERATION.match(line)
+        if m:
+            self.iteration_kind = m.group(1)
+            self.iteration = int(m.group(2))
+            return
+        for key, phase in _SNAPPY_PHASES:
+            if key in line:
+                self.snappy_phase = phase
+                return
+
+
+class FoamJob:
+    """
+    An OpenFOAM command running as an asyncio subprocess.
+
+    Attributes:
+        command (str): Shell command (e.g. `snappyHexMesh -overwrite`).
+        case_root (Path): Case root directory.
+        runner (FoamRunner): Backend used to build the process arguments.
+        log_rel (str | None): Log path relative to the case root (None: no log file).
+        progress (JobProgress): Parsed progress, updated while the job runs.
+        status (str): "pending", "running", "finished", "failed" or "cancelled".
+        returncode (int | None): Exit code once the job ended.
+        started_at (float | None): Start time (`time.time()`).
+        ended_at (float | None): End time (`time.time()`).
+    """
+
+    def __init__(
+        self,
+        command: str,
+        case_root: str | Path,
+        *,
+        runner: Optional[FoamRunner] = None,
+        log_rel: Optional[str] = None,
+        tail_lines: int = 200,
+    ):
+        self.command = command
+        self.case_root = Path(case_root)
+        self.runner = runner or get_runner("auto")
+        self.log_rel = log_rel
+        self.progress = JobProgress()
+        self.status = "pending"
+        self.returncode: Optional[int] = None
+        self.started_at: Optional[float] = None
+        self.ended_at: Optional[float] = None
+        self._tail = deque(maxlen=tail_lines)
+        self._subscribers: List[asyncio.Queue] = []
+        self._proc = None
+        self._pump = None
+        self._cancelled = False
+
+    def tail(self, n: Optional[int] = None) -> List[str]:
+        """Return the last `n` log lines (all kept lines if None)."""
+        lines = list(self._tail)
+        return lines if n is None else lines[-n:]
+
+    async def start(self) -> None:
+        """
+        Start the process.
+
+        Raises:
+            RuntimeError: If the job was already started.
+        """
+        if self.status != "pending":
+            raise RuntimeError(f"Job already {self.status}")
+        kwargs = dict(self.runner.popen_kwargs())
+        if os.name != "nt":
+            # own process group, so cancel() also stops the solver below bash
+            kwargs["start_new_session"] = True
+        self._proc = await asyncio.create_subprocess_exec(
+            *self.runner.argv(self.command, self.case_root),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            **kwargs,
+        )
+        self.status = "running"
+        self.started_at = time.time()
+        self._pump = asyncio.ensure_future(self._read_output())
+
+    async def _read_output(self) -> None:
+        log = None
+        if self.log_rel:
+            log_path = self.case_root / self.log_rel
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            log = open(log_path, "wb")
+        try:
+            while True:
+                raw = await self._proc.stdout.readline()
+                if not raw:
+                    break
+                if log is not None:
+                    log.write(raw)
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                self.progress.update(line)
+                self._tail.append(line)
+                for q in self._subscribers:
+                    q.put_nowait(line)
+        finally:
+            if log is not None:
+                log.close()
+            self.returncode = await self._proc.wait()
+            self.ended_at = time.time()
+            if self._cancelled:
+                self.status = "cancelled"
+            else:
+                self.status = "finished" if self.returncode == 0 else "failed"
+            for q in self._subscribers:
+                q.put_nowait(None)
+
+    async def lines(self) -> AsyncIterator[str]:
+        """
+        Iterate over log lines as they are produced (from the time of the call on).
+
+        Yields:
+            str: Log line without the trailing newline.
+        """
+        if self._pump is None:
+            raise RuntimeError("Job not started")
+        if self._pump.done():
+            return
+        q: asyncio.Queue = asyncio.Queue()
+        self._subscribers.append(q)
+        try:
+            while True:
+                line = await q.get()
+                if line is None:
+                    return
+                yield line
+        finally:
+            self._subscribers.remove(q)
+
+    async def wait(self) -> int:
+        """Wait for the job to end and return its exit code."""
+        if self._pump is None:
+            raise RuntimeError("Job not started")
+        await self._pump
+        return self.returncode
+
+    async def run(self) -> int:
+        """Start the job and wait for it (convenience)."""
+        await self.start()
+        return await self.wait()
+
+    def cancel(self) -> None:
+        """Terminate the job (no-op if it is not running)."""
+        if self._proc is None or self._proc.returncode is not None:
+            return
+        self._cancelled = True
+        try:
+            if os.name != "nt":
+                os.killpg(self._proc.pid, signal.SIGTERM)
+            else:
+                self._proc.terminate()
+        except ProcessLookupError:
+            pass
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Wall time in seconds (so far, if still running)."""
+        if self.started_at is None:
+            return None
+        return (self.ended_at or time.time()) - self.started_at
+
+
+class BackgroundJob:
+    """
+    Thread-backed handle of a `FoamJob`, for polling from synchronous code (e.g. GH components).
+
+    Use `start_job` to create one.
+    """
+
+    def __init__(self, job: FoamJob):
+        self.job = job
+        self._loop = asyncio.new_event_loop()
+        self._error: Optional[BaseException] = None
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._main, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            raise self._error
+
+    def _main(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self.job.start())
+        except BaseException as e:  # report start errors to the caller
+            self._error = e
+            self._started.set()
+            self._loop.close()
+            return
+        self._started.set()
+        try:
+            self._loop.run_until_complete(self.job.wait())
+        finally:
+            self._loop.close()
+
+    @property
+    def status(self) -> str:
+        """Job status (see `FoamJob.status`)."""
+        return self.job.status
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.job.returncode
+
+    @property
+    def progress(self) -> JobProgress:
+        """Snapshot of the parsed progress."""
+        return replace(self.job.progress)
+
+    def tail(self, n: Optional[int] = None) -> List[str]:
+        """Return the last `n` log lines."""
+        return self.job.tail(n)
+
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Block until the job ends (or `timeout` expires) and return its exit code."""
+        self._thread.join(timeout)
+        return self.job.returncode
+
+    def cancel(self) -> None:
+        """Terminate the job."""
+        if not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self.job.cancel)
+            except RuntimeError:
+                pass  # loop closed meanwhile: job already ended
+
+
+def start_job(
+    command: str,
+    case_root: str | Path,
+    *,
+    runner: Optional[FoamRunner] = None,
+    log_rel: Optional[str] = None,
+) -> BackgroundJob:
+    """
+    Start an OpenFOAM command in the background and return a pollable handle.
+
+    Args:
+        command (str): Shell command (e.g. `blockMesh`, `snappyHexMesh -overwrite`).
+        case_root (str | Path): Case root directory (host path).
+        runner (FoamRunner | None): Backend. If None, `get_runner("auto")` is used.
+        log_rel (str | None): Log path relative to the case root.
+
+    Returns:
+        BackgroundJob: Handle with `status`, `progress`, `tail()`, `wait()` and `cancel()`.
+    """
+    return BackgroundJob(FoamJob(command, case_root, runner=runner, log_rel=log_rel))
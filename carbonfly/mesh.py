@@ -7,6 +7,7 @@ triangle meshes and export them in formats suitable for OpenFOAM.
 .. note::
    This module depends on the RhinoCommon API and can only be used
    inside Rhino / Grasshopper. The ``Rhino`` module is provided by Rhino.
+   The vectorized code paths additionally require NumPy.
 """
 
 from __future__ import annotations
@@ -17,7 +18,19 @@ try:
 except ImportError:
     Rhino = None
 
-from typing import Iterable, Tuple, List
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from System import IntPtr
+    from System.Runtime.InteropServices import Marshal
+except ImportError:
+    IntPtr = Marshal = None
+
+import struct
+from typing import Iterable, Tuple
 
 
 def _require_rhino() -> None:
@@ -26,18 +39,28 @@ def _require_rhino() -> None:
         raise RuntimeError("Rhino is required for geometry operations.")
 
 
-def brep_to_mesh(brep: Rhino.Geometry.Brep) -> Rhino.Geometry.Mesh:
+def _require_numpy() -> None:
+    """Raise a clear error if NumPy is not available."""
+    if np is None:
+        raise RuntimeError("NumPy is required for vectorized mesh operations.")
+
+
+def brep_to_mesh(
+    brep: Rhino.Geometry.Brep, meshing_parameters=None
+) -> Rhino.Geometry.Mesh:
     """
     Convert a Rhino Brep into a single unified Mesh.
 
     Args:
         brep (Rhino.Geometry.Brep): Input Brep geometry.
+        meshing_parameters (Rhino.Geometry.MeshingParameters | None):
+            Meshing parameters. If None, `MeshingParameters.Default` is used.
 
     Returns:
         Rhino.Geometry.Mesh: A unified, triangulated mesh, or None if meshing failed.
     """
     _require_rhino()
-    mp = Rhino.Geometry.MeshingParameters.Default
+    mp = meshing_parameters or Rhino.Geometry.MeshingParameters.Default
     lst = Rhino.Geometry.Mesh.CreateFromBrep(brep, mp)
     if not lst:
         return None
@@ -85,6 +108,64 @@ def mesh_triangles(mesh):
             )
 
 
+def _net_array_to_numpy(values, dtype) -> "np.ndarray":
+    """
+    Copy a .NET array (e.g. `float[]` from `ToFloatArray()`) into a new NumPy array.
+
+    .NET arrays are copied with a single `Marshal.Copy` into the NumPy buffer,
+    instead of converting element by element across the Python/.NET boundary.
+    Other sequences (e.g. Python lists) are converted with `numpy.asarray`.
+
+    Args:
+        values: .NET array or sequence of numbers.
+        dtype: NumPy dtype matching the .NET element type
+            (`numpy.float32` for `float[]`, `numpy.int32` for `int[]`).
+
+    Returns:
+        numpy.ndarray: 1D array with a copy of the values.
+    """
+    n = len(values)
+    if Marshal is not None and n and hasattr(values, "GetType"):
+        out = np.empty(n, dtype=dtype)
+        Marshal.Copy(values, 0, IntPtr(out.ctypes.data), n)
+        return out
+    return np.asarray(values, dtype=dtype)
+
+
+def mesh_triangle_arrays(mesh):
+    """
+    Extract all triangles of a Rhino Mesh as NumPy arrays in one go.
+
+    Vectorized counterpart of `mesh_triangles`: vertex and face index arrays are
+    pulled out of the mesh in bulk (`Vertices.ToFloatArray()`,
+    `Faces.ToIntArray(True)`, quads split into two triangles), copied into NumPy
+    with one `Marshal.Copy` each (see `_net_array_to_numpy`) and every facet
+    normal is computed with array math.
+
+    Args:
+        mesh (Rhino.Geometry.Mesh): Input mesh (ideally triangulated).
+
+    Returns:
+        tuple: (tris, normals)
+            tris (numpy.ndarray): Triangle vertices, shape (n, 3, 3).
+            normals (numpy.ndarray): Unit facet normals, shape (n, 3).
+                Degenerate facets keep their (near) zero normal.
+    """
+    _require_rhino()
+    _require_numpy()
+    verts = _net_array_to_numpy(mesh.Vertices.ToFloatArray(), np.float32)
+    faces = _net_array_to_numpy(mesh.Faces.ToIntArray(True), np.int32)
+    verts = verts.astype(np.float64).reshape(-1, 3)
+    faces = faces.astype(np.int64).reshape(-1, 3)
+
+    tris = verts[faces]
+    normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    length = np.sqrt(np.einsum("ij,ij->i", normals, normals))
+    ok = length > 1e-20
+    normals[ok] /= length[ok, None]
+    return tris, normals
+
+
 def _scale_factor(unit: str) -> float:
     """
     Return scale factor converting input geometry units to meters.
@@ -108,8 +189,26 @@ def _scale_factor(unit: str) -> float:
     raise ValueError("unit must be 'mm'|'cm'|'m'")
 
 
+# printf-style template of one ASCII facet, repeated per chunk of facets
+_ASCII_FACET = (
+    "  facet normal %.6e %.6e %.6e\n"
+    "    outer loop\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "    endloop\n"
+    "  endfacet\n"
+)
+_ASCII_CHUNK = 4096
+
+
 def write_multi_solid_ascii_stl(
-    out_path, named_meshes: Iterable[Tuple[str, Rhino.Geometry.Mesh]], unit: str
+    out_path,
+    named_meshes: Iterable[Tuple[str, Rhino.Geometry.Mesh]],
+    unit: str,
+    *,
+    buffer_size: int = 1 << 20,
+    vectorized: bool = False,
 ):
     """
     Write a multi-solid ASCII STL file.
@@ -117,33 +216,149 @@ def write_multi_solid_ascii_stl(
     Each entry in `named_meshes` becomes one `solid <name> ... endsolid <name>`
     block. Geometry is scaled to meters using `unit`.
 
+    Facets are streamed to a buffered file handle as `mesh_triangles` yields
+    them, so memory use does not grow with the model size.
+
+    Args:
+        out_path: Output path (Path or str).
+        named_meshes: Iterable of (name, mesh) pairs.
+        unit: Unit label for input meshes ("mm" | "cm" | "m").
+        buffer_size: Size of the file write buffer in bytes (default 1 MiB).
+        vectorized: If True, extract triangles with `mesh_triangle_arrays` (requires NumPy).
+            Normals are then computed in double precision and may differ from the
+            default path in the last printed digit.
+
+    Returns:
+        Path to the written STL file.
+    """
+    from pathlib import Path
+
+    sf = _scale_factor(unit)
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8", buffering=buffer_size) as f:
+        for nm, mesh in named_meshes:
+            name = str(nm).replace(" ", "_")
+            f.write(f"solid {name}\n")
+            if vectorized:
+                tris, normals = mesh_triangle_arrays(mesh)
+                rows = np.hstack([normals, tris.reshape(-1, 9) * sf])
+                for i in range(0, len(rows), _ASCII_CHUNK):
+                    chunk = rows[i : i + _ASCII_CHUNK]
+                    f.write((_ASCII_FACET * len(chunk)) % tuple(chunk.ravel().tolist()))
+                f.write(f"endsolid {name}\n")
+                continue
+            for (ax, ay, az), (bx, by, bz), (cx, cy, cz), (nx, ny, nz) in mesh_triangles(
+                mesh
+            ):
+                f.write(
+                    f"  facet normal {nx:.6e} {ny:.6e} {nz:.6e}\n"
+                    "    outer loop\n"
+                    f"      vertex {ax*sf:.6e} {ay*sf:.6e} {az*sf:.6e}\n"
+                    f"      vertex {bx*sf:.6e} {by*sf:.6e} {bz*sf:.6e}\n"
+                    f"      vertex {cx*sf:.6e} {cy*sf:.6e} {cz*sf:.6e}\n"
+                    "    endloop\n"
+                    "  endfacet\n"
+                )
+            f.write(f"endsolid {name}\n")
+    return out_path
+
+
+# 50-byte little-endian facet record: normal, 3 vertices, attribute byte count
+_STL_BINARY_RECORD = struct.Struct("<12fH")
+_STL_BINARY_DTYPE = (
+    np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")])
+    if np is not None
+    else None
+)
+
+
+def binary_stl_region_name(index: int) -> str:
+    """
+    Return the region name OpenFOAM assigns to a binary STL attribute index.
+
+    Binary STL files carry no solid names. OpenFOAM groups facets by their
+    attribute value and labels the resulting regions `patch0`, `patch1`, ...
+    in first-seen order.
+
+    Args:
+        index: Region index written into the facet attribute.
+
+    Returns:
+        Region name as read by OpenFOAM (e.g. "patch0").
+    """
+    return f"patch{int(index)}"
+
+
+def write_multi_solid_binary_stl(
+    out_path,
+    named_meshes: Iterable[Tuple[str, Rhino.Geometry.Mesh]],
+    unit: str,
+    *,
+    buffer_size: int = 1 << 20,
+    vectorized: bool = False,
+):
+    """
+    Write a multi-region binary STL file.
+
+    Facets are streamed as packed little-endian records. The region of each
+    facet is stored in the 2-byte attribute field: regions are numbered in
+    first-seen order of their names, so repeated names share one region.
+    OpenFOAM reads these regions as `patch0`, `patch1`, ... (see
+    `binary_stl_region_name`), which snappyHexMeshDict maps back to the
+    original names. Geometry is scaled to meters using `unit`.
+
     Args:
         out_path: Output path (Path or str).
         named_meshes: Iterable of (name, mesh) pairs.
         unit: Unit label for input meshes ("mm" | "cm" | "m").
+        buffer_size: Size of the file write buffer in bytes (default 1 MiB).
+        vectorized: If True, extract triangles with `mesh_triangle_arrays` (requires NumPy)
+            and write each region as one block of records.
 
     Returns:
         Path to the written STL file.
+
+    Raises:
+        ValueError: If there are more regions than the 16-bit attribute can hold.
     """
     from pathlib import Path
 
     sf = _scale_factor(unit)
-    lines: List[str] = []
-    for nm, mesh in named_meshes:
-        name = str(nm).replace(" ", "_")
-        lines.append(f"solid {name}")
-        for (ax, ay, az), (bx, by, bz), (cx, cy, cz), (nx, ny, nz) in mesh_triangles(
-            mesh
-        ):
-            lines.append(f"  facet normal {nx:.6e} {ny:.6e} {nz:.6e}")
-            lines.append("    outer loop")
-            lines.append(f"      vertex {ax*sf:.6e} {ay*sf:.6e} {az*sf:.6e}")
-            lines.append(f"      vertex {bx*sf:.6e} {by*sf:.6e} {bz*sf:.6e}")
-            lines.append(f"      vertex {cx*sf:.6e} {cy*sf:.6e} {cz*sf:.6e}")
-            lines.append("    endloop")
-            lines.append("  endfacet")
-        lines.append(f"endsolid {name}")
+    pack = _STL_BINARY_RECORD.pack
+    region_ids = {}
+    n_facets = 0
+
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with open(out_path, "wb", buffering=buffer_size) as f:
+        # 80-byte header (must not start with "solid") + facet count placeholder
+        f.write(b"carbonfly binary STL".ljust(80, b" "))
+        f.write(struct.pack("<I", 0))
+        for nm, mesh in named_meshes:
+            rid = region_ids.setdefault(str(nm), len(region_ids))
+            if rid > 0xFFFF:
+                raise ValueError("binary STL supports at most 65536 regions")
+            if vectorized:
+                tris, normals = mesh_triangle_arrays(mesh)
+                rec = np.empty(len(tris), dtype=_STL_BINARY_DTYPE)
+                rec["normal"] = normals
+                rec["vertices"] = tris * sf
+                rec["attr"] = rid
+                f.write(rec.tobytes())
+                n_facets += len(rec)
+                continue
+            for (ax, ay, az), (bx, by, bz), (cx, cy, cz), n in mesh_triangles(mesh):
+                f.write(
+                    pack(
+                        *n,
+                        ax * sf, ay * sf, az * sf,
+                        bx * sf, by * sf, bz * sf,
+                        cx * sf, cy * sf, cz * sf,
+                        rid,
+                    )
+                )
+                n_facets += 1
+        f.seek(80)
+        f.write(struct.pack("<I", n_facets))
     return out_path
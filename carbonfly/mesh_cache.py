@@ -0,0 +1,325 @@
+"""
+Content-addressed meshing cache for CFGeo Breps.
+
+This module lets repeated case builds skip re-meshing unchanged geometry.
+Each Brep is identified by a stable hash of its topology, vertex coordinates,
+underlying NURBS data and the meshing parameters. The triangulated meshes are
+kept in an in-memory LRU cache, optionally backed by an on-disk tier
+(e.g. under the case folder, see `case_cache_dir`).
+
+Typical use in Grasshopper keeps one `MeshCache` alive between solutions
+(e.g. in `scriptcontext.sticky`) and passes it to `carbonfly.case.build_case`.
+
+.. note::
+   This module depends on the RhinoCommon API and can only be used
+   inside Rhino / Grasshopper. The ``Rhino`` module is provided by Rhino.
+"""
+
+from __future__ import annotations
+
+# carbonfly/mesh_cache.py
+import hashlib
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+try:
+    import Rhino
+except ImportError:
+    Rhino = None
+
+from .mesh import brep_to_mesh
+
+# MeshingParameters properties that influence the triangulation
+_MESHING_PARAMETER_KEYS = (
+    "SimplePlanes",
+    "RefineGrid",
+    "JaggedSeams",
+    "ComputeCurvature",
+    "ClosedObjectPostProcess",
+    "GridAspectRatio",
+    "GridAngle",
+    "GridAmplification",
+    "GridMinCount",
+    "GridMaxCount",
+    "MaximumEdgeLength",
+    "MinimumEdgeLength",
+    "MinimumTolerance",
+    "RelativeTolerance",
+    "Tolerance",
+    "RefineAngle",
+)
+
+# on-disk record: magic, vertex count, triangle count
+_DISK_MAGIC = b"CFMESH1\0"
+_DISK_HEADER = struct.Struct("<8sII")
+
+
+def _require_rhino() -> None:
+    """Raise a clear error if RhinoCommon is not available."""
+    if Rhino is None:
+        raise RuntimeError("Rhino is required for geometry operations.")
+
+
+def case_cache_dir(case_root: str | Path) -> Path:
+    """
+    Return the default on-disk mesh cache folder of a case.
+
+    Args:
+        case_root (str | Path): Case root directory.
+
+    Returns:
+        Path: `<case_root>/.carbonfly/mesh_cache`.
+    """
+    return Path(case_root) / ".carbonfly" / "mesh_cache"
+
+
+def meshing_parameters_key(meshing_parameters=None) -> str:
+    """
+    Return a stable text key for Rhino meshing parameters.
+
+    Args:
+        meshing_parameters (Rhino.Geometry.MeshingParameters | None):
+            Meshing parameters. If None, `MeshingParameters.Default` is used.
+
+    Returns:
+        str: Semicolon-separated `name=value` pairs.
+    """
+    _require_rhino()
+    mp = meshing_parameters or Rhino.Geometry.MeshingParameters.Default
+    parts = []
+    for k in _MESHING_PARAMETER_KEYS:
+        v = getattr(mp, k, None)
+        parts.append(f"{k}={float(v)!r}" if isinstance(v, float) else f"{k}={v}")
+    return ";".join(parts)
+
+
+def brep_geometry_hash(brep: Rhino.Geometry.Brep, meshing_parameters=None) -> str:
+    """
+    Compute a stable content hash of a Brep for meshing.
+
+    The hash covers the Brep topology (face/edge/vertex/loop/trim counts),
+    vertex coordinates, the NURBS form of every face and edge, and the
+    meshing parameters. It does not depend on object identity, so equal
+    geometry recreated by a Grasshopper recompute maps to the same key.
+
+    Args:
+        brep (Rhino.Geometry.Brep): Input Brep.
+        meshing_parameters (Rhino.Geometry.MeshingParameters | None):
+            Meshing parameters. If None, `MeshingParameters.Default` is used.
+
+    Returns:
+        str: Hex digest (SHA-256).
+    """
+    _require_rhino()
+    h = hashlib.sha256()
+    pack3 = struct.Struct("<3d").pack
+    pack4 = struct.Struct("<4d").pack
+
+    # topology
+    h.update(
+        struct.pack(
+            "<5i",
+            brep.Faces.Count,
+            brep.Edges.Count,
+            brep.Vertices.Count,
+            brep.Loops.Count,
+            brep.Trims.Count,
+        )
+    )
+
+    # vertex coordinates
+    for v in brep.Vertices:
+        p = v.Location
+        h.update(pack3(p.X, p.Y, p.Z))
+
+    # faces: NURBS form of the (untrimmed) surface + orientation
+    for face in brep.Faces:
+        srf = face.ToNurbsSurface()
+        h.update(
+            struct.pack(
+                "<4i?",
+                srf.Degree(0),
+                srf.Degree(1),
+                srf.Points.CountU,
+                srf.Points.CountV,
+                bool(face.OrientationIsReversed),
+            )
+        )
+        for cp in srf.Points:
+            p = cp.Location
+            h.update(pack4(p.X, p.Y, p.Z, cp.Weight))
+        h.update(array("d", list(srf.KnotsU)).tobytes())
+        h.update(array("d", list(srf.KnotsV)).tobytes())
+
+    # edges (carry the trimming boundaries)
+    for edge in brep.Edges:
+        crv = edge.ToNurbsCurve()
+        h.update(struct.pack("<2i", crv.Degree, crv.Points.Count))
+        for cp in crv.Points:
+            p = cp.Location
+            h.update(pack4(p.X, p.Y, p.Z, cp.Weight))
+
+    h.update(meshing_parameters_key(meshing_parameters).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _mesh_to_bytes(mesh: Rhino.Geometry.Mesh) -> bytes:
+    """Serialize a triangulated mesh as vertices (float32) + triangle indices (int32)."""
+    verts = array("f", mesh.Vertices.ToFloatArray())
+    tris = array("i", mesh.Faces.ToIntArray(True))
+    return (
+        _DISK_HEADER.pack(_DISK_MAGIC, len(verts) // 3, len(tris) // 3)
+        + verts.tobytes()
+        + tris.tobytes()
+    )
+
+
+def _mesh_from_bytes(data: bytes) -> Optional[Rhino.Geometry.Mesh]:
+    """Inverse of `_mesh_to_bytes`. Returns None for malformed data."""
+    if len(data) < _DISK_HEADER.size:
+        return None
+    magic, nv, nt = _DISK_HEADER.unpack_from(data)
+    if magic != _DISK_MAGIC or len(data) != _DISK_HEADER.size + 12 * nv + 12 * nt:
+        return None
+    off = _DISK_HEADER.size
+    verts = array("f")
+    verts.frombytes(data[off : off + 12 * nv])
+    tris = array("i")
+    tris.frombytes(data[off + 12 * nv :])
+
+    m = Rhino.Geometry.Mesh()
+    for i in range(0, len(verts), 3):
+        m.Vertices.Add(verts[i], verts[i + 1], verts[i + 2])
+    for i in range(0, len(tris), 3):
+        m.Faces.AddFace(tris[i], tris[i + 1], tris[i + 2])
+    m.Normals.ComputeNormals()
+    return m
+
+
+class MeshCache:
+    """
+    LRU cache of triangulated Brep meshes keyed by `brep_geometry_hash`.
+
+    Cached meshes are shared between callers and must be treated as read-only.
+    The cache is thread-safe, so regions may be meshed from a thread pool.
+
+    Attributes:
+        max_entries (int): Maximum number of meshes kept in memory.
+        disk_dir (Path | None): Optional on-disk tier. Meshes are stored as
+            `<disk_dir>/<hash>.cfmesh` and survive Rhino restarts.
+        hits (int): Number of lookups served from memory or disk.
+        misses (int): Number of lookups that required meshing.
+    """
+
+    def __init__(self, max_entries: int = 512, disk_dir: str | Path | None = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = int(max_entries)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Rhino.Geometry.Mesh]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.disk_dir is not None and self._disk_path(key).exists()
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.cfmesh"
+
+    def _remember(self, key: str, mesh) -> None:
+        with self._lock:
+            self._entries[key] = mesh
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Rhino.Geometry.Mesh]:
+        """
+        Look up a mesh by key (memory first, then disk).
+
+        Args:
+            key (str): Geometry hash.
+
+        Returns:
+            Rhino.Geometry.Mesh | None: Cached mesh, or None on a miss.
+        """
+        with self._lock:
+            m = self._entries.get(key)
+            if m is not None:
+                self._entries.move_to_end(key)
+                return m
+        if self.disk_dir is not None:
+            p = self._disk_path(key)
+            if p.exists():
+                m = _mesh_from_bytes(p.read_bytes())
+                if m is not None:
+                    self._remember(key, m)
+                    return m
+        return None
+
+    def put(self, key: str, mesh: Rhino.Geometry.Mesh) -> None:
+        """
+        Store a mesh in memory and, if configured, on disk.
+
+        Args:
+            key (str): Geometry hash.
+            mesh (Rhino.Geometry.Mesh): Triangulated mesh.
+        """
+        self._remember(key, mesh)
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            p = self._disk_path(key)
+            tmp = p.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(_mesh_to_bytes(mesh))
+            tmp.replace(p)
+
+    def mesh_brep(
+        self, brep: Rhino.Geometry.Brep, meshing_parameters=None
+    ) -> Optional[Rhino.Geometry.Mesh]:
+        """
+        Return the cached mesh of a Brep, meshing it on a miss.
+
+        Args:
+            brep (Rhino.Geometry.Brep): Input Brep.
+            meshing_parameters (Rhino.Geometry.MeshingParameters | None):
+                Meshing parameters. If None, `MeshingParameters.Default` is used.
+
+        Returns:
+            Rhino.Geometry.Mesh | None: Triangulated mesh, or None if meshing failed.
+        """
+        key = brep_geometry_hash(brep, meshing_parameters)
+        m = self.get(key)
+        with self._lock:
+            if m is not None:
+                self.hits += 1
+                return m
+            self.misses += 1
+        m = brep_to_mesh(brep, meshing_parameters)
+        if m is not None:
+            self.put(key, m)
+        return m
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Drop all in-memory entries.
+
+        Args:
+            disk (bool): If True, also delete the on-disk `*.cfmesh` files.
+        """
+        with self._lock:
+            self._entries.clear()
+        if disk and self.disk_dir is not None and self.disk_dir.exists():
+            for p in self.disk_dir.glob("*.cfmesh"):
+                p.unlink()
@@ -0,0 +1,343 @@
+"""
+Case pipeline runner with stage-level result caching.
+
+The usual OpenFOAM workflow (blockMesh -> surfaceFeatures -> snappyHexMesh ->
+checkMesh -> buoyantReactingFoam) is modelled as a dependency graph of
+`Stage` objects. Each stage has an input fingerprint: a hash of its command,
+its input files and the fingerprints of its upstream stages. Fingerprints of
+successful runs are stored in `<case>/.carbonfly/pipeline.json`. A stage
+whose fingerprint is unchanged and whose outputs exist is skipped. All
+stages downstream of a stage that runs are run as well.
+
+Examples:
+    results = run_pipeline(case_root, targets=["checkMesh"])  # mesh only
+    print(pipeline_report(results))
+"""
+
+from __future__ import annotations
+
+# carbonfly/pipeline.py
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .runner import FoamRunner, get_runner
+from .utils import file_digest
+
+
+@dataclass
+class Stage:
+    """
+    One step of a case pipeline.
+
+    Attributes:
+        name (str): Unique stage name.
+        command (str): Shell command run inside the case folder.
+        inputs (Tuple[str, ...]): Input files relative to the case root (glob patterns allowed).
+        outputs (Tuple[str, ...]): Output files relative to the case root (glob patterns allowed).
+            The stage re-runs if any of them is missing.
+        depends (Tuple[str, ...]): Names of upstream stages.
+        overwrites (Tuple[str, ...]): Upstream stages whose outputs this stage modifies
+            in place (e.g. `snappyHexMesh -overwrite` replaces the blockMesh polyMesh).
+            If this stage has to run, those stages run again first.
+        log_rel (str | None): Log path relative to the case root.
+    """
+
+    name: str
+    command: str
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    depends: Tuple[str, ...] = ()
+    overwrites: Tuple[str, ...] = ()
+    log_rel: Optional[str] = None
+
+
+@dataclass
+class StageResult:
+    """
+    Result of one stage.
+
+    Attributes:
+        name (str): Stage name.
+        status (str): "ok", "failed", "skipped" (up to date) or "not run" (upstream failed).
+        returncode (int | None): Exit code of the command, None if it did not run.
+        seconds (float): Wall time in seconds (0 if it did not run).
+        fingerprint (str): Input fingerprint of the stage.
+    """
+
+    name: str
+    status: str
+    returncode: Optional[int] = None
+    seconds: float = 0.0
+    fingerprint: str = ""
+
+
+def default_stages(solver: str = "buoyantReactingFoam") -> List[Stage]:
+    """
+    Return the standard carbonfly pipeline.
+
+    Args:
+        solver (str): Solver application.
+
+    Returns:
+        List[Stage]: blockMesh, surfaceFeatures, snappyHexMesh, checkMesh and the solver.
+    """
+    return [
+        Stage(
+            "blockMesh",
+            "blockMesh -case .",
+            inputs=("system/blockMeshDict",),
+            outputs=("constant/polyMesh/owner",),
+            log_rel="system/blockMesh.run.log",
+        ),
+        Stage(
+            "surfaceFeatures",
+            "surfaceFeatures",
+            inputs=("system/surfaceFeaturesDict", "constant/triSurface/*.stl"),
+            outputs=("constant/triSurface/*.eMesh",),
+            log_rel="system/surfaceFeatures.run.log",
+        ),
+        Stage(
+            "snappyHexMesh",
+            "snappyHexMesh -overwrite",
+            inputs=("system/snappyHexMeshDict", "constant/triSurface/*.stl"),
+            outputs=("constant/polyMesh/owner",),
+            depends=("blockMesh", "surfaceFeatures"),
+            overwrites=("blockMesh",),
+            log_rel="system/snappyHexMesh.run.log",
+        ),
+        Stage(
+            "checkMesh",
+            "checkMesh",
+            depends=("snappyHexMesh",),
+            log_rel="system/checkMesh.run.log",
+        ),
+        Stage(
+            solver,
+            solver,
+            inputs=(
+                "0/*",
+                "constant/*",
+                "system/controlDict",
+                "system/fvSchemes",
+                "system/fvSolution",
+            ),
+            depends=("checkMesh",),
+            log_rel=f"{solver}.run.log",
+        ),
+    ]
+
+
+def _topological_order(stages: List[Stage]) -> List[Stage]:
+    """Order stages so that every stage comes after its dependencies (stable)."""
+    by_name = {s.name: s for s in stages}
+    if len(by_name) != len(stages):
+        raise ValueError("Stage names must be unique.")
+    for s in stages:
+        unknown = [d for d in s.depends + s.overwrites if d not in by_name]
+        if unknown:
+            raise ValueError(f"Stage '{s.name}' depends on unknown stage(s): {unknown}")
+
+    out: List[Stage] = []
+    done = set()
+    pending = list(stages)
+    while pending:
+        ready = [s for s in pending if all(d in done for d in s.depends)]
+        if not ready:
+            raise ValueError(
+                f"Cyclic stage dependencies: {[s.name for s in pending]}"
+            )
+        for s in ready:
+            out.append(s)
+            done.add(s.name)
+        pending = [s for s in pending if s.name not in done]
+    return out
+
+
+def _expand(case_root: Path, patterns: Iterable[str]) -> List[Path]:
+    files = set()
+    for pat in patterns:
+        files.update(p for p in case_root.glob(pat) if p.is_file())
+    return sorted(files)
+
+
+def _fingerprint(case_root: Path, stage: Stage, upstream: Dict[str, str]) -> str:
+    h = hashlib.sha256()
+    h.update(stage.command.encode("utf-8"))
+    for pat in stage.inputs:
+        h.update(b"\0" + pat.encode("utf-8"))
+        for p in _expand(case_root, [pat]):
+            rel = p.relative_to(case_root).as_posix()
+            h.update(f"\0{rel}\0{file_digest(p)}".encode("utf-8"))
+    for d in stage.depends:
+        h.update(f"\0{d}\0{upstream[d]}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _outputs_exist(case_root: Path, stage: Stage) -> bool:
+    return all(_expand(case_root, [pat]) for pat in stage.outputs)
+
+
+def _state_path(case_root: Path) -> Path:
+    return case_root / ".carbonfly" / "pipeline.json"
+
+
+def _load_state(case_root: Path) -> Dict:
+    p = _state_path(case_root)
+    try:
+        return json.loads(p.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"stages": {}}
+
+
+def _save_state(case_root: Path, state: Dict) -> None:
+    p = _state_path(case_root)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    tmp.replace(p)
+
+
+def plan_pipeline(
+    case_root: str | Path,
+    stages: Optional[List[Stage]] = None,
+    targets: Optional[Iterable[str]] = None,
+    force: bool = False,
+) -> List[Tuple[Stage, str, bool]]:
+    """
+    Decide which stages have to run.
+
+    Args:
+        case_root (str | Path): Case root directory.
+        stages (List[Stage] | None): Pipeline stages. If None, `default_stages()` is used.
+        targets (Iterable[str] | None): Only plan these stages and their dependencies.
+            If None, all stages are planned.
+        force (bool): If True, run every planned stage.
+
+    Returns:
+        List[Tuple[Stage, str, bool]]: (stage, fingerprint, needs_run) in execution order.
+    """
+    case_root = Path(case_root)
+    ordered = _topological_order(list(stages or default_stages()))
+    by_name = {s.name: s for s in ordered}
+
+    if targets is not None:
+        wanted = set()
+        todo = list(targets)
+        while todo:
+            n = todo.pop()
+            if n not in by_name:
+                raise ValueError(f"Unknown target stage: {n}")
+            if n not in wanted:
+                wanted.add(n)
+                todo += list(by_name[n].depends)
+        ordered = [s for s in ordered if s.name in wanted]
+
+    stored = _load_state(case_root).get("stages", {})
+    fps: Dict[str, str] = {}
+    for s in ordered:
+        fps[s.name] = _fingerprint(case_root, s, fps)
+
+    run = {
+        s.name: force
+        or stored.get(s.name, {}).get("fingerprint") != fps[s.name]
+        or not _outputs_exist(case_root, s)
+        for s in ordered
+    }
+    # propagate: downstream of a running stage runs, and stages overwritten
+    # in place by a running stage run again (which again affects downstream)
+    changed = True
+    while changed:
+        changed = False
+        for s in ordered:
+            if not run[s.name] and any(run[d] for d in s.depends):
+                run[s.name] = changed = True
+            if run[s.name]:
+                for u in s.overwrites:
+                    if u in run and not run[u]:
+                        run[u] = changed = True
+    return [(s, fps[s.name], run[s.name]) for s in ordered]
+
+
+def run_pipeline(
+    case_root: str | Path,
+    stages: Optional[List[Stage]] = None,
+    *,
+    runner: Optional[FoamRunner] = None,
+    targets: Optional[Iterable[str]] = None,
+    force: bool = False,
+    timeout: Optional[float] = None,
+) -> List[StageResult]:
+    """
+    Run the pipeline, skipping stages that are up to date.
+
+    Stages run in dependency order. The pipeline stops at the first failing stage;
+    the remaining stages are reported as "not run".
+
+    Args:
+        case_root (str | Path): Case root directory.
+        stages (List[Stage] | None): Pipeline stages. If None, `default_stages()` is used.
+        runner (FoamRunner | None): Backend. If None, `get_runner("auto")` is used.
+        targets (Iterable[str] | None): Only run these stages and their dependencies.
+        force (bool): If True, run every stage regardless of cached results.
+        timeout (float | None): Optional timeout in seconds per stage.
+
+    Returns:
+        List[StageResult]: One result per planned stage, in execution order.
+    """
+    case_root = Path(case_root)
+    runner = runner or get_runner("auto")
+    plan = plan_pipeline(case_root, stages, targets, force)
+    state = _load_state(case_root)
+    state.setdefault("stages", {})
+
+    results: List[StageResult] = []
+    failed = False
+    for stage, fp, needs_run in plan:
+        if failed:
+            results.append(StageResult(stage.name, "not run", fingerprint=fp))
+            continue
+        if not needs_run:
+            results.append(StageResult(stage.name, "skipped", fingerprint=fp))
+            continue
+
+        # forget the cached result first: an interrupted run must not look up to date
+        state["stages"].pop(stage.name, None)
+        _save_state(case_root, state)
+
+        t0 = time.perf_counter()
+        rc = runner.run(stage.command, case_root, log_rel=stage.log_rel, timeout=timeout)
+        dt = time.perf_counter() - t0
+        if rc == 0:
+            state["stages"][stage.name] = {
+                "fingerprint": fp,
+                "seconds": round(dt, 3),
+                "finished_at": time.time(),
+            }
+            _save_state(case_root, state)
+            results.append(StageResult(stage.name, "ok", rc, dt, fp))
+        else:
+            failed = True
+            results.append(StageResult(stage.name, "failed", rc, dt, fp))
+    return results
+
+
+def pipeline_report(results: List[StageResult]) -> str:
+    """
+    Format stage results as a text table.
+
+    Args:
+        results (List[StageResult]): Output of `run_pipeline`.
+
+    Returns:
+        str: One line per stage with status, exit code and wall time.
+    """
+    lines = [f"{'stage':<24}{'status':<10}{'exit':>6}{'time [s]':>12}"]
+    for r in results:
+        rc = "" if r.returncode is None else str(r.returncode)
+        lines.append(f"{r.name:<24}{r.status:<10}{rc:>6}{r.seconds:>12.2f}")
+    lines.append(f"{'total':<24}{'':<10}{'':>6}{sum(r.seconds for r in results):>12.2f}")
+    return "\n".join(lines)
@@ -0,0 +1,368 @@
+"""
+Reader for OpenFOAM `constant/polyMesh` with cell-centre computation.
+
+This module reads `points`, `faces`, `owner`, `neighbour` and `boundary`
+(ASCII or binary, optionally gzip-compressed) and computes face centres/area
+vectors and cell centres/volumes with vectorized NumPy operations, following
+OpenFOAM's own decomposition into triangles and pyramids. The cell geometry is
+cached next to the mesh (`constant/polyMesh/carbonfly_geometry.npz`) and
+recomputed when any mesh file changes.
+
+Cell centres and volumes are what field sampling and volume-weighted
+statistics need, without running `postProcess` in OpenFOAM.
+"""
+
+from __future__ import annotations
+
+# carbonfly/polymesh.py
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .utils import (
+    foam_binary_dtypes,
+    read_foam_bytes,
+    read_foam_header,
+    read_foam_list,
+    skip_foam_space,
+)
+
+_MESH_FILES = ("points", "faces", "owner", "neighbour", "boundary")
+_CACHE_NAME = "carbonfly_geometry.npz"
+_VSMALL = 1e-300
+
+
+def _require_numpy() -> None:
+    """Raise a clear error if NumPy is not available."""
+    if np is None:
+        raise RuntimeError("NumPy is required for polyMesh operations.")
+
+
+def mesh_dir_of(path: str | Path) -> Path:
+    """
+    Return the polyMesh folder for a case root or a polyMesh folder.
+
+    Args:
+        path (str | Path): Case root or `constant/polyMesh` folder.
+
+    Returns:
+        Path: `constant/polyMesh` folder.
+    """
+    path = Path(path)
+    if (path / "owner").exists() or (path / "owner.gz").exists():
+        return path
+    return path / "constant" / "polyMesh"
+
+
+def read_boundary(path: str | Path) -> Dict[str, Dict[str, str]]:
+    """
+    Parse an OpenFOAM `constant/polyMesh/boundary` file.
+
+    Args:
+        path (str | Path): Boundary file, polyMesh folder or case root.
+
+    Returns:
+        Dict[str, Dict[str, str]]: Patch name -> raw entries (e.g. type, nFaces, startFace),
+            in file order.
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = mesh_dir_of(path) / "boundary"
+    text = read_foam_bytes(path).decode("utf-8", errors="replace")
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    text = re.sub(r"//[^\n]*", "", text)
+    text = re.sub(r"FoamFile\s*\{[^{}]*\}", "", text, count=1)
+    body = text[text.index("(") + 1 : text.rindex(")")] if "(" in text else ""
+
+    patches: Dict[str, Dict[str, str]] = {}
+    for m in re.finditer(r"([^\s{}();]+)\s*\{([^{}]*)\}", body):
+        entries = re.findall(r"(\w+)\s+([^;]*?)\s*;", m.group(2))
+        patches[m.group(1)] = dict(entries)
+    return patches
+
+
+def _read_label_or_vector_list(path: Path, ncomp: int, scalar: bool):
+    buf = read_foam_bytes(path)
+    header, pos = read_foam_header(buf)
+    binary = header.get("format", "ascii") == "binary"
+    label_dtype, scalar_dtype = (
+        foam_binary_dtypes(header) if binary else (np.int64, np.float64)
+    )
+    arr, _ = read_foam_list(
+        buf, pos, scalar_dtype if scalar else label_dtype, ncomp=ncomp, binary=binary
+    )
+    return arr, header
+
+
+def _walk_face_sizes(flat: "np.ndarray", n: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return (sizes, positions of the sizes) of `n` faces in `flat = [n0, i.., n1, i.., ...]`."""
+    sizes = np.empty(n, dtype=np.int64)
+    heads = np.empty(n, dtype=np.int64)
+    p = 0
+    for f in range(n):
+        k = int(flat[p])
+        sizes[f] = k
+        heads[f] = p
+        p += k + 1
+    return sizes, heads
+
+
+def _read_faces(path: Path) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Read `faces` (faceList or faceCompactList) as (offsets, point indices)."""
+    buf = read_foam_bytes(path)
+    header, pos = read_foam_header(buf)
+    binary = header.get("format", "ascii") == "binary"
+    label_dtype = foam_binary_dtypes(header)[0] if binary else np.int64
+
+    if header.get("class") == "faceCompactList":
+        offsets, pos = read_foam_list(buf, pos, label_dtype, binary=binary)
+        indices, _ = read_foam_list(buf, pos, label_dtype, binary=binary)
+        return offsets.astype(np.int64), indices.astype(np.int64)
+
+    # ASCII faceList: N ( n(i0 i1 ...) n(...) ... )
+    pos = skip_foam_space(buf, pos)
+    m = re.compile(rb"(\d+)\s*\(").match(bytes(buf[pos : pos + 32]))
+    if not m:
+        raise ValueError(f"Unsupported faces format in {path}")
+    n = int(m.group(1))
+    start = pos + m.end()
+    close = np.flatnonzero(np.frombuffer(buf, dtype=np.uint8, offset=start) == ord(")"))
+    if len(close) <= n:
+        raise ValueError(f"Face list in {path} is not closed")
+    body = bytes(buf[start : start + int(close[n])])
+    text = body.replace(b"(", b" ").replace(b")", b" ")
+    flat = np.fromstring(text.decode("ascii"), dtype=np.int64, sep=" ")
+
+    # flat = [n0, i.., n1, i.., ...]: the face sizes are the tokens right before each "("
+    raw = np.frombuffer(text, dtype=np.uint8)
+    space = raw <= 32
+    starts = np.flatnonzero(space[:-1] & ~space[1:]) + 1
+    if raw.size and not space[0]:
+        starts = np.concatenate(([0], starts))
+    opens = np.flatnonzero(np.frombuffer(body, dtype=np.uint8) == ord("("))
+    heads = np.searchsorted(starts, opens) - 1
+    sizes = None
+    if len(starts) == flat.size and len(heads) == n:
+        sizes = flat[heads]
+        expected = np.zeros(n, dtype=np.int64)
+        np.cumsum(sizes[:-1] + 1, out=expected[1:])
+        if not np.array_equal(heads, expected) or flat.size != int(sizes.sum()) + n:
+            sizes = None
+    if sizes is None:
+        sizes, heads = _walk_face_sizes(flat, n)  # unexpected layout
+    keep = np.ones(flat.size, dtype=bool)
+    keep[heads] = False
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    return offsets, flat[keep]
+
+
+@dataclass
+class PolyMesh:
+    """
+    OpenFOAM polyMesh arrays.
+
+    Attributes:
+        points (numpy.ndarray): Point coordinates, shape (nPoints, 3).
+        face_offsets (numpy.ndarray): Start of each face in `face_points`, shape (nFaces + 1,).
+        face_points (numpy.ndarray): Point indices of all faces (compact), shape (sum of sizes,).
+        owner (numpy.ndarray): Owner cell of every face, shape (nFaces,).
+        neighbour (numpy.ndarray): Neighbour cell of every internal face, shape (nInternalFaces,).
+        boundary (Dict[str, Dict[str, str]]): Patches (see `read_boundary`).
+    """
+
+    points: "np.ndarray"
+    face_offsets: "np.ndarray"
+    face_points: "np.ndarray"
+    owner: "np.ndarray"
+    neighbour: "np.ndarray"
+    boundary: Dict[str, Dict[str, str]]
+
+    @property
+    def n_faces(self) -> int:
+        return len(self.face_offsets) - 1
+
+    @property
+    def n_cells(self) -> int:
+        n = int(self.owner.max()) + 1 if self.owner.size else 0
+        if self.neighbour.size:
+            n = max(n, int(self.neighbour.max()) + 1)
+        return n
+
+
+def read_polymesh(path: str | Path) -> PolyMesh:
+    """
+    Read `constant/polyMesh` (ASCII or binary, `.gz` supported).
+
+    Args:
+        path (str | Path): Case root or polyMesh folder.
+
+    Returns:
+        PolyMesh: Mesh arrays.
+
+    Raises:
+        FileNotFoundError: If a mesh file is missing.
+    """
+    _require_numpy()
+    d = mesh_dir_of(path)
+    for name in _MESH_FILES:
+        if not (d / name).exists() and not (d / f"{name}.gz").exists():
+            raise FileNotFoundError(f"{d / name} not found")
+    points, _ = _read_label_or_vector_list(d / "points", 3, scalar=True)
+    offsets, indices = _read_faces(d / "faces")
+    owner, _ = _read_label_or_vector_list(d / "owner", 1, scalar=False)
+    neighbour, _ = _read_label_or_vector_list(d / "neighbour", 1, scalar=False)
+    return PolyMesh(
+        points=np.asarray(points, dtype=np.float64),
+        face_offsets=offsets,
+        face_points=indices,
+        owner=owner.astype(np.int64),
+        neighbour=neighbour.astype(np.int64),
+        boundary=read_boundary(d / "boundary"),
+    )
+
+
+def face_centres_areas(mesh: PolyMesh) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Compute face centres and area vectors like OpenFOAM (triangle fan around the point average).
+
+    Args:
+        mesh (PolyMesh): Mesh arrays.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: (Cf, Sf), both shape (nFaces, 3).
+            Sf points from owner to neighbour (outwards on boundary faces).
+    """
+    _require_numpy()
+    starts = mesh.face_offsets[:-1]
+    sizes = np.diff(mesh.face_offsets)
+    face_of = np.repeat(np.arange(mesh.n_faces), sizes)
+
+    p = mesh.points[mesh.face_points]
+    # next point of every face vertex (wrapping around within the face)
+    nxt = np.arange(len(mesh.face_points)) + 1
+    last = mesh.face_offsets[1:] - 1
+    nxt[last] = starts
+    pn = mesh.points[mesh.face_points[nxt]]
+
+    c_est = np.add.reduceat(p, starts, axis=0) / sizes[:, None]
+    ce = c_est[face_of]
+    n = np.cross(pn - p, ce - p)
+    a = np.linalg.norm(n, axis=1)
+
+    sum_n = np.add.reduceat(n, starts, axis=0)
+    sum_a = np.add.reduceat(a, starts)
+    sum_ac = np.add.reduceat(a[:, None] * (p + pn + ce), starts, axis=0)
+
+    ok = sum_a > _VSMALL
+    cf = c_est.copy()
+    cf[ok] = sum_ac[ok] / (3.0 * sum_a[ok, None])
+    return cf, 0.5 * sum_n
+
+
+def cell_centres_volumes(
+    mesh: PolyMesh, cf: "np.ndarray" = None, sf: "np.ndarray" = None
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Compute cell centres and volumes like OpenFOAM (pyramids on the faces).
+
+    Args:
+        mesh (PolyMesh): Mesh arrays.
+        cf (numpy.ndarray | None): Face centres (computed if None).
+        sf (numpy.ndarray | None): Face area vectors (computed if None).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: (C, V) with shapes (nCells, 3) and (nCells,).
+    """
+    _require_numpy()
+    if cf is None or sf is None:
+        cf, sf = face_centres_areas(mesh)
+    nc = mesh.n_cells
+    own = mesh.owner
+    nei = mesh.neighbour
+    nif = len(nei)
+
+    def accumulate(idx, w):
+        return np.bincount(idx, weights=w, minlength=nc)
+
+    # estimated centre: average of the face centres of each cell
+    n_faces = accumulate(own, None) + accumulate(nei, None)
+    c_est = np.stack(
+        [accumulate(own, cf[:, k]) + accumulate(nei, cf[:nif, k]) for k in range(3)],
+        axis=1,
+    ) / n_faces[:, None]
+
+    # pyramid volumes (x3) and centres for owner and neighbour sides
+    vol_own = np.einsum("ij,ij->i", sf, cf - c_est[own])
+    vol_nei = np.einsum("ij,ij->i", sf[:nif], c_est[nei] - cf[:nif])
+    pc_own = 0.75 * cf + 0.25 * c_est[own]
+    pc_nei = 0.75 * cf[:nif] + 0.25 * c_est[nei]
+
+    vol = accumulate(own, vol_own) + accumulate(nei, vol_nei)
+    ctr = np.stack(
+        [
+            accumulate(own, vol_own * pc_own[:, k]) + accumulate(nei, vol_nei * pc_nei[:, k])
+            for k in range(3)
+        ],
+        axis=1,
+    )
+    ok = np.abs(vol) > _VSMALL
+    cc = c_est.copy()
+    cc[ok] = ctr[ok] / vol[ok, None]
+    return cc, vol / 3.0
+
+
+def mesh_stamp(d: Path) -> "np.ndarray":
+    """
+    Return (mtime_ns, size) of all mesh files, used to invalidate mesh-derived caches.
+
+    Args:
+        d (Path): polyMesh directory.
+
+    Returns:
+        np.ndarray: int64 array of (mtime_ns, size) pairs, in `_MESH_FILES` order.
+    """
+    stamp = []
+    for name in _MESH_FILES:
+        p = d / name if (d / name).exists() else d / f"{name}.gz"
+        st = p.stat()
+        stamp += [st.st_mtime_ns, st.st_size]
+    return np.array(stamp, dtype=np.int64)
+
+
+def load_cell_geometry(path: str | Path, cache: bool = True) -> Dict[str, "np.ndarray"]:
+    """
+    Return cell centres and volumes of a mesh, using the on-disk cache if valid.
+
+    Args:
+        path (str | Path): Case root or polyMesh folder.
+        cache (bool): If True, read/write `<polyMesh>/carbonfly_geometry.npz`. The cache
+            is invalidated when any mesh file's mtime or size changes.
+
+    Returns:
+        Dict[str, numpy.ndarray]: {"centres": (nCells, 3), "volumes": (nCells,)}.
+    """
+    _require_numpy()
+    d = mesh_dir_of(path)
+    stamp = mesh_stamp(d)
+    cache_path = d / _CACHE_NAME
+    if cache and cache_path.exists():
+        try:
+            with np.load(cache_path) as z:
+                if np.array_equal(z["stamp"], stamp):
+                    return {"centres": z["centres"], "volumes": z["volumes"]}
+        except (OSError, ValueError, KeyError):
+            pass  # unreadable cache: recompute
+
+    cc, vol = cell_centres_volumes(read_polymesh(d))
+    if cache:
+        tmp = cache_path.with_name(cache_path.name + ".tmp.npz")
+        np.savez(tmp, stamp=stamp, centres=cc, volumes=vol)
+        tmp.replace(cache_path)
+    return {"centres": cc, "volumes": vol}
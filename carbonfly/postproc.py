@@ -10,13 +10,38 @@ along points or lines.
 from __future__ import annotations
 
 # carbonfly/postproc.py
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
-
-from .utils import foam_header
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple, Union
+import math
+import re
+import time
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .utils import (
+    foam_binary_dtypes,
+    foam_header,
+    read_foam_bytes,
+    read_foam_header,
+    read_foam_list,
+    skip_foam_space,
+)
 from .wsl import win_to_wsl_path, run_wsl_console
 
 
+def _require_numpy() -> None:
+    """Raise a clear error if NumPy is not available."""
+    if np is None:
+        raise RuntimeError("NumPy is required for vectorized post-processing.")
+
+
 def write_internal_probes_dict(
     case_root: str | Path,
     *,
@@ -122,6 +147,136 @@ def run_internal_probes_postprocess(
     )
 
 
+def _vector_bases(columns: List[str]) -> List[str]:
+    """Return the base names of *_x/*_y/*_z column triplets (e.g. "U" for U_x, U_y, U_z)."""
+    vector_bases = []
+    for col in columns:
+        if col.endswith("_x"):
+            base = col[:-2]  # remove "_x"
+            # Check if it also has "_y" and "_z", if so -> vector
+            if f"{base}_y" in columns and f"{base}_z" in columns:
+                vector_bases.append(base)
+    return vector_bases
+
+
+class LazyRows(Sequence):
+    """
+    Read-only sequence of row dicts over a 2-D result array.
+
+    Used as `raw_rows` by the NumPy parser: a row dict is only built when accessed.
+    """
+
+    def __init__(self, columns: List[str], data):
+        self._columns = columns
+        self._data = data
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return dict(zip(self._columns, self._data[i].tolist()))
+
+
+def _tokens_per_line(body: str) -> "np.ndarray":
+    """Return the number of whitespace-separated tokens on each line of `body`."""
+    b = np.frombuffer(body.encode("utf-8"), dtype=np.uint8)
+    space = b <= 32  # blanks, tabs, CR/LF (and other control bytes)
+    starts = np.flatnonzero(space[:-1] & ~space[1:]) + 1
+    if b.size and not space[0]:
+        starts = np.concatenate(([0], starts))
+    newlines = np.flatnonzero(b == 10)
+    return np.bincount(np.searchsorted(newlines, starts), minlength=newlines.size + 1)
+
+
+def _load_columns(fp: Path) -> Tuple[List[str], "np.ndarray"]:
+    """
+    Load a whitespace-separated table with a `# col1 col2 ...` header into a 2-D array.
+
+    The whole body is parsed in one pass (`numpy.fromstring`) if every non-blank
+    line has one value per column. Otherwise (unaligned lines, or text NumPy cannot
+    parse) the table is parsed line by line and unaligned lines are skipped, like
+    `_read_points_xy`.
+
+    Args:
+        fp (Path): Table file.
+
+    Returns:
+        Tuple[List[str], numpy.ndarray]: (columns, data) with data of shape (rows, columns).
+    """
+    _require_numpy()
+    text = fp.read_text(encoding="utf-8")
+    header, _, body = text.partition("\n")
+    columns = header.lstrip("#").split()
+    if not columns:
+        raise ValueError(f"{fp} is empty")
+    ncols = len(columns)
+
+    counts = _tokens_per_line(body)
+    if np.all((counts == ncols) | (counts == 0)):
+        nrows = int(np.count_nonzero(counts))
+        try:
+            with warnings.catch_warnings():
+                # unparsable text: DeprecationWarning and a short result (NumPy 1.x)
+                # or ValueError (NumPy 2.x); both end up on the slow path
+                warnings.simplefilter("error", DeprecationWarning)
+                flat = np.fromstring(body, sep=" ") if nrows else np.empty(0)
+        except (ValueError, DeprecationWarning):
+            flat = None
+        if flat is not None and flat.size == nrows * ncols:
+            return columns, flat.reshape(nrows, ncols)
+
+    # slow path: skip blank and unaligned lines
+    rows = [parts for parts in (ln.split() for ln in body.splitlines()) if len(parts) == ncols]
+    return columns, np.array(rows, dtype=float).reshape(len(rows), ncols)
+
+
+def _read_points_xy_array(fp: Path) -> Dict[str, Any]:
+    """
+    Columnar (NumPy) variant of `_read_points_xy`.
+
+    The file is loaded into one 2-D float array (`data["array"]`). Columns are
+    returned as views into that array without copying: "distance" and each
+    scalar are 1-D views, "points" and each vector are (n, 3) views when their
+    x/y/z columns are adjacent (as written by OpenFOAM). `raw_rows` is a lazy
+    sequence that builds the row dict only when accessed.
+
+    Args:
+        fp (Path): Full path to the 'points.xy' file under 'postProcessing/internalProbes/<time>/'
+
+    Returns:
+        Dict[str, Any]: Same keys as `_read_points_xy` (with NumPy arrays instead of
+            lists), plus "array" (numpy.ndarray, shape (rows, columns)).
+    """
+    columns, data = _load_columns(fp)
+    idx = {c: i for i, c in enumerate(columns)}
+
+    def col(name):
+        return data[:, idx[name]] if name in idx else np.zeros(data.shape[0])
+
+    def triplet(a, b, c):
+        i, j, k = idx.get(a), idx.get(b), idx.get(c)
+        if i is not None and j == i + 1 and k == i + 2:
+            return data[:, i : i + 3]  # view
+        return np.column_stack([col(a), col(b), col(c)])
+
+    vector_bases = _vector_bases(columns)
+    skip_cols = {"distance", "x", "y", "z"}
+    for base in vector_bases:
+        skip_cols.update((f"{base}_x", f"{base}_y", f"{base}_z"))
+
+    return {
+        "columns": columns,
+        "points": triplet("x", "y", "z"),
+        "distance": col("distance"),
+        "scalars": {c: data[:, i] for c, i in idx.items() if c not in skip_cols},
+        "vectors": {b: triplet(f"{b}_x", f"{b}_y", f"{b}_z") for b in vector_bases},
+        "raw_rows": LazyRows(columns, data),
+        "array": data,
+    }
+
+
 def _read_points_xy(fp: Path) -> Dict[str, Any]:
     """
     Parse OpenFOAM postProcessing/internalProbes/<time>/points.xy
@@ -208,13 +363,7 @@ def _read_points_xy(fp: Path) -> Dict[str, Any]:
     vectors: Dict[str, List[Tuple[float, float, float]]] = {}
 
     # Find all columns ending with "_x"
-    vector_bases = []
-    for col in columns:
-        if col.endswith("_x"):
-            base = col[:-2]  # remove "_x"
-            # Check if it also has "_y" and "_z", if so -> vector
-            if f"{base}_y" in columns and f"{base}_z" in columns:
-                vector_bases.append(base)
+    vector_bases = _vector_bases(columns)
 
     # Vectors
     for base in vector_bases:
@@ -248,9 +397,33 @@ def _read_points_xy(fp: Path) -> Dict[str, Any]:
     }
 
 
+def list_time_dirs(base: Path) -> List[Path]:
+    """
+    List the time directories under `base`, sorted by time.
+
+    Directories whose name is not a number are ignored.
+
+    Args:
+        base (Path): Folder containing time directories (e.g. postProcessing/internalProbes).
+
+    Returns:
+        List[Path]: Time directories in ascending time order.
+    """
+    dirs = []
+    for d in base.iterdir():
+        if not d.is_dir():
+            continue
+        try:
+            dirs.append((float(d.name), d))
+        except ValueError:
+            continue
+    return [d for _, d in sorted(dirs)]
+
+
 def collect_internal_probes_results(
     case_root: str | Path,
     which: Union[str, int] = "latest",
+    vectorized: bool = False,
 ) -> Dict[str, Any]:
     """
     Read one sampled result from postProcessing/internalProbes/<time>/points.xy.
@@ -261,6 +434,9 @@ def collect_internal_probes_results(
             - "latest" or "last": read the last (usually largest) time directory
             - int >= 0: read the N-th directory in sorted order (0 = first)
             - int < 0: read from the end (-1 = last, -2 = second last, ...)
+        vectorized (bool): If True, parse with NumPy (`_read_points_xy_array`): columns
+            are array views and `raw_rows` is built lazily. Much faster for large
+            probe grids. Requires NumPy.
 
     Returns:
         Dict[str, Any]: {
@@ -280,14 +456,11 @@ def collect_internal_probes_results(
     if not base.exists():
         raise FileNotFoundError(f"{base} not found. Please check your input.")
 
-    # collect all time dirs
-    dirs: List[Path] = [d for d in base.iterdir() if d.is_dir()]
+    # collect all time dirs (sorted by time)
+    dirs = list_time_dirs(base)
     if not dirs:
         raise FileNotFoundError(f"No time dirs under {base}")
 
-    # sort by name
-    dirs = sorted(dirs, key=lambda p: float(p.name))
-
     # pick which one
     if isinstance(which, str):
         w = which.lower()
@@ -308,9 +481,458 @@ def collect_internal_probes_results(
     if not points_file.exists():
         raise FileNotFoundError(f"{points_file} not found")
 
-    parsed = _read_points_xy(points_file)
+    parsed = _read_points_xy_array(points_file) if vectorized else _read_points_xy(points_file)
 
     return {
         "time_dir": selected_dir.name,
         "data": parsed,
     }
+
+
+def collect_internal_probes_series(
+    case_root: str | Path,
+    time_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+    stride: int = 1,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Read postProcessing/internalProbes/<time>/points.xy of all time directories
+    into one (time, point, column) array.
+
+    The time directories are listed once. Each file is parsed with the NumPy
+    columnar parser (see `_read_points_xy_array`), optionally on a thread pool.
+    All files must have the same columns and number of points.
+
+    Args:
+        case_root (str | Path): OpenFOAM case root directory.
+        time_range (Tuple[float | None, float | None] | None): Inclusive (t_min, t_max)
+            filter. None (or a None bound) means unbounded.
+        stride (int): Read only every `stride`-th time directory (after filtering).
+        workers (int | None): Number of threads used to parse files. None or 1 reads serially.
+
+    Returns:
+        Dict[str, Any]: {
+            "times": numpy.ndarray (T,),
+            "time_dirs": [time directory names],
+            "columns": [...],
+            "points": numpy.ndarray (P, 3), from the first time directory,
+            "distance": numpy.ndarray (P,),
+            "array": numpy.ndarray (T, P, C), all columns,
+            "scalars": {name: numpy.ndarray (T, P)},
+            "vectors": {name: numpy.ndarray (T, P, 3)},
+        }
+        "scalars"/"vectors" follow the same split as `_read_points_xy` and are
+        views into "array" where possible.
+
+    Raises:
+        FileNotFoundError: If no matching points.xy files exist.
+        ValueError: If columns or point counts differ between time directories.
+    """
+    _require_numpy()
+    if stride < 1:
+        raise ValueError("stride must be >= 1")
+    base = Path(case_root) / "postProcessing" / "internalProbes"
+    if not base.exists():
+        raise FileNotFoundError(f"{base} not found. Please check your input.")
+
+    t_min, t_max = time_range or (None, None)
+    dirs = [
+        d
+        for d in list_time_dirs(base)
+        if (t_min is None or float(d.name) >= t_min)
+        and (t_max is None or float(d.name) <= t_max)
+        and (d / "points.xy").is_file()
+    ][::stride]
+    if not dirs:
+        raise FileNotFoundError(f"No points.xy files under {base} for the given time range")
+
+    files = [d / "points.xy" for d in dirs]
+    if workers is not None and workers > 1:
+        with ThreadPoolExecutor(max_workers=int(workers)) as pool:
+            loaded = list(pool.map(_load_columns, files))
+    else:
+        loaded = [_load_columns(f) for f in files]
+
+    columns, first = loaded[0]
+    for f, (cols, data) in zip(files, loaded):
+        if cols != columns:
+            raise ValueError(f"Columns of {f} differ from {files[0]}")
+        if data.shape != first.shape:
+            raise ValueError(
+                f"{f} has {data.shape[0]} points, {files[0]} has {first.shape[0]}"
+            )
+    array = np.stack([data for _, data in loaded])
+    del loaded
+
+    idx = {c: i for i, c in enumerate(columns)}
+
+    def triplet(a, b, c):
+        i, j, k = idx.get(a), idx.get(b), idx.get(c)
+        if i is not None and j == i + 1 and k == i + 2:
+            return array[..., i : i + 3]  # view
+        return np.stack([array[..., idx[n]] for n in (a, b, c)], axis=-1)
+
+    vector_bases = _vector_bases(columns)
+    skip_cols = {"distance", "x", "y", "z"}
+    for b in vector_bases:
+        skip_cols.update((f"{b}_x", f"{b}_y", f"{b}_z"))
+
+    points = (
+        triplet("x", "y", "z")[0]
+        if all(c in idx for c in ("x", "y", "z"))
+        else np.zeros((array.shape[1], 3))
+    )
+    return {
+        "times": np.array([float(d.name) for d in dirs]),
+        "time_dirs": [d.name for d in dirs],
+        "columns": columns,
+        "points": points,
+        "distance": (
+            array[0, :, idx["distance"]]
+            if "distance" in idx
+            else np.zeros(array.shape[1])
+        ),
+        "array": array,
+        "scalars": {c: array[..., i] for c, i in idx.items() if c not in skip_cols},
+        "vectors": {b: triplet(f"{b}_x", f"{b}_y", f"{b}_z") for b in vector_bases},
+    }
+
+
+def read_final_residuals(case_root: str | Path) -> Dict[str, float]:
+    """
+    Read the last row of postProcessing/residuals/<time>/residuals.dat.
+
+    If the solver was restarted, the latest time directory is used. Columns
+    without a value (`N/A`) are omitted.
+
+    Args:
+        case_root (str | Path): OpenFOAM case root directory.
+
+    Returns:
+        Dict[str, float]: Column name -> value of the last row, including "Time".
+            Empty if no residuals were written yet.
+    """
+    base = Path(case_root) / "postProcessing" / "residuals"
+    if not base.is_dir():
+        return {}
+    dirs = [d for d in list_time_dirs(base) if (d / "residuals.dat").is_file()]
+    if not dirs:
+        return {}
+
+    columns: List[str] = []
+    last: List[str] = []
+    with open(dirs[-1] / "residuals.dat", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("#"):
+                parts = line.lstrip("#").split()
+                if parts and parts[0] == "Time":
+                    columns = parts
+            elif line.strip():
+                last = line.split()
+
+    out: Dict[str, float] = {}
+    for col, val in zip(columns, last):
+        try:
+            out[col] = float(val)
+        except ValueError:
+            continue  # N/A
+    return out
+
+
+# Live monitoring (follow/tail readers)
+def _parse_table_values(line: str) -> List[float]:
+    """Parse one data line of an OpenFOAM table (vectors in parentheses, `N/A` -> NaN)."""
+    out = []
+    for tok in line.replace("(", " ").replace(")", " ").split():
+        try:
+            out.append(float(tok))
+        except ValueError:
+            out.append(math.nan)
+    return out
+
+
+class TableFollower:
+    """
+    Incrementally read a growing OpenFOAM table file (e.g. residuals.dat or a probes file).
+
+    The reader remembers its byte offset, so every `poll()` only reads what was
+    appended since the previous call. A trailing line without newline is left
+    for the next poll. If the file shrinks (rewritten), it is read from the start.
+
+    Attributes:
+        path (Path): Followed file.
+        columns (List[str]): Column names from the last `# Time ...` header line
+            (for probes files: "Time" followed by the probe indices).
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.columns: List[str] = []
+        self._offset = 0
+        self._probes: List[str] = []
+
+    def poll(self) -> List[List[float]]:
+        """
+        Read the rows appended since the last call.
+
+        Returns:
+            List[List[float]]: New data rows (values flattened, vectors as 3 values).
+        """
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return []
+        if size < self._offset:
+            self._offset = 0  # file was rewritten
+            self.columns = []
+            self._probes = []
+        if size == self._offset:
+            return []
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(size - self._offset)
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return []  # no complete line yet
+        self._offset += end + 1
+
+        rows: List[List[float]] = []
+        for line in chunk[: end + 1].decode("utf-8", errors="replace").splitlines():
+            if line.startswith("#"):
+                parts = line.lstrip("#").split()
+                if len(parts) > 1 and parts[0] == "Probe" and parts[1].isdigit():
+                    self._probes.append(parts[1])  # "# Probe <index> (<x> <y> <z>)"
+                elif parts and parts[0] == "Time":
+                    self.columns = parts if len(parts) > 1 else ["Time"] + self._probes
+            elif line.strip():
+                rows.append(_parse_table_values(line))
+        return rows
+
+
+class ResidualsFollower:
+    """
+    Follow postProcessing/residuals/<time>/residuals.dat of a running case.
+
+    New time directories (solver restarts) are picked up automatically.
+    """
+
+    def __init__(self, case_root: str | Path):
+        self.base = Path(case_root) / "postProcessing" / "residuals"
+        self._tails: Dict[str, TableFollower] = {}
+
+    def poll(self) -> List[Dict[str, float]]:
+        """
+        Read the residual rows appended since the last call.
+
+        Returns:
+            List[Dict[str, float]]: One dict per new row (column name -> value, `N/A` -> NaN).
+        """
+        if not self.base.is_dir():
+            return []
+        out: List[Dict[str, float]] = []
+        for d in list_time_dirs(self.base):
+            tail = self._tails.get(d.name)
+            if tail is None:
+                tail = self._tails[d.name] = TableFollower(d / "residuals.dat")
+            for row in tail.poll():
+                out.append(dict(zip(tail.columns, row)))
+        return out
+
+
+class InternalProbesFollower:
+    """
+    Follow postProcessing/internalProbes/<time>/ of a running case.
+
+    Each poll reports only time directories not seen before. A new directory is
+    reported once its points.xy exists and its size is unchanged since the
+    previous poll (i.e. OpenFOAM finished writing it).
+
+    Attributes:
+        seen (set): Time directory names already reported.
+    """
+
+    def __init__(
+        self,
+        case_root: str | Path,
+        vectorized: bool = False,
+        skip_existing: bool = False,
+    ):
+        """
+        Args:
+            case_root (str | Path): OpenFOAM case root directory.
+            vectorized (bool): Parse with the NumPy columnar parser (see `_read_points_xy_array`).
+            skip_existing (bool): If True, time directories existing now are never reported.
+        """
+        self.base = Path(case_root) / "postProcessing" / "internalProbes"
+        self.vectorized = vectorized
+        self.seen = set()
+        self._sizes: Dict[str, int] = {}
+        if skip_existing and self.base.is_dir():
+            self.seen.update(d.name for d in list_time_dirs(self.base))
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Read the time directories completed since the last call.
+
+        Returns:
+            List[Dict[str, Any]]: `{"time_dir": ..., "data": ...}` per new directory
+                (as returned by `collect_internal_probes_results`), in time order.
+        """
+        if not self.base.is_dir():
+            return []
+        out = []
+        for d in list_time_dirs(self.base):
+            if d.name in self.seen:
+                continue
+            fp = d / "points.xy"
+            try:
+                size = fp.stat().st_size
+            except FileNotFoundError:
+                continue
+            if size == 0 or self._sizes.get(d.name) != size:
+                self._sizes[d.name] = size  # check again next poll
+                continue
+            parsed = _read_points_xy_array(fp) if self.vectorized else _read_points_xy(fp)
+            self.seen.add(d.name)
+            self._sizes.pop(d.name, None)
+            out.append({"time_dir": d.name, "data": parsed})
+        return out
+
+
+def follow(
+    follower,
+    interval: float = 2.0,
+    timeout: Optional[float] = None,
+) -> Iterator[Any]:
+    """
+    Yield new items of a follower (`TableFollower`, `ResidualsFollower`,
+    `InternalProbesFollower`) as they appear.
+
+    Args:
+        follower: Object with a `poll()` method returning a list of new items.
+        interval (float): Seconds to sleep between polls.
+        timeout (float | None): Stop after this many seconds without new items.
+            If None, follow forever (stop by closing the generator).
+
+    Yields:
+        Any: Items returned by `follower.poll()`, one at a time.
+    """
+    idle_since = time.monotonic()
+    while True:
+        items = follower.poll()
+        if items:
+            idle_since = time.monotonic()
+            yield from items
+        elif timeout is not None and time.monotonic() - idle_since >= timeout:
+            return
+        else:
+            time.sleep(interval)
+
+
+# Reading OpenFOAM field files directly
+_FIELD_COMPONENTS = {
+    "Scalar": 1,
+    "Vector": 3,
+    "SphericalTensor": 1,
+    "SymmTensor": 6,
+    "Tensor": 9,
+}
+_RE_FIELD_CLASS = re.compile(r"(?:vol|surface|point)(\w+?)Field")
+
+
+@dataclass
+class FoamField:
+    """
+    Values of an OpenFOAM field file (internalField only).
+
+    Attributes:
+        name (str): Field name (FoamFile `object`).
+        field_class (str): FoamFile class, e.g. `volScalarField`.
+        dimensions (str): Dimension set, e.g. `[0 0 0 1 0 0 0]`.
+        uniform (bool): True for `internalField uniform ...`.
+        values (numpy.ndarray): Shape (N,) or (N, ncomp) for non-uniform fields;
+            shape () or (ncomp,) for uniform fields. Binary fields read with
+            `mmap=True` are read-only views into the memory-mapped file.
+    """
+
+    name: str
+    field_class: str
+    dimensions: str
+    uniform: bool
+    values: "np.ndarray"
+
+    def expand(self, n_cells: int) -> "np.ndarray":
+        """Return per-cell values (uniform values broadcast without copying)."""
+        if self.uniform:
+            return np.broadcast_to(self.values, (int(n_cells),) + self.values.shape)
+        return self.values
+
+
+def read_foam_field(path: str | Path, mmap: bool = False) -> FoamField:
+    """
+    Read the internalField of an OpenFOAM field file (e.g. `<case>/<time>/CO2`).
+
+    Supports ASCII and binary files, `uniform` values, `nonuniform List<...>`
+    (including the `N{value}` form) and gzip-compressed files (`CO2.gz`).
+    Binary payloads are decoded without copying (`numpy.frombuffer`).
+
+    Args:
+        path (str | Path): Field file path. If it does not exist, `<path>.gz` is tried.
+        mmap (bool): If True, memory-map the file instead of reading it, so large
+            binary fields are only paged in when accessed. Ignored for `.gz` files.
+
+    Returns:
+        FoamField: Parsed field.
+
+    Raises:
+        FileNotFoundError: If neither the file nor `<path>.gz` exists.
+        ValueError: If the file is not a supported OpenFOAM field.
+    """
+    _require_numpy()
+    path = Path(path)
+    if not path.exists() and not path.with_name(path.name + ".gz").exists():
+        raise FileNotFoundError(f"{path} not found")
+    buf = read_foam_bytes(path, mmap)
+    header, pos = read_foam_header(buf)
+
+    field_class = header.get("class", "")
+    m = _RE_FIELD_CLASS.fullmatch(field_class)
+    if not m or m.group(1) not in _FIELD_COMPONENTS:
+        raise ValueError(f"Unsupported field class {field_class!r} in {path}")
+    ncomp = _FIELD_COMPONENTS[m.group(1)]
+    binary = header.get("format", "ascii") == "binary"
+    _, scalar_dtype = foam_binary_dtypes(header) if binary else (None, np.float64)
+
+    dims = ""
+    i = buf.find(b"dimensions", pos)
+    if i >= 0:
+        dims = bytes(buf[i + len(b"dimensions") : buf.find(b";", i)]).decode().strip()
+
+    i = buf.find(b"internalField", pos)
+    if i < 0:
+        raise ValueError(f"No internalField in {path}")
+    pos = skip_foam_space(buf, i + len(b"internalField"))
+
+    if buf[pos : pos + 7] == b"uniform":
+        end = buf.find(b";", pos)
+        text = bytes(buf[pos + 7 : end]).replace(b"(", b" ").replace(b")", b" ")
+        values = np.array(text.split(), dtype=np.float64)
+        values = values.reshape(()) if ncomp == 1 else values
+        uniform = True
+    elif buf[pos : pos + 10] == b"nonuniform":
+        pos = skip_foam_space(buf, pos + 10)
+        if buf[pos : pos + 4] == b"List":
+            pos = buf.find(b">", pos) + 1
+        values, _ = read_foam_list(buf, pos, scalar_dtype, ncomp=ncomp, binary=binary)
+        uniform = False
+    else:
+        raise ValueError(f"Unsupported internalField form in {path}")
+
+    return FoamField(
+        name=header.get("object", path.name),
+        field_class=field_class,
+        dimensions=dims,
+        uniform=uniform,
+        values=values,
+    )
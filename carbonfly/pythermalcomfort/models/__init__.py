@@ -1,7 +1,9 @@
 from .two_nodes_gagge import two_nodes_gagge
+from .two_nodes_gagge_array import two_nodes_gagge_array
 from .two_nodes_gagge_sleep import two_nodes_gagge_sleep
 
 __all__ = [
     "two_nodes_gagge",
+    "two_nodes_gagge_array",
     "two_nodes_gagge_sleep",
 ]
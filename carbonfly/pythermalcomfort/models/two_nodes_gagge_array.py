@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .two_nodes_gagge import POSTURE_SITTING, POSTURE_STANDING, met_to_w_m2
+
+
+def _require_numpy() -> None:
+    """Raise a clear error if NumPy is not available."""
+    if np is None:
+        raise RuntimeError("NumPy is required for two_nodes_gagge_array.")
+
+
+def _p_sat_torr(tdb):
+    """Saturation vapor pressure [torr], elementwise (see `p_sat_torr`)."""
+    return np.exp(18.6686 - 4030.183 / (tdb + 235.0))
+
+
+def _solve_set_like(t_skin, q_skin, w, p_s_sk, h_d, h_e, start):
+    """
+    Secant iteration shared by SET and ET, advanced only for unconverged elements.
+
+    Solves q_skin = h_d * (t_skin - x) + w * h_e * (p_s_sk - 0.5 * p_sat(x)) for x,
+    with the same step (1e-4) and stopping rule (|dx| <= 0.01) as the scalar model.
+    """
+    delta = 1e-4
+    x = start.copy()
+    idx = np.arange(x.size)
+    while idx.size:
+        x0 = x[idx]
+        ts, qs, ww, ps, hd, he = t_skin[idx], q_skin[idx], w[idx], p_s_sk[idx], h_d[idx], h_e[idx]
+        err_1 = qs - hd * (ts - x0) - ww * he * (ps - 0.5 * _p_sat_torr(x0))
+        err_2 = qs - hd * (ts - (x0 + delta)) - ww * he * (ps - 0.5 * _p_sat_torr(x0 + delta))
+        x1 = x0 - delta * err_1 / (err_2 - err_1)
+        x[idx] = x1
+        idx = idx[np.abs(x1 - x0) > 0.01]
+    return x
+
+
+def two_nodes_gagge_array(
+    tdb,
+    tr,
+    v,
+    rh,
+    met,
+    clo,
+    wme=0.0,
+    body_surface_area=1.8258,
+    p_atm=101325.0,
+    position=POSTURE_STANDING,
+    max_skin_blood_flow=90.0,
+    round_output: bool = True,
+    max_sweating=500.0,
+    w_max=None,
+    calculate_ce: bool = False,
+) -> Dict[str, Any]:
+    """
+    NumPy-vectorised Gagge Two-Node model (Gagge et al., 1986) over arrays of conditions.
+
+    All conditions are advanced together through the 60 one-minute steps. The
+    clothing temperature fixed point and the SET/ET secant iterations are only
+    continued for the elements that have not converged yet. Results match
+    `two_nodes_gagge` evaluated element by element (up to rounding).
+
+    Parameters
+    ----------
+    tdb, tr, v, rh, met, clo, wme, body_surface_area, p_atm, max_skin_blood_flow, max_sweating : array_like
+        Same meaning and units as in `two_nodes_gagge`. Scalars and arrays are
+        broadcast to a common shape.
+    position : str or array_like of str
+        "sitting" or "standing", per element or for all.
+    round_output : bool
+        If True, round all outputs to 2 decimals.
+    w_max : array_like or None
+        Maximum skin wettedness. If None, it is derived from clothing and air speed.
+    calculate_ce : bool
+        Same as in `two_nodes_gagge` (applies to all elements).
+
+    Returns
+    -------
+    dict
+        Same keys as `two_nodes_gagge`; each value is a numpy.ndarray with the
+        broadcast shape of the inputs.
+
+    Raises
+    ------
+    RuntimeError
+        If NumPy is not available, or if the clothing temperature iteration
+        does not converge for some element.
+    """
+    _require_numpy()
+
+    area_ratio = np.where(np.asarray(position) == POSTURE_SITTING, 0.7, 0.73)
+    args = [tdb, tr, v, rh, met, clo, wme, body_surface_area, p_atm,
+            max_skin_blood_flow, max_sweating, area_ratio]
+    if w_max is not None:
+        args.append(w_max)
+    arrays = np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in args])
+    shape = arrays[0].shape
+    (tdb, tr, v, rh, met, clo, wme, body_surface_area, p_atm,
+     max_skin_blood_flow, max_sweating, area_ratio) = [a.ravel() for a in arrays[:12]]
+    n = tdb.size
+
+    vapor_pressure = rh * _p_sat_torr(tdb) / 100.0
+
+    air_speed = np.maximum(v, 0.1)
+    k_clo = 0.25
+    body_weight = 70.0
+    met_factor = met_to_w_m2
+    sbc = 5.6697e-8
+    c_sw = 170.0
+    c_dil = 120.0
+    c_str = 0.5
+
+    temp_skin_neutral = 33.7
+    temp_core_neutral = 36.8
+    alfa = np.full(n, 0.1)
+    temp_body_neutral = 0.1 * temp_skin_neutral + 0.9 * temp_core_neutral
+    skin_blood_flow_neutral = 6.3
+
+    t_skin = np.full(n, temp_skin_neutral)
+    t_core = np.full(n, temp_core_neutral)
+    m_bl = np.full(n, skin_blood_flow_neutral)
+    e_skin = 0.1 * met
+
+    pressure_in_atm = p_atm / 101325.0
+    sim_minutes = 60
+
+    r_clo = 0.155 * clo
+    f_a_cl = 1.0 + 0.15 * clo
+    lr = 2.2 / pressure_in_atm
+    rm = (met - wme) * met_factor
+    m = met * met_factor
+
+    e_comfort = np.maximum(0.42 * (rm - met_factor), 0.0)
+
+    clothed = clo > 0.0
+    i_cl = np.where(clothed, 0.45, 1.0)
+
+    if w_max is None:
+        w_max = np.where(clothed, 0.59 * air_speed ** -0.08, 0.38 * air_speed ** -0.29)
+    else:
+        w_max = arrays[12].ravel()
+
+    # metabolic free convection (only where met > 0.85)
+    h_c_met = 5.66 * np.maximum(met - 0.85, 0.0) ** 0.39
+    use_met = (met > 0.85) if not calculate_ce else np.zeros(n, dtype=bool)
+
+    h_cc = 3.0 * pressure_in_atm ** 0.53
+    h_fc = 8.600001 * (air_speed * pressure_in_atm) ** 0.53
+    h_cc = np.maximum(h_cc, h_fc)
+    h_cc = np.where(use_met, np.maximum(h_cc, h_c_met), h_cc)
+
+    h_r = np.full(n, 4.7)
+    h_t = h_r + h_cc
+    r_a = 1.0 / (f_a_cl * h_t)
+    t_op = (h_r * tr + h_cc * tdb) / h_t
+
+    t_body = alfa * t_skin + (1.0 - alfa) * t_core
+
+    q_res = 0.0023 * m * (44.0 - vapor_pressure)
+    c_res = 0.0014 * m * (34.0 - tdb)
+
+    # evaporative resistances do not change over time
+    r_ea = 1.0 / (lr * f_a_cl * h_cc)
+    r_ecl = r_clo / (lr * i_cl)
+
+    for _ in range(sim_minutes):
+        # clothing surface temperature (fixed point on unconverged elements only)
+        t_cl = (r_a * t_skin + r_clo * t_op) / (r_a + r_clo)
+        idx = np.arange(n)
+        for _iter in range(150):
+            tc = t_cl[idx]
+            hr = 4.0 * 0.95 * sbc * (((tc + tr[idx]) / 2.0 + 273.15) ** 3.0) * area_ratio[idx]
+            ht = hr + h_cc[idx]
+            ra = 1.0 / (f_a_cl[idx] * ht)
+            top = (hr * tr[idx] + h_cc[idx] * tdb[idx]) / ht
+            tc_new = (ra * t_skin[idx] + r_clo[idx] * top) / (ra + r_clo[idx])
+            h_r[idx], r_a[idx], t_op[idx], t_cl[idx] = hr, ra, top, tc_new
+            idx = idx[~(np.abs(tc_new - tc) <= 0.01)]
+            if not idx.size:
+                break
+        else:
+            raise RuntimeError("Clothing temperature iteration did not converge.")
+
+        q_sensible = (t_skin - t_op) / (r_a + r_clo)
+        hf_cs = (t_core - t_skin) * (5.28 + 1.163 * m_bl)
+        s_core = m - hf_cs - q_res - c_res - wme
+        s_skin = hf_cs - q_sensible - e_skin
+        tc_sk = 0.97 * alfa * body_weight
+        tc_cr = 0.97 * (1.0 - alfa) * body_weight
+        t_skin = t_skin + (s_skin * body_surface_area) / (tc_sk * 60.0)
+        t_core = t_core + (s_core * body_surface_area) / (tc_cr * 60.0)
+        t_body = alfa * t_skin + (1.0 - alfa) * t_core
+
+        # control signals
+        sk_sig = t_skin - temp_skin_neutral
+        warm_sk = np.maximum(sk_sig, 0.0)
+        colds = np.maximum(-sk_sig, 0.0)
+        c_reg_sig = t_core - temp_core_neutral
+        c_warm = np.maximum(c_reg_sig, 0.0)
+        c_cold = np.maximum(-c_reg_sig, 0.0)
+        warm_b = np.maximum(t_body - temp_body_neutral, 0.0)
+
+        # blood flow
+        m_bl = (skin_blood_flow_neutral + c_dil * c_warm) / (1.0 + c_str * colds)
+        m_bl = np.maximum(np.minimum(m_bl, max_skin_blood_flow), 0.5)
+
+        # sweating
+        m_rsw = np.minimum(c_sw * warm_b * np.exp(warm_sk / 10.7), max_sweating)
+        e_rsw = 0.68 * m_rsw
+
+        # evaporative caps
+        e_req = rm - q_res - c_res - q_sensible
+        e_max = (_p_sat_torr(t_skin) - vapor_pressure) / (r_ea + r_ecl)
+        e_max = np.where(e_max == 0.0, 1e-3, e_max)
+
+        p_rsw = e_rsw / e_max
+        w = 0.06 + 0.94 * p_rsw
+        e_diff = w * e_max - e_rsw
+        capped = w > w_max
+        w = np.where(capped, w_max, w)
+        p_rsw = np.where(capped, w_max / 0.94, p_rsw)
+        e_rsw = np.where(capped, p_rsw * e_max, e_rsw)
+        e_diff = np.where(capped, 0.06 * (1.0 - p_rsw) * e_max, e_diff)
+        negative = e_max < 0.0
+        e_diff = np.where(negative, 0.0, e_diff)
+        e_rsw = np.where(negative, 0.0, e_rsw)
+        w = np.where(negative, w_max, w)
+
+        e_skin = e_rsw + e_diff
+        m_rsw = e_rsw / 0.68
+        m = rm + 19.4 * colds * c_cold
+        alfa = 0.0417737 + 0.7451833 / (m_bl + 0.585417)
+
+    q_skin = q_sensible + e_skin
+    p_s_sk = _p_sat_torr(t_skin)
+
+    # standard environment (for SET)
+    h_r_s = h_r
+    h_c_s = np.full(n, 3.0) * pressure_in_atm ** 0.53
+    h_c_s = np.where(use_met, np.maximum(h_c_s, h_c_met), h_c_s)
+    h_c_s = np.maximum(h_c_s, 3.0)
+    h_t_s = h_c_s + h_r_s
+
+    r_clo_s = 1.52 / ((met - wme / met_factor) + 0.6944) - 0.1835
+    r_cl_s = 0.155 * r_clo_s
+    f_a_cl_s = 1.0 + k_clo * r_clo_s
+    f_cl_s = 1.0 / (1.0 + 0.155 * f_a_cl_s * h_t_s * r_clo_s)
+    i_m_s = 0.45
+    i_cl_s = i_m_s * h_c_s / h_t_s * (1 - f_cl_s) / (h_c_s / h_t_s - f_cl_s * i_m_s)
+    r_a_s = 1.0 / (f_a_cl_s * h_t_s)
+    r_ea_s = 1.0 / (lr * f_a_cl_s * h_c_s)
+    r_ecl_s = r_cl_s / (lr * i_cl_s)
+    h_d_s = 1.0 / (r_a_s + r_cl_s)
+    h_e_s = 1.0 / (r_ea_s + r_ecl_s)
+
+    _set = _solve_set_like(
+        t_skin, q_skin, w, p_s_sk, h_d_s, h_e_s, np.round(t_skin - q_skin / h_d_s, 2)
+    )
+
+    h_d = 1.0 / (r_a + r_clo)
+    h_e = 1.0 / (r_ea + r_ecl)
+    et = _solve_set_like(t_skin, q_skin, w, p_s_sk, h_d, h_e, t_skin - q_skin / h_d)
+
+    # thermal sensation & discomfort
+    tbm_l = (0.194 / met_to_w_m2) * rm + 36.301
+    tbm_h = (0.347 / met_to_w_m2) * rm + 36.669
+
+    t_sens = 0.4685 * (t_body - tbm_l)
+    t_sens = np.where(
+        (t_body >= tbm_l) & (t_body < tbm_h),
+        w_max * 4.7 * (t_body - tbm_l) / (tbm_h - tbm_l),
+        t_sens,
+    )
+    t_sens = np.where(t_body >= tbm_h, w_max * 4.7 + 0.4685 * (t_body - tbm_h), t_sens)
+
+    den = e_max * w_max - e_comfort - e_diff
+    with np.errstate(divide="ignore", invalid="ignore"):
+        disc = np.where(den != 0, 4.7 * (e_rsw - e_comfort) / den, t_sens)
+    disc = np.where(disc <= 0.0, t_sens, disc)
+
+    # PMV (Gagge and SET-based)
+    pmv_factor = 0.303 * np.exp(-0.036 * m) + 0.028
+    pmv_gagge = pmv_factor * (e_req - e_comfort - e_diff)
+    dry_set = h_d_s * (t_skin - _set)
+    e_req_set = rm - c_res - q_res - dry_set
+    pmv_set = pmv_factor * (e_req_set - e_comfort - e_diff)
+
+    out = {
+        "e_skin": e_skin,
+        "e_rsw": e_rsw,
+        "e_max": e_max,
+        "q_sensible": q_sensible,
+        "q_skin": q_skin,
+        "q_res": q_res,
+        "t_core": t_core,
+        "t_skin": t_skin,
+        "m_bl": m_bl,
+        "m_rsw": m_rsw,
+        "w": w,
+        "w_max": w_max,
+        "set": _set,
+        "et": et,
+        "pmv_gagge": pmv_gagge,
+        "pmv_set": pmv_set,
+        "disc": disc,
+        "t_sens": t_sens,
+    }
+    for k, val in out.items():
+        val = np.broadcast_to(val, (n,)).reshape(shape)
+        out[k] = np.round(val, 2) if round_output else val.copy()
+    return out
@@ -0,0 +1,193 @@
+"""
+Backend-neutral runners for OpenFOAM commands.
+
+Unlike the console launchers in `carbonfly.wsl`, these runners execute the
+command directly with `subprocess`, write stdout/stderr to a log file in
+the case folder and return the real exit code of the OpenFOAM command. They
+are meant for batch use, e.g. on Linux compute nodes with a native OpenFOAM
+installation or in scripted runs on Windows + WSL.
+
+Examples:
+    runner = get_runner("auto")
+    rc = runner.run("blockMesh", case_root, log_rel="system/blockMesh.run.log")
+"""
+
+from __future__ import annotations
+
+# carbonfly/runner.py
+import abc
+import os
+import shlex
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    from subprocess import CREATE_NO_WINDOW
+except ImportError:  # non-Windows
+    CREATE_NO_WINDOW = 0
+
+from .wsl import win_to_wsl_path
+
+
+@dataclass
+class FoamRunner(abc.ABC):
+    """
+    Base runner: run a shell command in a case folder with OpenFOAM sourced.
+
+    Subclasses only define how the bash process is started (`argv`) and how
+    case paths are seen by that bash (`to_runner_path`).
+
+    Attributes:
+        foam_bashrc (str | None): OpenFOAM bashrc to source before the command.
+            If None, no sourcing is done.
+    """
+
+    foam_bashrc: Optional[str] = "/opt/openfoam10/etc/bashrc"
+
+    def to_runner_path(self, p: str | Path) -> str:
+        """Return `p` as seen by the runner's bash."""
+        return str(p)
+
+    def script(self, command: str, case_root: str | Path) -> str:
+        """
+        Return the bash script that runs `command` inside `case_root`.
+
+        The exit status of the script is the exit status of `command`.
+        """
+        parts = []
+        if self.foam_bashrc:
+            parts.append(f"source {shlex.quote(self.foam_bashrc)} >/dev/null 2>&1 || true")
+        parts.append(f"cd {shlex.quote(self.to_runner_path(case_root))} && {command}")
+        return "; ".join(parts)
+
+    @abc.abstractmethod
+    def argv(self, command: str, case_root: str | Path) -> List[str]:
+        """
+        Return the process argument vector that runs `command` inside `case_root`.
+
+        Args:
+            command (str): Shell command (e.g. `blockMesh -case .`).
+            case_root (str | Path): Case root directory (host path).
+
+        Returns:
+            List[str]: Argument vector for `subprocess`.
+        """
+
+    def popen_kwargs(self) -> dict:
+        """Extra keyword arguments for `subprocess.Popen`."""
+        return {}
+
+    def run(
+        self,
+        command: str,
+        case_root: str | Path,
+        *,
+        log_rel: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """
+        Run `command` inside `case_root` and wait for it.
+
+        Args:
+            command (str): Shell command (e.g. `snappyHexMesh -overwrite`).
+            case_root (str | Path): Case root directory (host path).
+            log_rel (str | None): Log path relative to the case root. stdout and stderr
+                are written to it. If None, output goes to the parent's stdout/stderr.
+            timeout (float | None): Optional timeout in seconds. On timeout the process
+                is killed and `subprocess.TimeoutExpired` is raised.
+
+        Returns:
+            int: Exit code of `command`.
+        """
+        case_root = Path(case_root)
+        argv = self.argv(command, case_root)
+
+        if log_rel is None:
+            proc = subprocess.Popen(argv, **self.popen_kwargs())
+            return self._wait(proc, timeout)
+
+        log_path = case_root / log_rel
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "wb") as log:
+            proc = subprocess.Popen(
+                argv,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                **self.popen_kwargs(),
+            )
+            return self._wait(proc, timeout)
+
+    @staticmethod
+    def _wait(proc: subprocess.Popen, timeout: Optional[float]) -> int:
+        try:
+            return proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+
+
+@dataclass
+class WSLRunner(FoamRunner):
+    """
+    Run commands in WSL from Windows (`wsl.exe -- bash -lc ...`), without a console window.
+
+    Attributes:
+        distro (str | None): WSL distro name (e.g., `Ubuntu-22.04`). If None, default distro is used.
+    """
+
+    distro: Optional[str] = None
+
+    def to_runner_path(self, p: str | Path) -> str:
+        return win_to_wsl_path(str(p))
+
+    def argv(self, command: str, case_root: str | Path) -> List[str]:
+        argv = ["wsl.exe"]
+        if self.distro:
+            argv += ["-d", self.distro]
+        return argv + ["--", "bash", "-lc", self.script(command, case_root)]
+
+    def popen_kwargs(self) -> dict:
+        return {"creationflags": CREATE_NO_WINDOW} if CREATE_NO_WINDOW else {}
+
+
+@dataclass
+class NativeRunner(FoamRunner):
+    """
+    Run commands with a native bash (Linux/macOS with OpenFOAM installed locally).
+
+    Attributes:
+        bash (str): bash executable.
+    """
+
+    bash: str = "bash"
+
+    def argv(self, command: str, case_root: str | Path) -> List[str]:
+        return [self.bash, "-lc", self.script(command, case_root)]
+
+
+def get_runner(backend: str = "auto", **kwargs) -> FoamRunner:
+    """
+    Create a runner for the given backend.
+
+    Args:
+        backend (str): "wsl", "native" or "auto" (WSL on Windows, native elsewhere).
+        **kwargs: Runner attributes (e.g. foam_bashrc, distro, bash).
+
+    Returns:
+        FoamRunner: Runner instance.
+
+    Raises:
+        ValueError: If `backend` is unknown.
+    """
+    backend = (backend or "auto").strip().lower()
+    if backend == "auto":
+        backend = "wsl" if os.name == "nt" else "native"
+    if backend == "wsl":
+        return WSLRunner(**kwargs)
+    if backend == "native":
+        return NativeRunner(**kwargs)
+    raise ValueError("backend must be 'auto'|'wsl'|'native'")
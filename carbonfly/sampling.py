@@ -0,0 +1,372 @@
+"""
+In-process probe sampling of OpenFOAM fields.
+
+`CellIndex` is a spatial index over the cell centres of a mesh. It answers
+k-nearest-cell queries for many points at once, with `scipy.spatial.cKDTree`
+if SciPy is installed and with a vectorized uniform-grid search otherwise.
+`sample_internal_probes` uses it to sample field files at probe points by
+nearest-cell or inverse-distance-weighted (IDW) interpolation, without
+running `postProcess -func internalProbes` in OpenFOAM. The index is built
+once per mesh and reused across calls.
+
+Examples:
+    res = sample_internal_probes(case_root, points, fields=("CO2", "T", "U"))
+    co2 = res["data"]["scalars"]["CO2"]
+"""
+
+from __future__ import annotations
+
+# carbonfly/sampling.py
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+from .polymesh import load_cell_geometry, mesh_dir_of, mesh_stamp
+from .postproc import LazyRows, list_time_dirs, read_foam_field
+
+# cell indices built for recently sampled meshes: polyMesh dir -> (stamp, index)
+_INDEX_CACHE: Dict[str, Tuple["np.ndarray", "CellIndex"]] = {}
+_INDEX_CACHE_SIZE = 4
+
+
+def _require_numpy() -> None:
+    """Raise a clear error if NumPy is not available."""
+    if np is None:
+        raise RuntimeError("NumPy is required for probe sampling.")
+
+
+class CellIndex:
+    """
+    k-nearest-neighbour index over cell centres.
+
+    Attributes:
+        centres (numpy.ndarray): Cell centres, shape (nCells, 3).
+        backend (str): "kdtree" (SciPy) or "grid" (NumPy uniform grid).
+    """
+
+    def __init__(self, centres, backend: str = "auto", cells_per_bin: float = 2.0):
+        """
+        Args:
+            centres (array-like): Cell centres, shape (nCells, 3).
+            backend (str): "auto" (kdtree if SciPy is available, else grid), "kdtree" or "grid".
+            cells_per_bin (float): Average number of centres per grid bin ("grid" backend).
+
+        Raises:
+            ValueError: If `backend` is unknown or there are no centres.
+            RuntimeError: If "kdtree" is requested but SciPy is not installed.
+        """
+        _require_numpy()
+        self.centres = np.ascontiguousarray(centres, dtype=np.float64).reshape(-1, 3)
+        if len(self.centres) == 0:
+            raise ValueError("CellIndex needs at least one cell centre.")
+        backend = (backend or "auto").strip().lower()
+        if backend == "auto":
+            backend = "kdtree" if cKDTree is not None else "grid"
+        if backend == "kdtree":
+            if cKDTree is None:
+                raise RuntimeError("SciPy is required for the 'kdtree' backend.")
+            self._tree = cKDTree(self.centres)
+        elif backend == "grid":
+            self._build_grid(float(cells_per_bin))
+        else:
+            raise ValueError("backend must be 'auto'|'kdtree'|'grid'")
+        self.backend = backend
+
+    def _build_grid(self, cells_per_bin: float) -> None:
+        c = self.centres
+        lo, hi = c.min(axis=0), c.max(axis=0)
+        span = np.maximum(hi - lo, 1e-12)
+        # bin size for ~cells_per_bin centres per bin (flat meshes: ignore thin axes)
+        vol_axes = span[span > span.max() * 1e-6]
+        h = (np.prod(vol_axes) * cells_per_bin / len(c)) ** (1.0 / len(vol_axes))
+        dims = np.maximum(np.ceil(span / h).astype(np.int64), 1)
+
+        ijk = np.minimum(((c - lo) / h).astype(np.int64), dims - 1)
+        bins = (ijk[:, 0] * dims[1] + ijk[:, 1]) * dims[2] + ijk[:, 2]
+        order = np.argsort(bins, kind="stable")
+        self._lo, self._h, self._dims = lo, h, dims
+        self._order = order
+        self._sorted = c[order]  # centres in bin order: contiguous per bin
+        self._starts = np.searchsorted(bins[order], np.arange(np.prod(dims) + 1))
+
+    def query(
+        self, points, k: int = 1, max_distance: Optional[float] = None
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Find the k nearest cell centres of each point.
+
+        Args:
+            points (array-like): Query points, shape (n, 3).
+            k (int): Number of neighbours (capped at the number of cells).
+            max_distance (float | None): Ignore centres farther than this. Missing
+                neighbours get distance `inf` and index `nCells` (as in SciPy).
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: (distances, cell indices), both shape (n, k),
+                sorted by distance.
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        k = max(1, min(int(k), len(self.centres)))
+        if self.backend == "kdtree":
+            bound = np.inf if max_distance is None else float(max_distance)
+            d, i = self._tree.query(pts, k=k, distance_upper_bound=bound)
+            return d.reshape(len(pts), k), i.reshape(len(pts), k).astype(np.int64)
+        return self._query_grid(pts, k, max_distance)
+
+    def _query_grid(
+        self, pts, k: int, max_distance: Optional[float]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        n = len(pts)
+        dims, h, lo = self._dims, self._h, self._lo
+        top_corner = lo + dims * h
+        home = np.clip(((pts - lo) / h).astype(np.int64), 0, dims - 1)
+        limit2 = np.inf if max_distance is None else float(max_distance) ** 2
+
+        # best k so far per point: squared distances and positions in bin order
+        best_d = np.full((n, k), np.inf)
+        best_p = np.full((n, k), -1, dtype=np.int64)
+        active = np.arange(n)
+        r = 0
+        while len(active):
+            # bins on the shell of the (2r+1)^3 cube around each active point's bin
+            off = _shell_offsets(r)
+            b = home[active][:, None, :] + off[None, :, :]
+            valid = np.all((b >= 0) & (b < dims), axis=2)
+            q_of = np.repeat(np.arange(len(active)), len(off))[valid.ravel()]
+            b = b[valid]
+            lin = (b[:, 0] * dims[1] + b[:, 1]) * dims[2] + b[:, 2]
+            s, cnt = self._starts[lin], self._starts[lin + 1] - self._starts[lin]
+
+            # expand the bin ranges into (point, candidate) pairs
+            first = np.cumsum(cnt) - cnt
+            pos = np.repeat(s - first, cnt) + np.arange(int(cnt.sum()))
+            q = np.repeat(q_of, cnt)
+            diff = self._sorted[pos] - pts[active][q]
+            d2 = np.einsum("ij,ij->i", diff, diff)
+
+            # merge with the current best k and keep the k smallest per point
+            old = np.isfinite(best_d[active])
+            q = np.concatenate([np.nonzero(old)[0], q])
+            d2 = np.concatenate([best_d[active][old], d2])
+            pos = np.concatenate([best_p[active][old], pos])
+            keep = d2 <= limit2
+            q, d2, pos = q[keep], d2[keep], pos[keep]
+            if len(q):
+                # one sort by point, then by distance
+                o = np.lexsort((d2, q))
+                q, d2, pos = q[o], d2[o], pos[o]
+            rank = np.arange(len(q)) - np.searchsorted(q, q)
+            top = rank < k
+            rows = active[q[top]]
+            best_d[active], best_p[active] = np.inf, -1
+            best_d[rows, rank[top]] = d2[top]
+            best_p[rows, rank[top]] = pos[top]
+
+            # lower bound of the distance to any centre in a bin not searched yet:
+            # distance to the part of the grid box beyond each face of the cube
+            p = pts[active]
+            ha = home[active]
+            out2 = np.maximum(np.maximum(lo - p, p - top_corner), 0.0) ** 2
+            rest = out2.sum(axis=1, keepdims=True) - out2
+            gap_lo = np.where(ha - r > 0, p - (lo + (ha - r) * h), np.inf)
+            gap_hi = np.where(ha + r + 1 < dims, (lo + (ha + r + 1) * h) - p, np.inf)
+            gap = np.maximum(np.minimum(gap_lo, gap_hi), 0.0)
+            bound2 = (rest + gap**2).min(axis=1)
+            done = (best_d[active, k - 1] <= bound2) | (bound2 > limit2)
+            active = active[~done]
+            r += 1
+
+        found = best_p >= 0
+        cell = np.full((n, k), len(self.centres), dtype=np.int64)
+        cell[found] = self._order[best_p[found]]
+        return np.sqrt(best_d), cell
+
+
+def _shell_offsets(r: int) -> "np.ndarray":
+    """Integer offsets (m, 3) of the bins with max(|i|, |j|, |k|) == r."""
+    if r == 0:
+        return np.zeros((1, 3), dtype=np.int64)
+    full = np.arange(-r, r + 1)
+    inner = np.arange(-r + 1, r)
+
+    def face(axis, a, b):
+        u, v = np.meshgrid(a, b, indexing="ij")
+        u, v = u.ravel(), v.ravel()
+        out = []
+        for side in (-r, r):
+            w = np.full_like(u, side)
+            out.append(np.roll(np.stack([w, u, v], axis=1), axis, axis=1))
+        return np.concatenate(out)
+
+    return np.concatenate([face(0, full, full), face(1, full, inner), face(2, inner, inner)])
+
+
+def cell_index(case_root: str | Path, backend: str = "auto") -> CellIndex:
+    """
+    Return the `CellIndex` of a case mesh, reusing it while the mesh is unchanged.
+
+    Args:
+        case_root (str | Path): Case root or polyMesh folder.
+        backend (str): See `CellIndex`.
+
+    Returns:
+        CellIndex: Index over the cell centres.
+    """
+    _require_numpy()
+    d = mesh_dir_of(case_root)
+    key = f"{d.resolve()}|{backend}"
+    stamp = mesh_stamp(d)
+    hit = _INDEX_CACHE.get(key)
+    if hit is not None and np.array_equal(hit[0], stamp):
+        return hit[1]
+    index = CellIndex(load_cell_geometry(d)["centres"], backend=backend)
+    _INDEX_CACHE.pop(key, None)
+    while len(_INDEX_CACHE) >= _INDEX_CACHE_SIZE:
+        _INDEX_CACHE.pop(next(iter(_INDEX_CACHE)))
+    _INDEX_CACHE[key] = (stamp, index)
+    return index
+
+
+def _select_time_dir(case_root: Path, which: Union[str, int]) -> Path:
+    dirs = list_time_dirs(case_root)
+    if not dirs:
+        raise FileNotFoundError(f"No time dirs under {case_root}")
+    if isinstance(which, str):
+        if which.lower() in ("latest", "last"):
+            return dirs[-1]
+        for d in dirs:
+            if d.name == which:
+                return d
+        raise ValueError(f"Unsupported selector string: {which!r}")
+    try:
+        return dirs[int(which)]
+    except IndexError:
+        raise IndexError(
+            f"Selector {which} out of range. There are only {len(dirs)} time dirs."
+        )
+
+
+def sample_internal_probes(
+    case_root: str | Path,
+    points: Iterable[Iterable[float]],
+    fields: Iterable[str],
+    which: Union[str, int] = "latest",
+    method: str = "nearest",
+    k: int = 8,
+    power: float = 2.0,
+    max_distance: Optional[float] = None,
+    backend: str = "auto",
+) -> Dict[str, Any]:
+    """
+    Sample field files at probe points without running OpenFOAM.
+
+    The Python counterpart of `write_internal_probes_dict` +
+    `run_internal_probes_postprocess` + `collect_internal_probes_results`.
+    Values are taken from the cell whose centre is nearest to each point
+    ("nearest", like OpenFOAM's cell-value sampling) or interpolated from the
+    `k` nearest cell centres with weights 1/d**power ("idw").
+
+    Args:
+        case_root (str | Path): OpenFOAM case root directory.
+        points (Iterable[Iterable[float]]): Probe points as (x, y, z), in metres.
+        fields (Iterable[str]): Field names to sample, e.g. ("CO2", "T", "U").
+        which (str | int): Time directory: "latest"/"last", a time name (e.g. "2000"),
+            or an index into the sorted time directories (negative from the end).
+        method (str): "nearest" or "idw".
+        k (int): Number of neighbours for "idw".
+        power (float): IDW exponent.
+        max_distance (float | None): Points farther than this from the nearest cell
+            centre (e.g. outside the domain) get NaN values.
+        backend (str): Spatial index backend, see `CellIndex`.
+
+    Returns:
+        Dict[str, Any]: Same structure as `collect_internal_probes_results(..., vectorized=True)`:
+            {"time_dir": "<time>", "data": {"columns", "points", "distance", "scalars",
+            "vectors", "raw_rows", "array"}}. "distance" is the cumulative distance
+            along the points, as written by OpenFOAM for ordered probe sets.
+
+    Raises:
+        FileNotFoundError: If the mesh, time directory or a field file is missing.
+        ValueError: If `method` is unknown or a field is neither scalar nor vector.
+    """
+    _require_numpy()
+    method = (method or "nearest").strip().lower()
+    if method not in ("nearest", "idw"):
+        raise ValueError("method must be 'nearest'|'idw'")
+    case_root = Path(case_root)
+    time_dir = _select_time_dir(case_root, which)
+    pts = np.asarray([tuple(p) for p in points], dtype=np.float64).reshape(-1, 3)
+
+    index = cell_index(case_root, backend)
+    n_cells = len(index.centres)
+    dist, cell = index.query(
+        pts, k=1 if method == "nearest" else k, max_distance=max_distance
+    )
+    outside = ~np.isfinite(dist[:, 0])
+    cell = np.minimum(cell, n_cells - 1)  # missing neighbours: weight 0 / NaN below
+    if method == "nearest":
+        w = np.ones_like(dist)
+    else:
+        # exact hits take the cell value, otherwise normalised 1/d^p weights
+        with np.errstate(divide="ignore"):
+            w = 1.0 / dist**power
+        hit = dist[:, 0] <= 1e-12
+        w[hit] = 0.0
+        w[hit, 0] = 1.0
+        w[outside, 0] = 1.0
+        w /= w.sum(axis=1, keepdims=True)
+
+    scalars: Dict[str, "np.ndarray"] = {}
+    vectors: Dict[str, "np.ndarray"] = {}
+    for name in fields:
+        f = read_foam_field(time_dir / name)
+        values = f.expand(n_cells)
+        if values.ndim == 1:
+            out = np.einsum("nk,nk->n", w, values[cell])
+        elif values.shape[1] == 3:
+            out = np.einsum("nk,nkc->nc", w, values[cell])
+        else:
+            raise ValueError(f"Field {name!r} is not a scalar or vector field")
+        out[outside] = np.nan
+        (scalars if out.ndim == 1 else vectors)[name] = out
+
+    distance = np.concatenate(
+        [[0.0], np.cumsum(np.linalg.norm(np.diff(pts, axis=0), axis=1))]
+    )[: len(pts)]
+    columns = ["distance", "x", "y", "z"] + list(scalars)
+    for name in vectors:
+        columns += [f"{name}_x", f"{name}_y", f"{name}_z"]
+    data = np.column_stack(
+        [distance, pts] + list(scalars.values()) + list(vectors.values())
+    )
+
+    # views into `data`, like the columnar points.xy parser
+    i = 4
+    for name in scalars:
+        scalars[name] = data[:, i]
+        i += 1
+    for name in vectors:
+        vectors[name] = data[:, i : i + 3]
+        i += 3
+
+    return {
+        "time_dir": time_dir.name,
+        "data": {
+            "columns": columns,
+            "points": data[:, 1:4],
+            "distance": data[:, 0],
+            "scalars": scalars,
+            "vectors": vectors,
+            "raw_rows": LazyRows(columns, data),
+            "array": data,
+        },
+    }
@@ -0,0 +1,244 @@
+"""
+Local multi-case job scheduler for parameter sweeps.
+
+`CaseScheduler` runs a solver (or any OpenFOAM command) in many case folders
+on one workstation. Jobs are queued with a concurrency limit in cores: an
+N-rank MPI job takes N cores. The queue state is written to a JSON file after
+every change, so an interrupted sweep can be resumed with
+`CaseScheduler.resume`. Finished cases are not run again.
+
+Examples:
+    sched = CaseScheduler(case_dirs, "sweep.json", max_cores=16, n_procs=4)
+    sched.run()
+    print(sched.summary())
+"""
+
+from __future__ import annotations
+
+# carbonfly/scheduler.py
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .postproc import read_final_residuals
+from .runner import FoamRunner, get_runner
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class CaseJob:
+    """
+    One queued case.
+
+    Attributes:
+        case_root (str): Case root directory.
+        command (str): Command run in the case folder (serial form, e.g. `buoyantReactingFoam`).
+        n_procs (int): Number of cores (MPI ranks). For n_procs > 1 the case is run as
+            `decomposePar -force && mpirun -np N <command> -parallel && reconstructPar`.
+        log_rel (str | None): Log path relative to the case root.
+        status (str): "queued", "running", "done" or "failed".
+        returncode (int | None): Exit code once finished.
+        seconds (float | None): Wall time in seconds once finished.
+        residuals (Dict[str, float]): Final residuals (see `postproc.read_final_residuals`).
+        error (str | None): Traceback if the runner raised instead of returning
+            an exit code (e.g. backend not available).
+    """
+
+    case_root: str
+    command: str = "buoyantReactingFoam"
+    n_procs: int = 1
+    log_rel: Optional[str] = None
+    status: str = "queued"
+    returncode: Optional[int] = None
+    seconds: Optional[float] = None
+    residuals: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def shell_command(self) -> str:
+        """Return the command actually run (MPI-wrapped for n_procs > 1)."""
+        if self.n_procs <= 1:
+            return self.command
+        return (
+            f"decomposePar -force && mpirun -np {self.n_procs} {self.command} -parallel"
+            " && reconstructPar"
+        )
+
+
+class CaseScheduler:
+    """
+    Run cases concurrently within a core budget, with resumable on-disk state.
+
+    Attributes:
+        jobs (List[CaseJob]): Jobs in queue order.
+        state_path (Path): JSON file holding the queue state.
+        max_cores (int): Core budget shared by all running jobs.
+        runner (FoamRunner): Backend used to run commands.
+    """
+
+    def __init__(
+        self,
+        cases: Iterable[str | Path | CaseJob],
+        state_path: str | Path,
+        *,
+        max_cores: Optional[int] = None,
+        runner: Optional[FoamRunner] = None,
+        command: str = "buoyantReactingFoam",
+        n_procs: int = 1,
+        log_rel: Optional[str] = None,
+    ):
+        """
+        Args:
+            cases (Iterable[str | Path | CaseJob]): Case folders (or prepared jobs).
+            state_path (str | Path): JSON state file (created/overwritten).
+            max_cores (int | None): Core budget. Default is `os.cpu_count()`.
+            runner (FoamRunner | None): Backend. If None, `get_runner("auto")` is used.
+            command (str): Command for cases given as paths.
+            n_procs (int): Cores per job for cases given as paths.
+            log_rel (str | None): Log path for cases given as paths.
+                Default is `<command>.run.log`.
+        """
+        self.jobs: List[CaseJob] = [
+            c
+            if isinstance(c, CaseJob)
+            else CaseJob(
+                str(c),
+                command=command,
+                n_procs=int(n_procs),
+                log_rel=log_rel or f"{command.split()[0]}.run.log",
+            )
+            for c in cases
+        ]
+        self.state_path = Path(state_path)
+        self.max_cores = int(max_cores or os.cpu_count() or 1)
+        if self.max_cores < 1:
+            raise ValueError("max_cores must be >= 1")
+        self.runner = runner or get_runner("auto")
+        self._lock = threading.Condition()
+        self._save()
+
+    @classmethod
+    def resume(
+        cls,
+        state_path: str | Path,
+        *,
+        runner: Optional[FoamRunner] = None,
+        max_cores: Optional[int] = None,
+        retry_failed: bool = False,
+    ) -> "CaseScheduler":
+        """
+        Load a scheduler from its state file.
+
+        Jobs that were running when the sweep was interrupted are queued again.
+
+        Args:
+            state_path (str | Path): JSON state file written by a previous scheduler.
+            runner (FoamRunner | None): Backend. If None, `get_runner("auto")` is used.
+            max_cores (int | None): Core budget. Default is the stored one.
+            retry_failed (bool): If True, failed jobs are queued again as well.
+
+        Returns:
+            CaseScheduler: Scheduler ready to `run()`.
+        """
+        state = json.loads(Path(state_path).read_text(encoding="utf-8"))
+        jobs = [CaseJob(**j) for j in state["jobs"]]
+        for j in jobs:
+            if j.status == "running" or (retry_failed and j.status == "failed"):
+                j.status, j.returncode, j.seconds, j.error = "queued", None, None, None
+        return cls(
+            jobs,
+            state_path,
+            max_cores=max_cores or state.get("max_cores"),
+            runner=runner,
+        )
+
+    def _save(self) -> None:
+        state = {"max_cores": self.max_cores, "jobs": [asdict(j) for j in self.jobs]}
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        tmp.replace(self.state_path)
+
+    def _run_job(self, job: CaseJob) -> None:
+        t0 = time.perf_counter()
+        error = None
+        try:
+            rc = self.runner.run(job.shell_command(), job.case_root, log_rel=job.log_rel)
+        except Exception:
+            # e.g. backend not available: mark failed, keep the sweep going
+            rc, error = -1, traceback.format_exc()
+            _log.error("Case %s failed to run:\n%s", job.case_root, error)
+        with self._lock:
+            job.returncode = rc
+            job.error = error
+            job.seconds = time.perf_counter() - t0
+            job.status = "done" if rc == 0 else "failed"
+            job.residuals = read_final_residuals(job.case_root)
+            self._save()
+            self._lock.notify_all()
+
+    def run(self) -> List[CaseJob]:
+        """
+        Run all queued jobs and wait for them.
+
+        Jobs start in queue order whenever enough cores are free. A job needing
+        more cores than `max_cores` runs alone.
+
+        Returns:
+            List[CaseJob]: All jobs with their final status.
+        """
+        threads: List[threading.Thread] = []
+        with self._lock:
+            while True:
+                queued = [j for j in self.jobs if j.status == "queued"]
+                running = [j for j in self.jobs if j.status == "running"]
+                used = sum(min(j.n_procs, self.max_cores) for j in running)
+                if not queued and not running:
+                    break
+                started = False
+                for j in queued:
+                    need = min(max(1, j.n_procs), self.max_cores)
+                    if used + need > self.max_cores:
+                        break  # keep queue order: no overtaking
+                    j.status = "running"
+                    used += need
+                    started = True
+                    t = threading.Thread(target=self._run_job, args=(j,), daemon=True)
+                    threads.append(t)
+                    t.start()
+                if started:
+                    self._save()
+                else:
+                    self._lock.wait()
+        for t in threads:
+            t.join()
+        return self.jobs
+
+    def summary(self) -> str:
+        """
+        Format a summary table: case, status, exit code, wall time and final residuals.
+
+        Returns:
+            str: Text table, one line per case.
+        """
+        fields = sorted({k for j in self.jobs for k in j.residuals if k != "Time"})
+        head = f"{'case':<30}{'status':<8}{'exit':>6}{'time [s]':>10}{'Time':>10}"
+        head += "".join(f"{f:>12}" for f in fields)
+        lines = [head]
+        for j in self.jobs:
+            rc = "" if j.returncode is None else str(j.returncode)
+            sec = "" if j.seconds is None else f"{j.seconds:.1f}"
+            t = j.residuals.get("Time")
+            line = f"{Path(j.case_root).name:<30}{j.status:<8}{rc:>6}{sec:>10}"
+            line += f"{'' if t is None else format(t, 'g'):>10}"
+            for f in fields:
+                v = j.residuals.get(f)
+                line += f"{'' if v is None else format(v, '.3e'):>12}"
+            lines.append(line)
+        return "\n".join(lines)
@@ -95,6 +95,7 @@ def write_snappy_geometry(
     merge_tolerance: float = 1e-6,
     allow_free_standing_zone_faces: bool = True,
     inside_point: Tuple[float, float, float] = (0.5, 0.5, 0.5),
+    stl_region_names: Optional[List[str]] = None,
 ) -> Path:
     """
     Write system/snappyHexMeshDict for a multi-region STL.
@@ -111,6 +112,10 @@ def write_snappy_geometry(
         inside_point (Tuple[float, float, float]): locationInMesh point for castellatedMeshControls.
         mesh_quality_block (str | None): Optional full `meshQualityControls { ... }` block override.
         extra_blocks (List[str] | None): Optional additional raw blocks appended to the dict.
+        stl_region_names (List[str] | None): Region names as stored in the STL file, aligned with
+            `regions`. Each is renamed to the matching entry of `regions`. If None, `regions` are
+            used as-is (ASCII STL solid names). Binary STL files carry no names, so OpenFOAM
+            reads their regions as `patch0`, `patch1`, ...
 
         Other parameters map directly to snappyHexMeshDict entries with the same meaning.
 
@@ -119,6 +124,10 @@ def write_snappy_geometry(
     """
     # Ensure unique region list with stable order
     regions = _unique_ordered(regions or [])
+    if stl_region_names is None:
+        stl_region_names = regions
+    elif len(stl_region_names) != len(regions):
+        raise ValueError("stl_region_names must have the same length as regions.")
 
     # Compute global min/max level from per-region levels
     if region_levels:
@@ -147,8 +156,8 @@ def write_snappy_geometry(
     lines.append(f"        name {stem};")
     lines.append("        regions")
     lines.append("        {")
-    for r in regions:
-        lines.append(f"            {r}")
+    for r, stl_r in zip(regions, stl_region_names):
+        lines.append(f"            {stl_r}")
         lines.append("            {")
         lines.append(f"                name {r};")
         lines.append("            }")
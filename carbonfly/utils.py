@@ -7,8 +7,18 @@ This module contains small helper functions used by multiple writers and case-bu
 from __future__ import annotations
 
 # carbonfly/utils.py
+import gzip
+import hashlib
 import math
-from typing import Optional
+import mmap as _mmap
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def foam_header(
@@ -67,6 +77,199 @@ def foam_header(
     return banner + attribution
 
 
+def file_digest(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Return the SHA-256 hex digest of a file's content.
+
+    Args:
+        path (str | Path): File path.
+        chunk_size (int): Read block size in bytes.
+
+    Returns:
+        str: Hex digest.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+# Reading OpenFOAM files (counterpart of `foam_header`)
+_RE_FOAM_ENTRY = re.compile(rb"(\w+)\s+([^;]*?)\s*;")
+
+
+def skip_foam_space(buf, pos: int) -> int:
+    """
+    Skip whitespace and C/C++ comments in OpenFOAM file content.
+
+    Args:
+        buf (bytes | mmap.mmap): File content.
+        pos (int): Start offset.
+
+    Returns:
+        int: Offset of the next token (`len(buf)` if there is none).
+    """
+    n = len(buf)
+    while pos < n:
+        c = buf[pos : pos + 1]
+        if c.isspace():
+            pos += 1
+        elif buf[pos : pos + 2] == b"//":
+            end = buf.find(b"\n", pos)
+            pos = n if end < 0 else end + 1
+        elif buf[pos : pos + 2] == b"/*":
+            end = buf.find(b"*/", pos + 2)
+            pos = n if end < 0 else end + 2
+        else:
+            break
+    return pos
+
+
+def read_foam_bytes(path: str | Path, mmap: bool = False):
+    """
+    Return the content of an OpenFOAM file as bytes (or a read-only memory map).
+
+    `<path>.gz` is used if `path` does not exist. Compressed files are always
+    read fully (no memory mapping).
+
+    Args:
+        path (str | Path): File path.
+        mmap (bool): If True, memory-map uncompressed files.
+
+    Returns:
+        bytes | mmap.mmap: File content.
+    """
+    path = Path(path)
+    if not path.exists() and path.with_name(path.name + ".gz").exists():
+        path = path.with_name(path.name + ".gz")
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            return f.read()
+    if mmap and path.stat().st_size > 0:
+        with open(path, "rb") as f:
+            return _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+    return path.read_bytes()
+
+
+def read_foam_header(buf) -> Tuple[Dict[str, str], int]:
+    """
+    Parse the `FoamFile { ... }` header of an OpenFOAM file.
+
+    Args:
+        buf (bytes | mmap.mmap): File content (at least the beginning).
+
+    Returns:
+        Tuple[Dict[str, str], int]: (entries, offset after the closing brace). Entries
+            are raw strings without quotes, e.g. {"format": "binary", "class": "volScalarField"}.
+
+    Raises:
+        ValueError: If no FoamFile header is found.
+    """
+    start = buf.find(b"FoamFile")
+    open_ = buf.find(b"{", start) if start >= 0 else -1
+    close = buf.find(b"}", open_) if open_ >= 0 else -1
+    if close < 0:
+        raise ValueError("No FoamFile header found")
+    entries = {
+        k.decode("ascii", "replace"): v.decode("utf-8", "replace").strip('"')
+        for k, v in _RE_FOAM_ENTRY.findall(bytes(buf[open_ + 1 : close]))
+    }
+    return entries, close + 1
+
+
+def foam_binary_dtypes(header: Dict[str, str]):
+    """
+    Return the NumPy (label, scalar) dtypes of a binary OpenFOAM file.
+
+    Uses the `arch` header entry (e.g. `LSB;label=32;scalar=64`); defaults to
+    little-endian int32 labels and float64 scalars.
+
+    Args:
+        header (Dict[str, str]): Entries from `read_foam_header`.
+
+    Returns:
+        Tuple[numpy.dtype, numpy.dtype]: (label dtype, scalar dtype).
+    """
+    arch = header.get("arch", "")
+    order = ">" if "MSB" in arch else "<"
+    m = re.search(r"label=(\d+)", arch)
+    label_bits = int(m.group(1)) if m else 32
+    m = re.search(r"scalar=(\d+)", arch)
+    scalar_bits = int(m.group(1)) if m else 64
+    return (
+        np.dtype(f"{order}i{label_bits // 8}"),
+        np.dtype(f"{order}f{scalar_bits // 8}"),
+    )
+
+
+def read_foam_list(buf, pos: int, dtype, ncomp: int = 1, binary: bool = False):
+    """
+    Read an OpenFOAM list `N ( ... )` or `N{value}` starting at `pos`.
+
+    Binary payloads are returned as zero-copy views into `buf` (which may be a
+    `mmap.mmap`); ASCII payloads are parsed with one `numpy.fromstring` pass.
+    Component lists such as vectors `((x y z) ...)` are returned with shape (N, ncomp).
+
+    Args:
+        buf (bytes | mmap.mmap): File content.
+        pos (int): Offset at (or before whitespace/comments preceding) the list size.
+        dtype: NumPy dtype of one component (e.g. from `foam_binary_dtypes`).
+        ncomp (int): Components per element (1 scalar/label, 3 vector, 6 symmTensor, ...).
+        binary (bool): True if the file format is binary.
+
+    Returns:
+        Tuple[numpy.ndarray, int]: (values, offset after the closing parenthesis).
+
+    Raises:
+        ValueError: If the list is malformed or its size does not match.
+    """
+    dtype = np.dtype(dtype)
+    pos = skip_foam_space(buf, pos)
+    m = re.compile(rb"(\d+)\s*").match(bytes(buf[pos : pos + 32]))
+    if not m:
+        raise ValueError(f"Expected a list size at offset {pos}")
+    n = int(m.group(1))
+    pos += m.end()
+    shape = (n, ncomp) if ncomp > 1 else (n,)
+
+    # uniform list: N{value}
+    if buf[pos : pos + 1] == b"{":
+        end = buf.find(b"}", pos)
+        vals = bytes(buf[pos + 1 : end]).replace(b"(", b" ").replace(b")", b" ")
+        value = np.array(vals.split(), dtype=dtype)[:ncomp]
+        return np.broadcast_to(value if ncomp > 1 else value[0], shape), end + 1
+
+    if buf[pos : pos + 1] != b"(":
+        raise ValueError(f"Expected '(' at offset {pos}")
+    pos += 1
+
+    if binary:
+        count = n * ncomp
+        arr = np.frombuffer(buf, dtype=dtype, count=count, offset=pos)
+        end = pos + count * dtype.itemsize
+        if buf[end : end + 1] != b")":
+            raise ValueError(f"Binary list of {n} elements is not closed at offset {end}")
+        return arr.reshape(shape), end + 1
+
+    # ASCII: for component lists the closing parenthesis is the (N+1)-th ")"
+    if ncomp > 1:
+        idx = np.flatnonzero(np.frombuffer(buf, dtype=np.uint8, offset=pos) == ord(")"))
+        if len(idx) <= n:
+            raise ValueError(f"List of {n} elements is not closed")
+        end = pos + int(idx[n])
+        text = bytes(buf[pos:end]).replace(b"(", b" ").replace(b")", b" ")
+    else:
+        end = buf.find(b")", pos)
+        if end < 0:
+            raise ValueError(f"List of {n} elements is not closed")
+        text = bytes(buf[pos:end])
+    arr = np.fromstring(text.decode("ascii"), dtype=dtype, sep=" ")
+    if arr.size != n * ncomp:
+        raise ValueError(f"List size mismatch: expected {n * ncomp} values, got {arr.size}")
+    return arr.reshape(shape), end + 1
+
+
 def unit_scale_to_m(unit: str) -> float:
     """
     Convert a unit label to a meters scale factor.
@@ -31,6 +31,8 @@ from pathlib import Path
 from typing import Optional, Tuple
 import shutil
 
+from .decompose_writer import read_number_of_subdomains
+
 
 # Path utilities
 def win_to_wsl_path(p: str) -> str:
@@ -361,3 +363,176 @@ def run_foam_monitor_console(
         timeout=timeout,
         keep_open=True,
     )
+
+
+# Parallel runs (require system/decomposeParDict, see carbonfly.decompose_writer)
+def _resolve_n_procs(case_root: Path, n_procs: Optional[int]) -> int:
+    """Return `n_procs`, or `numberOfSubdomains` from the case's decomposeParDict."""
+    if n_procs is None:
+        n_procs = read_number_of_subdomains(case_root)
+        if n_procs is None:
+            raise ValueError(
+                f"No numberOfSubdomains in {case_root / 'system' / 'decomposeParDict'}. "
+                "Write it with carbonfly.decompose_writer.write_decompose_par_dict first."
+            )
+    if int(n_procs) < 1:
+        raise ValueError("n_procs must be >= 1")
+    return int(n_procs)
+
+
+## decomposePar
+def run_decompose_par_console(
+    case_root: str | Path,
+    *,
+    foam_bashrc: Optional[str] = "/opt/openfoam10/etc/bashrc",
+    distro: Optional[str] = None,
+    timeout: Optional[int] = None,
+    log_rel: str = "system/decomposePar.run.log",
+) -> int:
+    """
+    Open a console and run `decomposePar -force` inside the given case folder.
+
+    Args:
+        case_root (str | Path): Windows path to the OpenFOAM case directory.
+        foam_bashrc (str | None): OpenFOAM bashrc to source in WSL.
+        distro (str | None): WSL distro/profile name (e.g., `Ubuntu-22.04`).
+        timeout (int | None): Optional timeout (seconds) for the launcher process.
+        log_rel (str): Relative log path (under the case folder in WSL).
+
+    Returns:
+        int: Return code of the launcher process.
+    """
+    case_root = Path(case_root)
+    cwd_wsl = win_to_wsl_path(str(case_root))
+    return run_wsl_console(
+        "decomposePar -force",
+        cwd_wsl=cwd_wsl,
+        foam_bashrc=foam_bashrc,
+        distro=distro,
+        log_rel=log_rel,
+        timeout=timeout,
+        keep_open=True,
+    )
+
+
+## snappyHexMesh in parallel
+def run_snappy_parallel_console(
+    case_root: str | Path,
+    *,
+    n_procs: Optional[int] = None,
+    foam_bashrc: Optional[str] = "/opt/openfoam10/etc/bashrc",
+    distro: Optional[str] = None,
+    timeout: Optional[int] = None,
+    log_rel: str = "system/snappyHexMesh.run.log",
+) -> int:
+    """
+    Open a console and run snappyHexMesh in parallel inside the given case folder:
+    `decomposePar -force`, `mpirun -np N snappyHexMesh -overwrite -parallel`,
+    then `reconstructParMesh -constant`.
+
+    Args:
+        case_root (str | Path): Windows path to the OpenFOAM case directory.
+        n_procs (int | None): Number of MPI ranks. If None, `numberOfSubdomains`
+            from `system/decomposeParDict` is used.
+        foam_bashrc (str | None): OpenFOAM bashrc to source in WSL.
+        distro (str | None): WSL distro/profile name (e.g., `Ubuntu-22.04`).
+        timeout (int | None): Optional timeout (seconds) for the launcher process.
+        log_rel (str): Relative log path (under the case folder in WSL).
+
+    Returns:
+        int: Return code of the launcher process.
+    """
+    case_root = Path(case_root)
+    n = _resolve_n_procs(case_root, n_procs)
+    cwd_wsl = win_to_wsl_path(str(case_root))
+    chain = (
+        "decomposePar -force"
+        f" && mpirun -np {n} snappyHexMesh -overwrite -parallel"
+        " && reconstructParMesh -constant"
+    )
+    return run_wsl_console(
+        f"bash -c {shlex.quote(chain)}",
+        cwd_wsl=cwd_wsl,
+        foam_bashrc=foam_bashrc,
+        distro=distro,
+        log_rel=log_rel,
+        timeout=timeout,
+        keep_open=True,
+    )
+
+
+## buoyantReactingFoam in parallel
+def run_foam_parallel_console(
+    case_root: str | Path,
+    *,
+    n_procs: Optional[int] = None,
+    foam_bashrc: Optional[str] = "/opt/openfoam10/etc/bashrc",
+    distro: Optional[str] = None,
+    timeout: Optional[int] = None,
+    log_rel: str = "buoyantReactingFoam.run.log",
+) -> int:
+    """
+    Open a console and run `mpirun -np N buoyantReactingFoam -parallel` inside
+    the given case folder. The case must be decomposed first (`run_decompose_par_console`).
+
+    Args:
+        case_root (str | Path): Windows path to the OpenFOAM case directory.
+        n_procs (int | None): Number of MPI ranks. If None, `numberOfSubdomains`
+            from `system/decomposeParDict` is used.
+        foam_bashrc (str | None): OpenFOAM bashrc to source in WSL.
+        distro (str | None): WSL distro/profile name (e.g., `Ubuntu-22.04`).
+        timeout (int | None): Optional timeout (seconds) for the launcher process.
+        log_rel (str): Relative log path (under the case folder in WSL).
+
+    Returns:
+        int: Return code of the launcher process.
+    """
+    case_root = Path(case_root)
+    n = _resolve_n_procs(case_root, n_procs)
+    cwd_wsl = win_to_wsl_path(str(case_root))
+    return run_wsl_console(
+        f"mpirun -np {n} buoyantReactingFoam -parallel",
+        cwd_wsl=cwd_wsl,
+        foam_bashrc=foam_bashrc,
+        distro=distro,
+        log_rel=log_rel,
+        timeout=timeout,
+        keep_open=True,
+    )
+
+
+## reconstructPar
+def run_reconstruct_par_console(
+    case_root: str | Path,
+    *,
+    latest_time: bool = False,
+    foam_bashrc: Optional[str] = "/opt/openfoam10/etc/bashrc",
+    distro: Optional[str] = None,
+    timeout: Optional[int] = None,
+    log_rel: str = "system/reconstructPar.run.log",
+) -> int:
+    """
+    Open a console and run `reconstructPar` inside the given case folder.
+
+    Args:
+        case_root (str | Path): Windows path to the OpenFOAM case directory.
+        latest_time (bool): If True, only reconstruct the latest time (`-latestTime`).
+        foam_bashrc (str | None): OpenFOAM bashrc to source in WSL.
+        distro (str | None): WSL distro/profile name (e.g., `Ubuntu-22.04`).
+        timeout (int | None): Optional timeout (seconds) for the launcher process.
+        log_rel (str): Relative log path (under the case folder in WSL).
+
+    Returns:
+        int: Return code of the launcher process.
+    """
+    case_root = Path(case_root)
+    cwd_wsl = win_to_wsl_path(str(case_root))
+    return run_wsl_console(
+        "reconstructPar -latestTime" if latest_time else "reconstructPar",
+        cwd_wsl=cwd_wsl,
+        foam_bashrc=foam_bashrc,
+        distro=distro,
+        log_rel=log_rel,
+        timeout=timeout,
+        keep_open=True,
+    )
@@ -0,0 +1,285 @@
+"""
+Shared fixtures for the carbonfly test suite.
+
+The tests run in plain CPython: RhinoCommon and OpenFOAM are not needed.
+Rhino geometry is replaced by the small stand-ins below, which provide only
+the members carbonfly uses.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+class FakePoint:
+    def __init__(self, x, y, z):
+        self.X, self.Y, self.Z = float(x), float(y), float(z)
+
+
+class FakeVector3f(FakePoint):
+    @staticmethod
+    def CrossProduct(a, b):
+        return FakeVector3f(
+            a.Y * b.Z - a.Z * b.Y, a.Z * b.X - a.X * b.Z, a.X * b.Y - a.Y * b.X
+        )
+
+    @property
+    def Length(self):
+        return math.sqrt(self.X**2 + self.Y**2 + self.Z**2)
+
+    def Unitize(self):
+        length = self.Length
+        self.X, self.Y, self.Z = self.X / length, self.Y / length, self.Z / length
+
+
+class FakeFace:
+    def __init__(self, *idx):
+        self.A, self.B, self.C = idx[:3]
+        self.D = idx[3] if len(idx) > 3 else idx[2]
+        self.IsTriangle = len(idx) == 3
+
+    def Triangulate(self):
+        return [(self.A, self.B, self.C), (self.A, self.C, self.D)]
+
+
+class _FakeList(list):
+    @property
+    def Count(self):
+        return len(self)
+
+
+class FakeVertices(_FakeList):
+    def Add(self, x, y, z):
+        self.append(FakePoint(x, y, z))
+
+    def ToFloatArray(self):
+        return [c for v in self for c in (v.X, v.Y, v.Z)]
+
+
+class FakeFaces(_FakeList):
+    def AddFace(self, a, b, c):
+        self.append(FakeFace(a, b, c))
+
+    def ToIntArray(self, as_triangles):
+        out = []
+        for f in self:
+            out += [f.A, f.B, f.C] if f.IsTriangle else [f.A, f.B, f.C, f.A, f.C, f.D]
+        return out
+
+
+class FakeMesh:
+    """Minimal stand-in for `Rhino.Geometry.Mesh`."""
+
+    def __init__(self, vertices=(), faces=()):
+        self.Vertices = FakeVertices(FakePoint(*v) for v in vertices)
+        self.Faces = FakeFaces(FakeFace(*f) for f in faces)
+        self.Normals = SimpleNamespace(ComputeNormals=lambda: None)
+
+
+def box_mesh(size=(1.0, 1.0, 1.0), origin=(0.0, 0.0, 0.0), quads=False) -> FakeMesh:
+    """Closed box with outward normals, as 12 triangles (or 6 quads)."""
+    (x0, y0, z0), (dx, dy, dz) = origin, size
+    verts = [
+        (x0 + i * dx, y0 + j * dy, z0 + k * dz) for k in (0, 1) for j in (0, 1) for i in (0, 1)
+    ]
+    quad_faces = [
+        (0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4),
+        (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5),
+    ]
+    if quads:
+        return FakeMesh(verts, quad_faces)
+    tris = [t for a, b, c, d in quad_faces for t in ((a, b, c), (a, c, d))]
+    return FakeMesh(verts, tris)
+
+
+@pytest.fixture
+def fake_rhino(monkeypatch):
+    """Patch a minimal `Rhino` namespace into the modules that use RhinoCommon."""
+    from carbonfly import mesh, mesh_cache
+
+    rhino = SimpleNamespace(Geometry=SimpleNamespace(Vector3f=FakeVector3f, Mesh=FakeMesh))
+    monkeypatch.setattr(mesh, "Rhino", rhino)
+    monkeypatch.setattr(mesh_cache, "Rhino", rhino)
+    return rhino
+
+
+def make_cfgeos(n: int = 3, btype: str = "wall"):
+    """CFGeo regions `r0`, `r1`, ... whose "Brep" is the region index (see `fake_meshing`)."""
+    from carbonfly.boundary import Boundary, FieldFV, FieldNoSlip, FieldZG
+    from carbonfly.geo import CFGeo, Refine
+
+    fields = {"U": FieldNoSlip(), "T": FieldFV(300.0), "CO2": FieldZG()}
+    return [
+        CFGeo(f"r{i}", i, Boundary(f"r{i}", btype=btype, fields=dict(fields)), Refine(1, 2))
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def fake_meshing(monkeypatch, fake_rhino):
+    """Mesh the integer "Breps" of `make_cfgeos` as boxes; later regions finish first."""
+    from carbonfly import case, mesh_cache
+
+    calls = []
+
+    def brep_to_mesh(brep, meshing_parameters=None):
+        calls.append(brep)
+        time.sleep(0.02 / (1 + brep))
+        return box_mesh(origin=(1000.0 * brep, 0.0, 0.0))
+
+    monkeypatch.setattr(case, "brep_to_mesh", brep_to_mesh)
+    monkeypatch.setattr(mesh_cache, "brep_to_mesh", brep_to_mesh)
+    monkeypatch.setattr(mesh_cache, "brep_geometry_hash", lambda brep, mp=None: f"brep{brep}")
+    return calls
+
+
+
+def shell_runner():
+    """A `FoamRunner` that runs commands with a plain `sh -c`, without OpenFOAM."""
+    from carbonfly.runner import FoamRunner
+
+    @dataclass
+    class ShellRunner(FoamRunner):
+        foam_bashrc: Optional[str] = None
+
+        def argv(self, command, case_root):
+            return ["sh", "-c", self.script(command, case_root)]
+
+    return ShellRunner()
+
+
+def write_hex_mesh(d, n=(3, 2, 2), size=(2.0, 1.0, 1.5), fmt="ascii", perturb=0.0, seed=0):
+    """
+    Write a structured hex mesh as an OpenFOAM polyMesh (one `walls` patch).
+
+    Interior points are moved by up to `perturb` times the smallest cell size,
+    so the faces become warped but the domain keeps its volume. Binary meshes
+    use a faceCompactList for `faces`, like OpenFOAM.
+    """
+    import numpy as np
+
+    from carbonfly.utils import foam_header
+
+    d = Path(d)
+    d.mkdir(parents=True, exist_ok=True)
+    nx, ny, nz = n
+    axes = [np.linspace(0.0, s, k + 1) for s, k in zip(size, n)]
+    z, y, x = np.meshgrid(axes[2], axes[1], axes[0], indexing="ij")
+    points = np.stack([x.ravel(), y.ravel(), z.ravel()], axis=1)
+
+    def pid(i, j, k):
+        return i + (nx + 1) * (j + (ny + 1) * k)
+
+    def cid(i, j, k):
+        return i + nx * (j + ny * k)
+
+    interior = [pid(i, j, k) for k in range(1, nz) for j in range(1, ny) for i in range(1, nx)]
+    h = min(s / k for s, k in zip(size, n))
+    rng = np.random.default_rng(seed)
+    points[interior] += rng.uniform(-perturb, perturb, (len(interior), 3)) * h
+
+    # faces with normal +x/+y/+z at the lower corner (i, j, k)
+    def xf(i, j, k):
+        return [pid(i, j, k), pid(i, j + 1, k), pid(i, j + 1, k + 1), pid(i, j, k + 1)]
+
+    def yf(i, j, k):
+        return [pid(i, j, k), pid(i, j, k + 1), pid(i + 1, j, k + 1), pid(i + 1, j, k)]
+
+    def zf(i, j, k):
+        return [pid(i, j, k), pid(i + 1, j, k), pid(i + 1, j + 1, k), pid(i, j + 1, k)]
+
+    # internal faces in upper-triangular order (owner < neighbour, sorted by owner)
+    internal = []
+    for k in range(nz):
+        for j in range(ny):
+            for i in range(nx):
+                c = cid(i, j, k)
+                if i < nx - 1:
+                    internal.append((xf(i + 1, j, k), c, cid(i + 1, j, k)))
+                if j < ny - 1:
+                    internal.append((yf(i, j + 1, k), c, cid(i, j + 1, k)))
+                if k < nz - 1:
+                    internal.append((zf(i, j, k + 1), c, cid(i, j, k + 1)))
+    faces = [f for f, _, _ in internal]
+    owner = [o for _, o, _ in internal]
+    neighbour = [nb for _, _, nb in internal]
+    n_internal = len(faces)
+    for k in range(nz):
+        for j in range(ny):
+            faces += [xf(0, j, k)[::-1], xf(nx, j, k)]
+            owner += [cid(0, j, k), cid(nx - 1, j, k)]
+    for k in range(nz):
+        for i in range(nx):
+            faces += [yf(i, 0, k)[::-1], yf(i, ny, k)]
+            owner += [cid(i, 0, k), cid(i, ny - 1, k)]
+    for j in range(ny):
+        for i in range(nx):
+            faces += [zf(i, j, 0)[::-1], zf(i, j, nz)]
+            owner += [cid(i, j, 0), cid(i, j, nz - 1)]
+
+    def header(obj, of_class):
+        text = foam_header(obj, of_class, "constant/polyMesh")
+        if fmt == "binary":
+            text = text.replace("format      ascii;", "format      binary;").replace(
+                "    class", '    arch        "LSB;label=32;scalar=64";\n    class'
+            )
+        return text.encode()
+
+    def binary_list(arr, dtype):
+        arr = np.asarray(arr, dtype=dtype)
+        return b"\n%d\n(" % (arr.size // (3 if arr.ndim > 1 else 1)) + arr.tobytes() + b")\n"
+
+    def ascii_list(items):
+        return b"\n%d\n(\n" % len(items) + "\n".join(items).encode() + b"\n)\n"
+
+    if fmt == "binary":
+        offsets = np.cumsum([0] + [len(f) for f in faces])
+        (d / "points").write_bytes(header("points", "vectorField") + binary_list(points, "<f8"))
+        (d / "faces").write_bytes(
+            header("faces", "faceCompactList")
+            + binary_list(offsets, "<i4")
+            + binary_list(np.concatenate(faces), "<i4")
+        )
+        for name, arr in (("owner", owner), ("neighbour", neighbour)):
+            (d / name).write_bytes(header(name, "labelList") + binary_list(arr, "<i4"))
+    else:
+        (d / "points").write_bytes(
+            header("points", "vectorField")
+            + ascii_list(["(%r %r %r)" % tuple(map(float, p)) for p in points])
+        )
+        (d / "faces").write_bytes(
+            header("faces", "faceList")
+            + ascii_list(["%d(%s)" % (len(f), " ".join(map(str, f))) for f in faces])
+        )
+        for name, arr in (("owner", owner), ("neighbour", neighbour)):
+            (d / name).write_bytes(header(name, "labelList") + ascii_list(list(map(str, arr))))
+    (d / "boundary").write_text(
+        foam_header("boundary", "polyBoundaryMesh", "constant/polyMesh")
+        + "\n1\n(\n    walls\n    {\n        type            wall;\n"
+        + f"        nFaces          {len(faces) - n_internal};\n"
+        + f"        startFace       {n_internal};\n    }}\n)\n"
+    )
+    return points
+
+
+def write_scalar_field(path, name, values):
+    """Write an ASCII volScalarField file with a nonuniform internalField."""
+    from carbonfly.utils import foam_header
+
+    body = "\n".join(f"{float(v)!r}" for v in values)
+    Path(path).write_text(
+        foam_header(name, "volScalarField", Path(path).parent.name)
+        + "\ndimensions      [0 0 0 0 0 0 0];\n\n"
+        + f"internalField   nonuniform List<scalar>\n{len(values)}\n(\n{body}\n);\n\n"
+        + "boundaryField\n{\n}\n"
+    )
@@ -0,0 +1,220 @@
+import inspect
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from carbonfly.case import (
+    _load_build_record,
+    _save_build_record,
+    _sync_staged_files,
+    build_case,
+    build_case_variants,
+    clone_meshed_case,
+)
+from carbonfly.mesh_cache import MeshCache
+from carbonfly.polymesh import read_boundary
+from conftest import make_cfgeos
+
+
+def _write(root, rel, text):
+    p = root / rel
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(text)
+    return p
+
+
+def test_incremental_sync_keeps_unchanged_and_removes_stale(tmp_path):
+    case = tmp_path / "case"
+    staging = tmp_path / "staging"
+    unchanged = _write(case, "0/T", "T 300;")
+    os.utime(unchanged, (1, 1))
+    _write(case, "0/CO2", "old")
+    _write(case, "0/Ydefault", "from an earlier build")
+    _write(case, "constant/triSurface/old.stl", "solid old")
+    _write(case, "constant/triSurface/model.eMesh", "surfaceFeatures output")
+    _write(case, "system/fvSchemes", "user file")
+    # files added by hand, not listed in the previous build record
+    _write(case, "0/H2O", "user field")
+    _write(case, "0/T.orig", "user backup")
+    _write(case, "constant/triSurface/extra.stl", "solid extra")
+    previous = ["0/T", "0/CO2", "0/Ydefault", "constant/triSurface/old.stl"]
+    _save_build_record(case, [Path(f) for f in previous])
+
+    _write(staging, "0/T", "T 300;")
+    _write(staging, "0/CO2", "new")
+    _write(staging, "constant/triSurface/model.stl", "solid model")
+
+    m = _sync_staged_files(staging, case)
+
+    assert m.unchanged == [Path("0/T")]
+    assert sorted(m.changed) == [Path("0/CO2"), Path("constant/triSurface/model.stl")]
+    assert sorted(m.removed) == [Path("0/Ydefault"), Path("constant/triSurface/old.stl")]
+    assert m.geometry_changed and m.fields_changed
+    assert unchanged.stat().st_mtime == 1
+    assert (case / "0/CO2").read_text() == "new"
+    assert not (case / "0/Ydefault").exists()
+    # files the build does not own are kept
+    assert (case / "constant/triSurface/model.eMesh").exists()
+    assert (case / "system/fvSchemes").exists()
+    for rel in ("0/H2O", "0/T.orig", "constant/triSurface/extra.stl"):
+        assert (case / rel).exists()
+    assert not staging.exists()
+    assert _load_build_record(case) == {
+        Path("0/T"),
+        Path("0/CO2"),
+        Path("constant/triSurface/model.stl"),
+    }
+
+
+def test_incremental_sync_without_build_record_removes_nothing(tmp_path):
+    case = tmp_path / "case"
+    staging = tmp_path / "staging"
+    _write(case, "0/Ydefault", "from a non-incremental build")
+    _write(staging, "0/T", "T 300;")
+
+    m = _sync_staged_files(staging, case)
+
+    assert m.removed == []
+    assert (case / "0/Ydefault").exists()
+    assert _load_build_record(case) == {Path("0/T")}
+
+
+def test_incremental_sync_leaves_unstaged_folders_alone(tmp_path):
+    case = tmp_path / "case"
+    staging = tmp_path / "staging"
+    _write(case, "constant/triSurface/model.stl", "solid model")
+    _write(staging, "0/U", "U")
+
+    m = _sync_staged_files(staging, case)
+
+    assert m.removed == [] and not m.geometry_changed
+    assert (case / "constant/triSurface/model.stl").exists()
+
+
+# keyword arguments for build_case without Rhino (no bounding box) or fv templates
+BUILD_KWARGS = dict(write_blockmesh=False, write_fv=False)
+
+
+def test_parallel_meshing_matches_serial_build(tmp_path, fake_meshing):
+    geos = make_cfgeos(5)
+    build_case(tmp_path / "serial", geos, **BUILD_KWARGS)
+    logs, paths = build_case(tmp_path / "parallel", geos, mesh_workers=4, **BUILD_KWARGS)
+
+    rel = Path("constant/triSurface/model.stl")
+    assert (tmp_path / "serial" / rel).read_bytes() == (tmp_path / "parallel" / rel).read_bytes()
+    assert [name for name, _ in paths["mesh_timings"]] == ["r0", "r1", "r2", "r3", "r4"]
+    assert any("(4 worker(s))" in ln for ln in logs)
+
+
+def test_parallel_meshing_with_cache_reuses_meshes(tmp_path, fake_meshing):
+    cache = MeshCache()
+    geos = make_cfgeos(4)
+    build_case(tmp_path / "a", geos, mesh_cache=cache, mesh_workers=3, **BUILD_KWARGS)
+    logs, _ = build_case(tmp_path / "b", geos, mesh_cache=cache, mesh_workers=3, **BUILD_KWARGS)
+    assert sorted(fake_meshing) == [0, 1, 2, 3]
+    assert "carbonfly - mesh cache: 4 of 4 region(s) reused" in logs
+
+
+def test_build_case_keeps_baseline_positional_order(tmp_path, fake_meshing):
+    # stl_file_name, unit, internal_U, internal_T are the 3rd..6th positional arguments
+    _, paths = build_case(tmp_path, make_cfgeos(1), "room.stl", "m", (0.5, 0, 0), 301.0, **BUILD_KWARGS)
+    assert paths["stl"] == tmp_path / "constant" / "triSurface" / "room.stl"
+    assert "uniform (0.5 0 0)" in (tmp_path / "0" / "U").read_text()
+    assert "uniform 301" in (tmp_path / "0" / "T").read_text()
+    params = inspect.signature(build_case).parameters.values()
+    positional = [p.name for p in params if p.kind is p.POSITIONAL_OR_KEYWORD]
+    assert positional[4] == "internal_U" and positional[-1] == "write_residuals"
+
+
+def test_build_case_variants_share_geometry(tmp_path, fake_meshing):
+    from carbonfly.boundary import Boundary, FieldFV
+    from carbonfly.control_dict import make_default
+
+    variants = [
+        {"name": "base"},
+        {
+            "name": "warm",
+            "boundaries": {"r1": Boundary("ignored", btype="wall", fields={"T": FieldFV(310.0)})},
+            "internal": {"internal_T": 296.15},
+            "control_dict": {"endTime": 30},
+        },
+    ]
+    results = build_case_variants(
+        tmp_path, make_cfgeos(2), variants, control_dict=make_default("transient"), **BUILD_KWARGS
+    )
+
+    assert list(results) == ["base", "warm"]
+    assert fake_meshing == [0, 1]  # only the first variant meshes
+    stl = Path("constant/triSurface/model.stl")
+    assert (tmp_path / "warm" / stl).read_bytes() == (tmp_path / "base" / stl).read_bytes()
+    t_field = (tmp_path / "warm" / "0" / "T").read_text()
+    assert "310" in t_field and "296.15" in t_field
+    warm_cd = (tmp_path / "warm" / "system" / "controlDict").read_text()
+    base_cd = (tmp_path / "base" / "system" / "controlDict").read_text()
+    assert re.search(r"^endTime\s+30;", warm_cd, re.M)
+    assert re.search(r"^endTime\s+120;", base_cd, re.M)
+
+
+BOUNDARY = """FoamFile
+{
+    version     2.0;
+    format      ascii;
+    class       polyBoundaryMesh;
+    object      boundary;
+}
+// comment
+3
+(
+    r0
+    {
+        type            wall;
+        nFaces          12;
+        startFace       100;
+    }
+    r1 { type wall; nFaces 6; startFace 112; }
+    /* unused */
+    defaultFaces
+    {
+        type            empty;
+        nFaces          0;
+        startFace       118;
+    }
+)
+"""
+
+
+def _meshed_case(root):
+    _write(root, "constant/polyMesh/boundary", BOUNDARY)
+    _write(root, "constant/polyMesh/points", "points")
+    _write(root, "system/controlDict", "source controlDict")
+    _write(root, "system/snappyHexMeshDict", "snappy")
+    return root
+
+
+def test_read_boundary_lists_patches_in_file_order(tmp_path):
+    patches = read_boundary(_meshed_case(tmp_path / "src"))
+    assert list(patches) == ["r0", "r1", "defaultFaces"]
+    assert patches["r1"] == {"type": "wall", "nFaces": "6", "startFace": "112"}
+
+
+@pytest.mark.parametrize("link", ["symlink", "copy"])
+def test_clone_meshed_case_reuses_polymesh(tmp_path, fake_meshing, link):
+    src = _meshed_case(tmp_path / "src")
+    logs, paths = clone_meshed_case(src, tmp_path / "dst", make_cfgeos(2), link=link, **BUILD_KWARGS)
+
+    dst_mesh = tmp_path / "dst" / "constant" / "polyMesh"
+    assert paths["polyMesh"] == dst_mesh
+    assert (dst_mesh / "points").read_text() == "points"
+    assert dst_mesh.is_symlink() == (link == "symlink")
+    assert (tmp_path / "dst" / "system" / "controlDict").read_text() == "source controlDict"
+    assert (tmp_path / "dst" / "0" / "T").is_file()
+    assert fake_meshing == []  # nothing is meshed
+
+
+def test_clone_meshed_case_checks_patch_names_first(tmp_path, fake_meshing):
+    src = _meshed_case(tmp_path / "src")
+    with pytest.raises(ValueError, match="r2"):
+        clone_meshed_case(src, tmp_path / "dst", make_cfgeos(3), **BUILD_KWARGS)
+    assert not (tmp_path / "dst").exists()
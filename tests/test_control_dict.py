@@ -0,0 +1,10 @@
+from carbonfly.control_dict import make_default, merge_control_dict
+
+
+def test_merge_control_dict_merges_functions_by_name():
+    base = make_default("transient")
+    out = merge_control_dict(base, {"endTime": 60, "functions": {"probes": {"type": "probes"}}})
+    assert out["endTime"] == 60
+    assert set(out["functions"]) == {"residuals", "CoNum", "probes"}
+    # inputs are not modified
+    assert base["endTime"] == 120 and "probes" not in base["functions"]
@@ -0,0 +1,59 @@
+import pytest
+
+from carbonfly.decompose_writer import (
+    choose_n_subdomains,
+    estimate_cell_count,
+    read_number_of_subdomains,
+    split_subdomains,
+    write_decompose_par_dict,
+)
+
+_BLOCKMESH = """
+blocks
+(
+    hex (0 1 2 3 4 5 6 7) (80 20 10) simpleGrading (1 1 1)
+);
+"""
+
+
+@pytest.mark.parametrize(
+    "n, extents, expected",
+    [(1, None, (1, 1, 1)), (8, None, (2, 2, 2)), (4, (80.0, 20.0, 10.0), (4, 1, 1))],
+)
+def test_split_subdomains_minimizes_cut_area(n, extents, expected):
+    assert split_subdomains(n, extents) == expected
+
+
+def test_choose_n_subdomains_is_capped_by_cells():
+    assert choose_n_subdomains(None, max_subdomains=6) == 6
+    assert choose_n_subdomains(120000, 50000, max_subdomains=16) == 2
+    assert choose_n_subdomains(10, 50000, max_subdomains=16) == 1
+
+
+def test_estimate_cell_count_prefers_polymesh_owner(tmp_path):
+    (tmp_path / "system").mkdir()
+    (tmp_path / "system" / "blockMeshDict").write_text(_BLOCKMESH)
+    assert estimate_cell_count(tmp_path) == 16000
+
+    poly = tmp_path / "constant" / "polyMesh"
+    poly.mkdir(parents=True)
+    (poly / "owner").write_text('note "nPoints:10 nCells:1234 nFaces:20";\n')
+    assert estimate_cell_count(tmp_path) == 1234
+
+
+def test_write_hierarchical_uses_blockmesh_split(tmp_path):
+    (tmp_path / "system").mkdir()
+    (tmp_path / "system" / "blockMeshDict").write_text(_BLOCKMESH)
+    out = write_decompose_par_dict(tmp_path, 4, "hierarchical")
+    text = out.read_text()
+    assert "method          hierarchical;" in text
+    assert "n           (4 1 1);" in text
+    assert read_number_of_subdomains(tmp_path) == 4
+
+
+def test_write_rejects_bad_split_and_method(tmp_path):
+    with pytest.raises(ValueError):
+        write_decompose_par_dict(tmp_path, 4, "simple", split=(2, 2, 2))
+    with pytest.raises(ValueError):
+        write_decompose_par_dict(tmp_path, 4, "metis")
+    assert read_number_of_subdomains(tmp_path) is None
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from carbonfly.field_stats import field_statistics, weighted_percentiles, zone_mask
+from conftest import write_hex_mesh, write_scalar_field
+
+
+def test_weighted_percentiles():
+    values = np.array([3.0, 1.0, 2.0, 4.0])
+    weights = np.array([1.0, 1.0, 1.0, 7.0])
+    assert weighted_percentiles(values, weights, [0, 25, 50, 100]).tolist() == [1, 3, 4, 4]
+    assert np.isnan(weighted_percentiles(values[:0], weights[:0], [50])).all()
+
+
+def test_zone_mask():
+    centres = np.array([[0.5, 0.5, 0.5], [0.5, 0.5, 1.5], [2.5, 0.5, 1.5]])
+    assert zone_mask(centres, z_range=(1.0, None)).tolist() == [False, True, True]
+    assert zone_mask(centres, box=((0, 0, 0), (1, 1, 2)), z_range=(1, 2)).tolist() == [
+        False,
+        True,
+        False,
+    ]
+
+
+@pytest.fixture
+def co2_case(tmp_path):
+    # 4 x 1 x 2 cells of 1 m^3; cell i at x = i % 4 + 0.5, z = i // 4 + 0.5
+    write_hex_mesh(tmp_path / "constant" / "polyMesh", (4, 1, 2), (4.0, 1.0, 2.0))
+    for t, base in (("0", 400.0), ("60", 800.0), ("120", 1200.0), ("latestBackup", 0.0)):
+        (tmp_path / t).mkdir()
+        write_scalar_field(tmp_path / t / "CO2", "CO2", (base + 100 * np.arange(8)) * 1e-6)
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [None, 3])
+def test_field_statistics_matches_numpy(co2_case, workers):
+    stats = field_statistics(
+        co2_case, "CO2", scale=1e6, threshold=1000, percentiles=(50,), workers=workers
+    )
+    assert stats["time_dirs"] == ["0", "60", "120"]
+    assert stats["n_cells"] == 8 and stats["volume"] == pytest.approx(8.0)
+    np.testing.assert_allclose(stats["mean"], [750.0, 1150.0, 1550.0])
+    np.testing.assert_allclose(stats["min"], [400.0, 800.0, 1200.0])
+    np.testing.assert_allclose(stats["percentiles"][50], [700.0, 1100.0, 1500.0])
+    np.testing.assert_allclose(stats["fraction_above"], [1 / 8, 5 / 8, 1.0])
+
+
+def test_field_statistics_zone_and_time_range(co2_case):
+    stats = field_statistics(co2_case, "CO2", scale=1e6, z_range=(1.0, None), time_range=(60, 60))
+    assert stats["n_cells"] == 4
+    np.testing.assert_allclose(stats["mean"], [1350.0])
+    with pytest.raises(ValueError):
+        field_statistics(co2_case, "CO2", z_range=(5.0, None))
+    with pytest.raises(FileNotFoundError):
+        field_statistics(co2_case, "T")
@@ -0,0 +1,70 @@
+import gzip
+
+import numpy as np
+import pytest
+
+from carbonfly.postproc import read_foam_field
+from carbonfly.utils import skip_foam_space
+
+
+def _field(of_class, body, fmt="ascii", arch="LSB;label=32;scalar=64"):
+    head = (
+        "/* banner */\nFoamFile\n{\n    version 2.0;\n"
+        f"    format {fmt};\n    arch \"{arch}\";\n    class {of_class};\n"
+        "    object CO2;\n}\n// comment\n\ndimensions [0 0 0 0 0 0 0];\n\n"
+    )
+    return head.encode() + body + b"\nboundaryField\n{\n}\n"
+
+
+def test_skip_foam_space_skips_comments():
+    buf = b"  // line\n /* block\n */\t 42"
+    assert buf[skip_foam_space(buf, 0) :] == b"42"
+    assert skip_foam_space(b"  /* open", 0) == len(b"  /* open")
+
+
+def test_ascii_scalar_and_vector_fields(tmp_path):
+    fp = tmp_path / "CO2"
+    fp.write_bytes(_field("volScalarField", b"internalField nonuniform List<scalar>\n3\n(\n400\n410.5\n420\n);"))
+    f = read_foam_field(fp)
+    assert (f.name, f.field_class, f.uniform) == ("CO2", "volScalarField", False)
+    assert f.dimensions == "[0 0 0 0 0 0 0]"
+    assert f.values.tolist() == [400.0, 410.5, 420.0]
+
+    fp = tmp_path / "U"
+    fp.write_bytes(_field("volVectorField", b"internalField nonuniform List<vector> 2((1 2 3) (4 5 6));"))
+    assert read_foam_field(fp).values.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_uniform_and_compact_list_fields(tmp_path):
+    fp = tmp_path / "U"
+    fp.write_bytes(_field("volVectorField", b"internalField uniform (0 0 0.1);"))
+    f = read_foam_field(fp)
+    assert f.uniform and f.values.tolist() == [0, 0, 0.1]
+    assert f.expand(4).shape == (4, 3)
+
+    fp = tmp_path / "T"
+    fp.write_bytes(_field("volScalarField", b"internalField nonuniform List<scalar> 5{300};"))
+    assert read_foam_field(fp).values.tolist() == [300.0] * 5
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_binary_field_is_a_zero_copy_view(tmp_path, mmap):
+    values = np.arange(6, dtype="<f8").reshape(2, 3)
+    body = b"internalField nonuniform List<vector> 2(" + values.tobytes() + b");"
+    fp = tmp_path / "U"
+    fp.write_bytes(_field("volVectorField", body, fmt="binary"))
+    f = read_foam_field(fp, mmap=mmap)
+    np.testing.assert_array_equal(f.values, values)
+    assert not f.values.flags.writeable and not f.values.flags.owndata
+
+
+def test_gz_field_and_errors(tmp_path):
+    with gzip.open(tmp_path / "CO2.gz", "wb") as g:
+        g.write(_field("volScalarField", b"internalField uniform 400;"))
+    assert float(read_foam_field(tmp_path / "CO2").values) == 400.0
+
+    with pytest.raises(FileNotFoundError):
+        read_foam_field(tmp_path / "missing")
+    (tmp_path / "bad").write_bytes(_field("dictionary", b""))
+    with pytest.raises(ValueError):
+        read_foam_field(tmp_path / "bad")
@@ -0,0 +1,54 @@
+import math
+
+from carbonfly.postproc import InternalProbesFollower, ResidualsFollower, TableFollower, follow
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def test_table_follower_reads_only_complete_new_lines(tmp_path):
+    fp = tmp_path / "probes" / "0" / "CO2"
+    fp.parent.mkdir(parents=True)
+    _append(fp, "# Probe 0 (0 0 0)\n# Probe 1 (1 0 0)\n#   Time\n1  400  (1 2 3)\n2  41")
+    tail = TableFollower(fp)
+    assert tail.poll() == [[1.0, 400.0, 1.0, 2.0, 3.0]]
+    assert tail.columns == ["Time", "0", "1"]
+    assert tail.poll() == []
+
+    _append(fp, "0  (4 5 6)\n")
+    assert tail.poll() == [[2.0, 410.0, 4.0, 5.0, 6.0]]
+
+    fp.write_text("# Time p\n5 1\n")  # rewritten (shorter): start over
+    assert tail.poll() == [[5.0, 1.0]]
+    assert tail.columns == ["Time", "p"]
+
+
+def test_residuals_follower_picks_up_restarts(tmp_path):
+    base = tmp_path / "postProcessing" / "residuals"
+    (base / "0").mkdir(parents=True)
+    _append(base / "0" / "residuals.dat", "# Time p_rgh CO2\n1 1e-2 N/A\n")
+    res = ResidualsFollower(tmp_path)
+    (row,) = res.poll()
+    assert row["p_rgh"] == 1e-2 and math.isnan(row["CO2"])
+
+    (base / "1").mkdir()
+    _append(base / "1" / "residuals.dat", "# Time p_rgh CO2\n2 1e-3 1e-4\n")
+    _append(base / "0" / "residuals.dat", "1.5 5e-3 N/A\n")
+    assert [r["Time"] for r in res.poll()] == [1.5, 2.0]
+
+
+def test_internal_probes_follower_waits_for_stable_size(tmp_path):
+    base = tmp_path / "postProcessing" / "internalProbes"
+    (base / "0").mkdir(parents=True)
+    (base / "0" / "points.xy").write_text("# distance x y z CO2\n0 0 0 0 400\n")
+    probes = InternalProbesFollower(tmp_path, skip_existing=True)
+
+    (base / "10").mkdir()
+    (base / "10" / "points.xy").write_text("# distance x y z CO2\n0 0 0 0 410\n")
+    assert probes.poll() == []  # size seen for the first time
+    (item,) = list(follow(probes, interval=0.0, timeout=0.05))
+    assert item["time_dir"] == "10"
+    assert item["data"]["scalars"]["CO2"] == [410.0]
+    assert probes.seen == {"0", "10"}
@@ -0,0 +1,196 @@
+import math
+
+import numpy as np
+import pytest
+
+from carbonfly.iaq import (
+    IAQStreamEvaluator,
+    _CO2_STANDARDS,
+    iaq_co2,
+    iaq_co2_array,
+    iaq_co2_report,
+    iaq_co2_timeseries,
+    iter_csv_chunks,
+    rolling_time_mean,
+)
+
+# every threshold, its float neighbours and values in between
+_LIMITS = sorted({t + o for s in _CO2_STANDARDS.values() for t in s.thresholds for o in (0, 400)})
+_CO2 = sorted(
+    {v for t in _LIMITS for v in (t, math.nextafter(t, -math.inf), math.nextafter(t, math.inf))}
+    | {0.0, 350.0, 612.5, 5000.0}
+)
+
+
+@pytest.mark.parametrize("standard", list(_CO2_STANDARDS))
+def test_array_indices_match_scalar_version(standard):
+    _, ref = iaq_co2(_CO2, 400, standard)
+    got = iaq_co2_array(np.array(_CO2), 400, standard)
+    assert got.dtype == np.int8
+    assert got.tolist() == ref
+
+
+@pytest.mark.parametrize("standard", ["EN", "SS", "NBR"])
+def test_array_with_dynamic_outdoor_and_nan(standard):
+    indoor = _CO2 + [math.nan]
+    outdoor = [380.0 + 10 * (i % 5) for i in range(len(indoor))]
+    _, ref = iaq_co2(indoor, outdoor, standard)
+    assert iaq_co2_array(indoor, outdoor, standard).tolist() == ref
+
+    with pytest.raises(ValueError):
+        iaq_co2_array(indoor, outdoor[:-1], standard)
+
+
+def test_array_keeps_shape_and_rejects_unknown_standard():
+    assert iaq_co2_array(np.full((2, 3), 900.0), standard="HK").shape == (2, 3)
+    with pytest.raises(ValueError):
+        iaq_co2_array([800.0], standard="WHO")
+
+
+def _rolling_mean_brute_force(t, v, window, max_gap):
+    mean, coverage = [], []
+    for i in range(len(t)):
+        s, num, den = t[i] - window, 0.0, 0.0
+        for j in range(1, i + 1):
+            d = t[j] - t[j - 1]
+            if math.isnan(v[j]) or (max_gap is not None and d > max_gap):
+                continue
+            overlap = max(0.0, t[j] - max(t[j - 1], s))
+            num += v[j] * overlap
+            den += overlap
+        mean.append(num / den if den > 0 else math.nan)
+        coverage.append(min(den / window, 1.0))
+    return np.array(mean), np.array(coverage)
+
+
+@pytest.mark.parametrize("max_gap", [None, 200.0])
+def test_rolling_time_mean_matches_brute_force(max_gap):
+    rng = np.random.default_rng(7)
+    t = np.cumsum(rng.choice([30.0, 60.0, 90.0, 600.0], size=300, p=[0.3, 0.5, 0.15, 0.05]))
+    v = rng.uniform(400, 1600, size=t.size)
+    v[rng.integers(0, t.size, 10)] = np.nan
+    mean, coverage = rolling_time_mean(t, v, 900.0, max_gap)
+    ref_mean, ref_cov = _rolling_mean_brute_force(t, v, 900.0, max_gap)
+    np.testing.assert_allclose(mean, ref_mean, rtol=1e-9)
+    np.testing.assert_allclose(coverage, ref_cov, rtol=1e-9, atol=1e-12)
+
+
+def test_timeseries_uses_hk_8h_mean_and_datetimes():
+    t0 = np.datetime64("2026-01-05T08:00")
+    times = t0 + np.arange(0, 10 * 3600, 600).astype("timedelta64[s]")
+    co2 = np.where(np.arange(times.size) < 30, 700.0, 1300.0)
+    res = iaq_co2_timeseries(times, co2, standard="HK")
+    assert res["window"] == 8 * 3600
+    # first samples: window not covered enough
+    assert res["indices"][0] == 0 and res["coverage"][0] == 0.0
+    # the 8 h mean only exceeds 1000 ppm some time after the step to 1300 ppm
+    first_bad = int(np.argmax(res["indices"] == 3))
+    assert res["mean"][first_bad] > 1000 >= res["mean"][first_bad - 1]
+    assert first_bad > 30
+
+    # timestamps given as seconds since the epoch give the same result
+    secs = (times - np.datetime64(0, "s")) / np.timedelta64(1, "s")
+    np.testing.assert_array_equal(iaq_co2_timeseries(secs, co2)["indices"], res["indices"])
+
+
+def _sensor_series(n=400, seed=11):
+    rng = np.random.default_rng(seed)
+    t = np.cumsum(rng.choice([60.0, 120.0, 3600.0], size=n, p=[0.6, 0.35, 0.05]))
+    indoor = 400 + np.abs(np.cumsum(rng.normal(0, 60, n)))
+    indoor[rng.integers(0, n, 5)] = np.nan
+    outdoor = rng.uniform(380, 450, n)
+    return t, indoor, outdoor
+
+
+def test_report_matches_per_standard_evaluation():
+    t, indoor, outdoor = _sensor_series()
+    rep = iaq_co2_report(indoor, outdoor, times=t, max_gap=600.0)
+    assert list(rep["standards"]) == list(_CO2_STANDARDS)
+    assert rep["n_missing"] == int(np.isnan(indoor).sum())
+
+    ok = ~np.isnan(indoor)
+    d = np.diff(t, prepend=t[:1])
+    d[d > 600.0] = 0.0
+    for code, entry in rep["standards"].items():
+        idx = iaq_co2_array(indoor, outdoor, code)[ok]
+        n_cat = len(_CO2_STANDARDS[code].thresholds) + 1
+        assert entry["counts"].tolist() == np.bincount(idx - 1, minlength=n_cat).tolist()
+        hours = np.bincount(idx - 1, weights=d[ok], minlength=n_cat) / 3600.0
+        np.testing.assert_allclose(entry["hours"], hours)
+        assert sum(entry["fractions"]) == pytest.approx(1.0)
+        th = _CO2_STANDARDS[code].thresholds[0]
+        assert entry["hours_above"][th] == pytest.approx(hours[1:].sum())
+
+
+def _longest_run_brute_force(above, d, breaks):
+    best = cur = 0.0
+    for a, di, b in zip(above, d, breaks):
+        cur = (0.0 if b else cur) + di if a else 0.0
+        best = max(best, cur)
+    return best
+
+
+def test_report_longest_exceedance_and_fixed_interval():
+    t, indoor, _ = _sensor_series(seed=5)
+    rep = iaq_co2_report(indoor, times=t, max_gap=600.0, standards=["UBA", "HK"])
+    d = np.diff(t, prepend=t[:1])
+    breaks = d > 600.0
+    d[breaks] = 0.0
+    for code, th, strict in (("UBA", 1000, True), ("HK", 1000, False)):
+        above = indoor >= th if strict else indoor > th
+        expected = _longest_run_brute_force(above, d, breaks) / 3600.0
+        got = rep["standards"][code]["longest_exceedance_hours"][th]
+        assert got == pytest.approx(expected)
+
+    hourly = iaq_co2_report([900.0, 1100.0, 1100.0, 700.0], standards=["HK"])
+    assert hourly["hours"] == 4.0
+    assert hourly["standards"]["HK"]["counts"].tolist() == [1, 1, 2]
+    assert hourly["standards"]["HK"]["longest_exceedance_hours"] == {800: 3.0, 1000: 2.0}
+    with pytest.raises(ValueError):
+        iaq_co2_report([900.0], standards=["WHO"])
+
+
+def _write_sensor_csv(path, t, indoor, outdoor):
+    stamps = np.datetime64("2026-03-02T00:00:00") + t.astype("timedelta64[s]")
+    lines = ["time,CO2,CO2_out"]
+    for ts, a, b in zip(stamps, indoor, outdoor):
+        lines.append(f"{ts},{'' if np.isnan(a) else round(a, 3)},{round(b, 3)}")
+    path.write_text("\n".join(lines) + "\n")
+    return stamps
+
+
+def test_stream_evaluator_matches_in_memory_report(tmp_path):
+    t, indoor, outdoor = _sensor_series(n=700, seed=2)
+    indoor, outdoor = np.round(indoor, 3), np.round(outdoor, 3)
+    stamps = _write_sensor_csv(tmp_path / "s.csv", t, indoor, outdoor)
+    chunks = iter_csv_chunks(
+        tmp_path / "s.csv", "CO2", time_column="time", outdoor_column="CO2_out", chunk_size=37
+    )
+    stream = IAQStreamEvaluator(max_gap=600.0).consume(chunks).result()
+    ref = iaq_co2_report(indoor, outdoor, times=stamps, max_gap=600.0)
+
+    assert (stream["n_samples"], stream["n_missing"]) == (ref["n_samples"], ref["n_missing"])
+    assert stream["hours"] == pytest.approx(ref["hours"])
+    for code, entry in ref["standards"].items():
+        got = stream["standards"][code]
+        assert got["counts"].tolist() == entry["counts"].tolist()
+        np.testing.assert_allclose(got["hours"], entry["hours"])
+        for th, hours in entry["longest_exceedance_hours"].items():
+            assert got["longest_exceedance_hours"][th] == pytest.approx(hours)
+    for key, values in ref["percentiles"].items():
+        for p, v in values.items():
+            assert abs(stream["percentiles"][key][p] - v) <= 1.0  # histogram resolution
+
+    # the HK 8-hour mean, carried across chunk boundaries
+    hk = iaq_co2_timeseries(stamps, indoor, standard="HK", max_gap=600.0)["indices"]
+    assert stream["averaged"]["HK"]["counts"].tolist() == np.bincount(hk, minlength=4).tolist()
+
+
+def test_iter_csv_chunks_columns_and_errors(tmp_path):
+    fp = tmp_path / "s.csv"
+    fp.write_text("t;co2\n0;500\n60;n/a\n\n120;700\n")
+    (chunk,) = iter_csv_chunks(fp, 1, time_column=0, delimiter=";")
+    assert chunk["times"].tolist() == [0.0, 60.0, 120.0]
+    assert np.isnan(chunk["co2_indoor"][1]) and "co2_outdoor" not in chunk
+    with pytest.raises(ValueError):
+        next(iter_csv_chunks(fp, "CO2", delimiter=";"))
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+from carbonfly.jobs import FoamJob, JobProgress, start_job
+from conftest import shell_runner
+
+_LOG = [
+    "Courant Number mean: 0.01 max: 0.25",
+    "Time = 0.5",
+    "Refinement phase",
+    "Surface refinement iteration 3",
+]
+
+
+def test_progress_parses_solver_and_snappy_lines():
+    p = JobProgress()
+    for line in _LOG:
+        p.update(line)
+    assert (p.time, p.courant_mean, p.courant_max) == (0.5, 0.01, 0.25)
+    assert (p.snappy_phase, p.iteration_kind, p.iteration) == ("castellate", "Surface", 3)
+    assert p.n_lines == 4
+
+
+def test_foam_job_streams_lines_and_writes_log(tmp_path):
+    command = "; ".join(f"echo '{line}'" for line in _LOG) + "; exit 2"
+
+    async def main():
+        job = FoamJob(command, tmp_path, runner=shell_runner(), log_rel="logs/run.log")
+        await job.start()
+        seen = [line async for line in job.lines()]
+        return job, seen, await job.wait()
+
+    job, seen, rc = asyncio.run(main())
+    assert rc == 2 and job.status == "failed"
+    assert job.progress.time == 0.5
+    assert job.tail(1) == [_LOG[-1]]
+    assert (tmp_path / "logs" / "run.log").read_text().splitlines() == _LOG
+    # lines() subscribes from the time of the call: what it saw is a suffix of the log
+    assert seen == _LOG[len(_LOG) - len(seen) :]
+
+
+def test_background_job_can_be_cancelled(tmp_path):
+    bg = start_job("echo started; sleep 30", tmp_path, runner=shell_runner())
+    deadline = time.time() + 5
+    while not bg.tail() and time.time() < deadline:
+        time.sleep(0.01)
+    bg.cancel()
+    bg.wait(timeout=5)
+    assert bg.done() and bg.status == "cancelled"
+    assert bg.tail() == ["started"]
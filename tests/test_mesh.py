@@ -0,0 +1,151 @@
+import ctypes
+import struct
+
+import numpy as np
+import pytest
+
+from carbonfly import mesh as cf_mesh
+from carbonfly.mesh import (
+    binary_stl_region_name,
+    mesh_triangle_arrays,
+    write_multi_solid_ascii_stl,
+    write_multi_solid_binary_stl,
+)
+from conftest import box_mesh
+
+
+def _read_binary_stl(path):
+    data = path.read_bytes()
+    (n,) = struct.unpack_from("<I", data, 80)
+    rec = np.frombuffer(
+        data,
+        dtype=[("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")],
+        count=n,
+        offset=84,
+    )
+    return data[:80], rec
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_binary_stl_records_and_regions(tmp_path, fake_rhino, vectorized):
+    meshes = [
+        ("inlet", box_mesh()),
+        ("walls", box_mesh(origin=(1000.0, 0.0, 0.0))),
+        ("inlet", box_mesh(origin=(0.0, 2000.0, 0.0))),
+    ]
+    out = write_multi_solid_binary_stl(tmp_path / "m.stl", meshes, "mm", vectorized=vectorized)
+
+    header, rec = _read_binary_stl(out)
+    assert not header.startswith(b"solid")
+    assert out.stat().st_size == 84 + 50 * 36
+    assert len(rec) == 36
+    # repeated names share a region, numbered in first-seen order
+    assert rec["attr"].tolist() == [0] * 12 + [1] * 12 + [0] * 12
+    np.testing.assert_allclose(rec["vertices"][12:24, :, 0].min(), 1.0)
+    np.testing.assert_allclose(np.linalg.norm(rec["normal"], axis=1), 1.0, rtol=1e-6)
+    assert binary_stl_region_name(1) == "patch1"
+
+
+def test_binary_stl_vectorized_matches_default(tmp_path, fake_rhino):
+    meshes = [("a", box_mesh(size=(2.0, 3.0, 4.0))), ("b", box_mesh(quads=True))]
+    ref = write_multi_solid_binary_stl(tmp_path / "ref.stl", meshes, "cm")
+    vec = write_multi_solid_binary_stl(tmp_path / "vec.stl", meshes, "cm", vectorized=True)
+    _, a = _read_binary_stl(ref)
+    _, b = _read_binary_stl(vec)
+    np.testing.assert_array_equal(a["vertices"], b["vertices"])
+    np.testing.assert_array_equal(a["attr"], b["attr"])
+    np.testing.assert_allclose(a["normal"], b["normal"], atol=1e-6)
+
+
+def _parse_ascii_stl(path):
+    solids, facets = [], []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        words = line.split()
+        if words[0] == "solid":
+            solids.append(words[1])
+        elif words[0] == "facet":
+            facets.append([float(x) for x in words[2:]])
+        elif words[0] == "vertex":
+            facets[-1] += [float(x) for x in words[1:]]
+    return solids, np.array(facets)
+
+
+def test_ascii_stl_streams_all_solids(tmp_path, fake_rhino):
+    meshes = [("inlet zone", box_mesh()), ("walls", box_mesh(origin=(10.0, 0.0, 0.0)))]
+    # small buffer: the output must not depend on how it is flushed
+    out = write_multi_solid_ascii_stl(tmp_path / "m.stl", iter(meshes), "cm", buffer_size=64)
+    text = out.read_text(encoding="utf-8")
+    assert text.count("endsolid") == 2
+    solids, facets = _parse_ascii_stl(out)
+    assert solids == ["inlet_zone", "walls"]
+    assert facets.shape == (24, 12)
+    np.testing.assert_allclose(facets[12:, 3::3].min(), 0.1)
+    np.testing.assert_allclose(np.linalg.norm(facets[:, :3], axis=1), 1.0, rtol=1e-5)
+
+
+# first facet of box_mesh(size=(2, 3, 4)) exported from "mm"
+_FIRST_FACET = (
+    b"solid a\n"
+    b"  facet normal 0.000000e+00 0.000000e+00 -1.000000e+00\n"
+    b"    outer loop\n"
+    b"      vertex 0.000000e+00 0.000000e+00 0.000000e+00\n"
+    b"      vertex 0.000000e+00 3.000000e-03 0.000000e+00\n"
+    b"      vertex 2.000000e-03 3.000000e-03 0.000000e+00\n"
+    b"    endloop\n"
+    b"  endfacet\n"
+)
+
+
+def test_ascii_stl_vectorized_matches_default(tmp_path, fake_rhino):
+    meshes = [("a", box_mesh(size=(2.0, 3.0, 4.0))), ("b", box_mesh(quads=True))]
+    ref = write_multi_solid_ascii_stl(tmp_path / "ref.stl", meshes, "mm")
+    vec = write_multi_solid_ascii_stl(tmp_path / "vec.stl", meshes, "mm", vectorized=True)
+    small = write_multi_solid_ascii_stl(tmp_path / "small.stl", meshes, "mm", buffer_size=16)
+    data = ref.read_bytes()
+    assert vec.read_bytes() == data
+    assert small.read_bytes() == data
+    assert data.startswith(_FIRST_FACET)
+    assert data.count(b"endfacet\n") == 24
+    assert data.endswith(b"    endloop\n  endfacet\nendsolid b\n")
+
+
+def test_mesh_triangle_arrays_splits_quads_and_normalises(fake_rhino):
+    tris, normals = mesh_triangle_arrays(box_mesh(size=(2.0, 1.0, 1.0), quads=True))
+    assert tris.shape == (12, 3, 3) and tris.dtype == np.float64
+    np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0)
+    # each normal is perpendicular to its facet
+    np.testing.assert_allclose(np.einsum("ij,ij->i", normals, tris[:, 1] - tris[:, 0]), 0.0)
+
+
+class _NetArray(list):
+    """Stands in for a .NET array: has GetType(), like pythonnet array objects."""
+
+    def GetType(self):
+        return type(self)
+
+
+class _FakeMarshal:
+    calls = 0
+
+    @classmethod
+    def Copy(cls, source, start, destination, length):
+        cls.calls += 1
+        ctype = ctypes.c_float if isinstance(source[0], float) else ctypes.c_int32
+        buf = (ctype * length)(*source[start : start + length])
+        ctypes.memmove(destination, buf, ctypes.sizeof(buf))
+
+
+def test_net_arrays_are_copied_in_bulk(fake_rhino, monkeypatch):
+    monkeypatch.setattr(cf_mesh, "Marshal", _FakeMarshal)
+    monkeypatch.setattr(cf_mesh, "IntPtr", int)
+    m = box_mesh(size=(0.5, 1.5, 2.5))
+    expected = mesh_triangle_arrays(m)
+
+    vf, fi = _NetArray(m.Vertices.ToFloatArray()), _NetArray(m.Faces.ToIntArray(True))
+    m.Vertices.ToFloatArray = lambda: vf
+    m.Faces.ToIntArray = lambda as_triangles: fi
+    _FakeMarshal.calls = 0
+    tris, normals = mesh_triangle_arrays(m)
+    assert _FakeMarshal.calls == 2
+    np.testing.assert_array_equal(tris, expected[0])
+    np.testing.assert_array_equal(normals, expected[1])
@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from carbonfly import mesh_cache
+from carbonfly.mesh_cache import MeshCache, _mesh_from_bytes, _mesh_to_bytes
+from conftest import box_mesh
+
+
+def _vertices(m):
+    return [(v.X, v.Y, v.Z) for v in m.Vertices]
+
+
+def test_disk_record_roundtrip(fake_rhino):
+    m = box_mesh(size=(0.5, 2.0, 3.0))
+    back = _mesh_from_bytes(_mesh_to_bytes(m))
+    assert _vertices(back) == _vertices(m)
+    assert back.Faces.ToIntArray(True) == m.Faces.ToIntArray(True)
+    assert _mesh_from_bytes(b"not a mesh") is None
+    assert _mesh_from_bytes(_mesh_to_bytes(m)[:-4]) is None
+
+
+def test_lru_eviction_and_disk_tier(tmp_path, fake_rhino):
+    cache = MeshCache(max_entries=2, disk_dir=tmp_path / "cache")
+    for key in ("a", "b", "c"):
+        cache.put(key, box_mesh(origin=(ord(key), 0.0, 0.0)))
+    assert len(cache) == 2
+    assert "a" in cache  # evicted from memory, still on disk
+    assert _vertices(cache.get("a"))[0] == (ord("a"), 0.0, 0.0)
+    cache.clear(disk=True)
+    assert "a" not in cache and cache.get("b") is None
+    with pytest.raises(ValueError):
+        MeshCache(max_entries=0)
+
+
+def test_mesh_brep_counts_hits_and_misses(monkeypatch, fake_rhino):
+    meshed = []
+
+    def fake_mesh(brep, mp=None):
+        meshed.append(brep)
+        return box_mesh()
+
+    monkeypatch.setattr(mesh_cache, "brep_geometry_hash", lambda brep, mp=None: f"h{brep}")
+    monkeypatch.setattr(mesh_cache, "brep_to_mesh", fake_mesh)
+    cache = MeshCache()
+    threads = [threading.Thread(target=cache.mesh_brep, args=(i % 2,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert cache.hits + cache.misses == 8
+    assert len(cache) == 2
+    assert cache.mesh_brep(0) is cache.get("h0")
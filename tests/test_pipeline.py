@@ -0,0 +1,60 @@
+import pytest
+
+from carbonfly.pipeline import Stage, plan_pipeline, run_pipeline
+from conftest import shell_runner
+
+
+def _stages():
+    return [
+        Stage("mesh", "cp in.txt mesh.txt", inputs=("in.txt",), outputs=("mesh.txt",)),
+        Stage("refine", "echo r >> mesh.txt", outputs=("mesh.txt",), depends=("mesh",),
+              overwrites=("mesh",)),
+        Stage("solve", "cat mesh.txt > out.txt", outputs=("out.txt",), depends=("refine",)),
+    ]
+
+
+def _statuses(results):
+    return [r.status for r in results]
+
+
+def test_second_run_skips_up_to_date_stages(tmp_path):
+    (tmp_path / "in.txt").write_text("a\n")
+    runner = shell_runner()
+    assert _statuses(run_pipeline(tmp_path, _stages(), runner=runner)) == ["ok"] * 3
+    assert _statuses(run_pipeline(tmp_path, _stages(), runner=runner)) == ["skipped"] * 3
+    # refine appended exactly once: mesh was not re-run on top of its output
+    assert (tmp_path / "out.txt").read_text() == "a\nr\n"
+
+
+def test_changed_input_reruns_downstream(tmp_path):
+    (tmp_path / "in.txt").write_text("a\n")
+    run_pipeline(tmp_path, _stages(), runner=shell_runner())
+    (tmp_path / "in.txt").write_text("b\n")
+    assert [run for _, _, run in plan_pipeline(tmp_path, _stages())] == [True] * 3
+
+
+def test_overwriting_stage_reruns_its_upstream(tmp_path):
+    (tmp_path / "in.txt").write_text("a\n")
+    run_pipeline(tmp_path, _stages(), runner=shell_runner())
+    stages = _stages()
+    stages[1].command = "echo s >> mesh.txt"
+    assert [run for _, _, run in plan_pipeline(tmp_path, stages)] == [True] * 3
+    run_pipeline(tmp_path, stages, runner=shell_runner())
+    assert (tmp_path / "out.txt").read_text() == "a\ns\n"
+
+
+def test_failure_stops_pipeline_and_is_not_cached(tmp_path):
+    (tmp_path / "in.txt").write_text("a\n")
+    stages = _stages()
+    stages[1].command = "exit 4"
+    results = run_pipeline(tmp_path, stages, runner=shell_runner())
+    assert _statuses(results) == ["ok", "failed", "not run"]
+    assert results[1].returncode == 4
+    assert [r for _, _, r in plan_pipeline(tmp_path, stages, targets=["refine"])] == [True] * 2
+
+
+def test_plan_rejects_unknown_and_cyclic_stages(tmp_path):
+    with pytest.raises(ValueError):
+        plan_pipeline(tmp_path, _stages(), targets=["nope"])
+    with pytest.raises(ValueError):
+        plan_pipeline(tmp_path, [Stage("a", "", depends=("b",)), Stage("b", "", depends=("a",))])
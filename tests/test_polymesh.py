@@ -0,0 +1,81 @@
+import numpy as np
+
+from carbonfly import polymesh
+from carbonfly.polymesh import (
+    cell_centres_volumes,
+    face_centres_areas,
+    load_cell_geometry,
+    read_polymesh,
+)
+from conftest import write_hex_mesh
+
+N, SIZE = (3, 2, 2), (2.0, 1.0, 1.5)
+
+
+def _expected_centres():
+    h = np.array(SIZE) / N
+    idx = np.stack(np.meshgrid(*[np.arange(k) for k in N[::-1]], indexing="ij"), -1)
+    return (idx.reshape(-1, 3)[:, ::-1] + 0.5) * h
+
+
+def test_read_ascii_and_binary_mesh(tmp_path):
+    write_hex_mesh(tmp_path / "a", N, SIZE)
+    write_hex_mesh(tmp_path / "b", N, SIZE, fmt="binary")
+    a, b = read_polymesh(tmp_path / "a"), read_polymesh(tmp_path / "b")
+    assert a.n_cells == 12 and a.n_faces == 20 + 32
+    for name in ("points", "face_offsets", "face_points", "owner", "neighbour"):
+        np.testing.assert_array_equal(getattr(a, name), getattr(b, name))
+    assert a.boundary["walls"]["type"] == "wall"
+
+
+def test_hex_cell_geometry(tmp_path):
+    write_hex_mesh(tmp_path, N, SIZE)
+    mesh = read_polymesh(tmp_path)
+    cf, sf = face_centres_areas(mesh)
+    # area vectors point out of the owner cell: every cell is closed
+    nif = len(mesh.neighbour)
+    for k in range(3):
+        closed = np.bincount(mesh.owner, sf[:, k], 12) - np.bincount(mesh.neighbour, sf[:nif, k], 12)
+        np.testing.assert_allclose(closed, 0.0, atol=1e-12)
+    cc, vol = cell_centres_volumes(mesh, cf, sf)
+    np.testing.assert_allclose(vol, np.prod(SIZE) / 12)
+    np.testing.assert_allclose(cc, _expected_centres(), atol=1e-12)
+
+
+def test_warped_mesh_keeps_domain_volume(tmp_path):
+    write_hex_mesh(tmp_path, (4, 4, 4), SIZE, perturb=0.2, seed=1)
+    _, vol = cell_centres_volumes(read_polymesh(tmp_path))
+    assert np.all(vol > 0)
+    np.testing.assert_allclose(vol.sum(), np.prod(SIZE), rtol=1e-12)
+
+
+def test_mixed_face_sizes_and_loop_fallback(tmp_path):
+    write_hex_mesh(tmp_path, N, SIZE)
+    fp = tmp_path / "faces"
+
+    # mixed face sizes: the first face as a triangle, the last as a pentagon
+    head, _, body = fp.read_bytes().partition(b"\n(\n")
+    lines = body.split(b"\n")
+    lines[0] = b"3(0 1 2)"
+    lines[-3] = b"5(1 2 3 4 5)"
+    fp.write_bytes(head + b"\n(\n" + b"\n".join(lines))
+    offsets, points = polymesh._read_faces(fp)
+    sizes = np.diff(offsets)
+    assert sizes[0] == 3 and sizes[-1] == 5 and np.all(sizes[1:-1] == 4)
+    assert points[:3].tolist() == [0, 1, 2] and points[-5:].tolist() == [1, 2, 3, 4, 5]
+
+    # the per-face loop kept as a fallback finds the same face heads
+    flat = np.insert(points, offsets[:-1], sizes)
+    sizes_loop, heads_loop = polymesh._walk_face_sizes(flat, len(sizes))
+    np.testing.assert_array_equal(sizes_loop, sizes)
+    np.testing.assert_array_equal(heads_loop, offsets[:-1] + np.arange(len(sizes)))
+
+
+def test_cell_geometry_cache_is_invalidated(tmp_path):
+    write_hex_mesh(tmp_path, N, SIZE)
+    first = load_cell_geometry(tmp_path)
+    assert (tmp_path / "carbonfly_geometry.npz").is_file()
+    np.testing.assert_array_equal(load_cell_geometry(tmp_path)["volumes"], first["volumes"])
+
+    write_hex_mesh(tmp_path, N, (4.0, 1.0, 1.5))
+    np.testing.assert_allclose(load_cell_geometry(tmp_path)["volumes"].sum(), 6.0)
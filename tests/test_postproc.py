@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from carbonfly.postproc import (
+    _load_columns,
+    collect_internal_probes_results,
+    collect_internal_probes_series,
+)
+
+_HEADER = "# distance x y z CO2 U_x U_y U_z\n"
+
+
+def _row(i):
+    return " ".join(f"{v:g}" for v in (0.1 * i, i, 0.5, 1.2, 400 + i, 0.01 * i, 0, -0.02))
+
+
+def _write_probes(case_root, body, time_dir="100"):
+    d = case_root / "postProcessing" / "internalProbes" / time_dir
+    d.mkdir(parents=True)
+    (d / "points.xy").write_text(_HEADER + body)
+
+
+def _compare(case_root):
+    ref = collect_internal_probes_results(case_root)["data"]
+    vec = collect_internal_probes_results(case_root, vectorized=True)["data"]
+    assert vec["columns"] == ref["columns"]
+    np.testing.assert_array_equal(vec["points"], ref["points"])
+    np.testing.assert_array_equal(vec["scalars"]["CO2"], ref["scalars"]["CO2"])
+    np.testing.assert_array_equal(vec["vectors"]["U"], ref["vectors"]["U"])
+    assert list(vec["raw_rows"]) == ref["raw_rows"]
+    return vec
+
+
+def test_vectorized_reader_matches_row_reader(tmp_path):
+    _write_probes(tmp_path, "\n".join(_row(i) for i in range(50)) + "\n\n")
+    vec = _compare(tmp_path)
+    assert vec["array"].shape == (50, 8)
+    # columns are views into one array, not copies
+    assert np.shares_memory(vec["scalars"]["CO2"], vec["array"])
+
+
+def test_misaligned_lines_are_skipped_not_shifted(tmp_path):
+    rows = [_row(i) for i in range(6)]
+    # one short and one long line: the total value count still equals rows * columns
+    rows[2] = " ".join(rows[2].split()[:5])
+    rows[4] = rows[4] + " 1 2 3"
+    _write_probes(tmp_path, "\n".join(rows))
+    vec = _compare(tmp_path)
+    assert vec["scalars"]["CO2"].tolist() == [400, 401, 403, 405]
+
+
+def test_unparsable_values_fall_back_to_row_parser(tmp_path):
+    lines = (_row(0), "probe lost", _row(1), _row(2))
+    fp = tmp_path / "points.xy"
+    fp.write_text(_HEADER + "\n".join(lines))
+    columns, data = _load_columns(fp)
+    assert data[:, columns.index("CO2")].tolist() == [400, 401, 402]
+
+    fp.write_text(_HEADER + _row(0).replace("400", "N/A"))
+    with pytest.raises(ValueError):
+        _load_columns(fp)
+
+
+def test_series_stacks_time_directories(tmp_path):
+    for t in ("0", "10", "20", "30", "latestBackup"):
+        _write_probes(tmp_path, "\n".join(_row(i) for i in range(4)), time_dir=t)
+    (tmp_path / "postProcessing/internalProbes/latestBackup/points.xy").write_text(_HEADER)
+
+    serial = collect_internal_probes_series(tmp_path, time_range=(10, None))
+    threaded = collect_internal_probes_series(tmp_path, time_range=(10, None), workers=3)
+    assert serial["time_dirs"] == ["10", "20", "30"]
+    assert serial["array"].shape == (3, 4, 8)
+    np.testing.assert_array_equal(serial["array"], threaded["array"])
+    assert serial["vectors"]["U"].shape == (3, 4, 3)
+    assert np.shares_memory(serial["scalars"]["CO2"], serial["array"])
+    assert collect_internal_probes_series(tmp_path, stride=2)["time_dirs"] == ["0", "20"]
+
+
+def test_series_rejects_mismatched_point_counts(tmp_path):
+    _write_probes(tmp_path, "\n".join(_row(i) for i in range(4)), time_dir="0")
+    _write_probes(tmp_path, "\n".join(_row(i) for i in range(3)), time_dir="10")
+    with pytest.raises(ValueError):
+        collect_internal_probes_series(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        collect_internal_probes_series(tmp_path, time_range=(100, None))
@@ -0,0 +1,44 @@
+import shutil
+from dataclasses import dataclass
+
+import pytest
+
+from carbonfly.runner import FoamRunner, NativeRunner, WSLRunner, get_runner
+from carbonfly.wsl import win_to_wsl_path
+
+
+def test_foam_runner_requires_argv():
+    with pytest.raises(TypeError):
+        FoamRunner()
+
+    @dataclass
+    class Incomplete(FoamRunner):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_wsl_runner_argv_uses_wsl_paths():
+    case_root = r"C:\cases\demo"
+    argv = WSLRunner(distro="Ubuntu-22.04").argv("blockMesh", case_root)
+    assert argv[:5] == ["wsl.exe", "-d", "Ubuntu-22.04", "--", "bash"]
+    assert argv[-1].startswith("source /opt/openfoam10/etc/bashrc")
+    assert argv[-1].endswith(f"cd {win_to_wsl_path(case_root)} && blockMesh")
+    assert win_to_wsl_path(case_root).startswith("/mnt/c/")
+
+
+def test_get_runner_backends():
+    assert isinstance(get_runner("native", bash="sh"), NativeRunner)
+    assert isinstance(get_runner("WSL"), WSLRunner)
+    with pytest.raises(ValueError):
+        get_runner("docker")
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+def test_native_runner_logs_and_returns_exit_code(tmp_path):
+    runner = NativeRunner(foam_bashrc=None)
+    rc = runner.run("echo hello && exit 3", tmp_path, log_rel="system/run.log")
+    assert rc == 3
+    # login shells may print profile noise before the command output
+    assert (tmp_path / "system" / "run.log").read_text().splitlines()[-1] == "hello"
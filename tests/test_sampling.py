@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from carbonfly.sampling import CellIndex, cell_index, sample_internal_probes
+from conftest import write_hex_mesh, write_scalar_field
+
+
+def _brute_force(centres, pts, k):
+    d = np.linalg.norm(pts[:, None, :] - centres[None, :, :], axis=2)
+    idx = np.argsort(d, axis=1, kind="stable")[:, :k]
+    return np.take_along_axis(d, idx, axis=1), idx
+
+
+@pytest.mark.parametrize("k", [1, 5])
+@pytest.mark.parametrize("flat", [False, True])
+def test_grid_index_matches_brute_force(k, flat):
+    rng = np.random.default_rng(3)
+    centres = rng.uniform(0, [4.0, 2.0, 3.0], (500, 3))
+    if flat:
+        centres[:, 2] = 0.5  # 2-D mesh: one cell layer
+    pts = rng.uniform(-0.5, [4.5, 2.5, 3.5], (200, 3))
+    d, i = CellIndex(centres, backend="grid").query(pts, k=k)
+    d_ref, i_ref = _brute_force(centres, pts, k)
+    np.testing.assert_allclose(d, d_ref)
+    np.testing.assert_array_equal(np.sort(i, axis=1), np.sort(i_ref, axis=1))
+
+
+def test_grid_index_max_distance():
+    centres = np.array([[0.0, 0, 0], [1.0, 0, 0], [5.0, 0, 0]])
+    d, i = CellIndex(centres, backend="grid").query([[0.2, 0, 0]], k=3, max_distance=1.0)
+    np.testing.assert_allclose(d[0, :2], [0.2, 0.8])
+    assert d[0, 2] == np.inf and i[0].tolist() == [0, 1, 3]
+    with pytest.raises(ValueError):
+        CellIndex(centres, backend="octree")
+
+
+def test_grid_index_orders_close_centres_next_to_far_ones():
+    # one grid bin holds all centres, so the squared distances of a query span 1e-6..1e12
+    centres = np.array([[1e-3, 0, 0], [3e-3, 0, 0], [2e-3, 0, 0], [1e6, 0, 0]])
+    pts = np.zeros((300, 3))
+    d, i = CellIndex(centres, backend="grid", cells_per_bin=100.0).query(pts, k=3)
+    np.testing.assert_allclose(d, np.tile([1e-3, 2e-3, 3e-3], (300, 1)))
+    assert (i == [0, 2, 1]).all()
+
+
+def test_sample_internal_probes_at_cell_centres(tmp_path):
+    write_hex_mesh(tmp_path / "constant" / "polyMesh", (4, 3, 2), (4.0, 3.0, 2.0))
+    (tmp_path / "0").mkdir()
+    write_scalar_field(tmp_path / "0" / "CO2", "CO2", [400.0 + i for i in range(24)])
+    # cell i sits at (i % 4 + 0.5, i // 4 % 3 + 0.5, i // 12 + 0.5)
+    pts = [(1.5, 0.5, 0.5), (0.5, 2.5, 1.5), (50.0, 0.0, 0.0)]
+
+    near = sample_internal_probes(tmp_path, pts, ["CO2"], backend="grid", max_distance=1.0)
+    co2 = near["data"]["scalars"]["CO2"]
+    assert co2[:2].tolist() == [401.0, 420.0] and np.isnan(co2[2])
+    assert near["time_dir"] == "0"
+
+    idw = sample_internal_probes(tmp_path, pts[:2], ["CO2"], method="idw", backend="grid")
+    np.testing.assert_allclose(idw["data"]["scalars"]["CO2"], [401.0, 420.0])
+    # the index is reused while the mesh is unchanged
+    assert cell_index(tmp_path, "grid") is cell_index(tmp_path, "grid")
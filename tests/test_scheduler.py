@@ -0,0 +1,65 @@
+import json
+import logging
+from dataclasses import dataclass
+
+from carbonfly.postproc import read_final_residuals
+from carbonfly.runner import FoamRunner
+from carbonfly.scheduler import CaseJob, CaseScheduler
+from conftest import shell_runner
+
+_RESIDUALS = """# Residuals
+# Time          p_rgh           CO2
+1               1e-2            N/A
+2               1e-3            1e-4
+"""
+
+
+def _write_residuals(case_root, time_dir, text=_RESIDUALS):
+    d = case_root / "postProcessing" / "residuals" / time_dir
+    d.mkdir(parents=True)
+    (d / "residuals.dat").write_text(text)
+
+
+def test_read_final_residuals_ignores_non_numeric_dirs(tmp_path):
+    _write_residuals(tmp_path, "0")
+    _write_residuals(tmp_path, "10", _RESIDUALS.replace("1e-4", "5e-5"))
+    _write_residuals(tmp_path, "backup", _RESIDUALS.replace("1e-4", "9"))
+    assert read_final_residuals(tmp_path) == {"Time": 2.0, "p_rgh": 1e-3, "CO2": 5e-5}
+
+
+def test_scheduler_runs_all_cases_and_resumes(tmp_path):
+    cases = [tmp_path / f"case{i}" for i in range(3)]
+    for c in cases:
+        c.mkdir()
+    state = tmp_path / "sweep.json"
+    sched = CaseScheduler(
+        cases[:2] + [CaseJob(str(cases[2]), command="exit 3")],
+        state,
+        max_cores=2,
+        runner=shell_runner(),
+        command="echo ok",
+    )
+    jobs = sched.run()
+    assert [j.status for j in jobs] == ["done", "done", "failed"]
+    assert (cases[0] / "echo.run.log").read_text() == "ok\n"
+    assert json.loads(state.read_text())["jobs"][2]["returncode"] == 3
+
+    resumed = CaseScheduler.resume(state, runner=shell_runner(), retry_failed=True)
+    assert [j.status for j in resumed.jobs] == ["done", "done", "queued"]
+    assert "case2" in resumed.summary()
+
+
+@dataclass
+class _BrokenRunner(FoamRunner):
+    def argv(self, command, case_root):
+        raise FileNotFoundError("wsl.exe")
+
+
+def test_runner_exception_is_recorded_and_logged(tmp_path, caplog):
+    sched = CaseScheduler([tmp_path], tmp_path / "sweep.json", runner=_BrokenRunner())
+    with caplog.at_level(logging.ERROR, logger="carbonfly.scheduler"):
+        (job,) = sched.run()
+    assert job.status == "failed" and job.returncode == -1
+    assert "FileNotFoundError: wsl.exe" in job.error
+    assert "FileNotFoundError" in caplog.text
+    assert "FileNotFoundError" in json.loads((tmp_path / "sweep.json").read_text())["jobs"][0]["error"]
@@ -0,0 +1,40 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from carbonfly.pythermalcomfort.models import two_nodes_gagge, two_nodes_gagge_array
+
+_CONDITIONS = list(
+    itertools.product(
+        (16.0, 25.0, 34.0),  # tdb
+        (0.1, 0.8),  # v
+        (30.0, 70.0),  # rh
+        (0.8, 1.2, 3.0),  # met (0.8: no free convection term)
+        (0.0, 0.5, 1.0),  # clo (0: unclothed branch)
+    )
+)
+
+
+@pytest.mark.parametrize("calculate_ce", [False, True])
+def test_array_matches_scalar_model(calculate_ce):
+    tdb, v, rh, met, clo = (np.array(c) for c in zip(*_CONDITIONS))
+    position = np.where(np.arange(len(tdb)) % 2 == 0, "sitting", "standing")
+    tr = tdb + 1.5
+    res = two_nodes_gagge_array(
+        tdb, tr, v, rh, met, clo, position=position, calculate_ce=calculate_ce
+    )
+    for i in range(len(tdb)):
+        ref = two_nodes_gagge(
+            tdb[i], tr[i], v[i], rh[i], met[i], clo[i],
+            position=str(position[i]), calculate_ce=calculate_ce,
+        )
+        for key, value in ref.items():
+            assert res[key][i] == pytest.approx(value, abs=0.011), (key, _CONDITIONS[i])
+
+
+def test_array_broadcasts_scalars_and_keeps_shape():
+    res = two_nodes_gagge_array(np.full((2, 3), 24.0), 24.0, 0.1, 50.0, 1.1, 0.6)
+    assert res["set"].shape == (2, 3)
+    ref = two_nodes_gagge(24.0, 24.0, 0.1, 50.0, 1.1, 0.6)
+    np.testing.assert_allclose(res["set"], ref["set"])